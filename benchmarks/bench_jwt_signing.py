@@ -0,0 +1,60 @@
+"""
+Compares signing application JWTs with the client's JwtClient, with a KeySigner (the private key is parsed
+once) and with a ProcessPoolSigner on 1, 2, 4 and 8 worker processes.
+
+Each token is signed with a new `jti`, as the JWT cache would otherwise reuse tokens.
+
+Run with: python benchmarks/bench_jwt_signing.py
+"""
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from vonage_jwt.jwt import JwtClient
+
+import vonage
+
+APPLICATION_ID = 'nexmo-application-id'
+PRIVATE_KEY_PATH = os.path.join(os.path.dirname(__file__), '..', 'tests', 'data', 'private_key.txt')
+
+
+def bench(name, sign_tokens, count):
+    """Prints and returns the number of tokens signed per second."""
+    start = time.perf_counter()
+    sign_tokens(count)
+    tokens_per_second = count / (time.perf_counter() - start)
+    print(f'{name:<45} {tokens_per_second:10.0f} tokens/s')
+    return tokens_per_second
+
+
+def sign_in_threads(sign, count, threads=8):
+    with ThreadPoolExecutor(threads) as executor:
+        list(executor.map(lambda i: sign({'jti': str(i)}), range(count)))
+
+
+def main(count=2000):
+    with open(PRIVATE_KEY_PATH) as key_file:
+        private_key = key_file.read()
+
+    print(f'{os.cpu_count()} CPUs, {count} tokens per run')
+    jwt_client = JwtClient(APPLICATION_ID, private_key)
+    # JwtClient parses the private key for every token, so it is timed with fewer tokens
+    baseline = bench(
+        'JwtClient (8 threads)', lambda n: sign_in_threads(jwt_client.generate_application_jwt, n), count // 20
+    )
+    key_signer = vonage.KeySigner(APPLICATION_ID, private_key)
+    bench('KeySigner (8 threads)', lambda n: sign_in_threads(key_signer.sign, n), count)
+
+    for workers in (1, 2, 4, 8):
+        with vonage.ProcessPoolSigner(APPLICATION_ID, private_key, max_workers=workers) as signer:
+            signer.sign_many([{} for _ in range(workers)])  # start the workers
+            current = bench(
+                f'ProcessPoolSigner ({workers} workers)',
+                lambda n: signer.sign_many([{'jti': str(i)} for i in range(n)]),
+                count,
+            )
+        print(f'  speedup: {current / baseline:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
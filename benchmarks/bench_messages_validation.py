@@ -0,0 +1,129 @@
+"""
+Compares validating Messages API messages with the precompiled per-(channel, message type) validators
+against the checks that `Messages.validate_send_message_input` ran before, over a corpus of mixed messages,
+and `Messages.validate_many` against validating each message in a loop and collecting the errors.
+
+Run with: python benchmarks/bench_messages_validation.py
+"""
+import re
+import time
+
+import vonage
+from vonage.errors import MessagesError
+from vonage.messages import Messages
+
+TEMPLATES = [
+    {'channel': 'sms', 'message_type': 'text', 'from': 'vonage', 'text': 'Hello!'},
+    {'channel': 'sms', 'message_type': 'text', 'from': 'vonage', 'text': 'Hello!', 'client_ref': 'campaign-1'},
+    {'channel': 'mms', 'message_type': 'image', 'from': '447700900000', 'image': {'url': 'https://example.com/a.jpg'}},
+    {'channel': 'whatsapp', 'message_type': 'text', 'from': '447700900000', 'text': 'Hello!'},
+    {
+        'channel': 'whatsapp',
+        'message_type': 'template',
+        'from': '447700900000',
+        'template': {'name': 'verify', 'parameters': ['1234']},
+        'whatsapp': {'policy': 'deterministic', 'locale': 'en-GB'},
+    },
+    {'channel': 'whatsapp', 'message_type': 'sticker', 'from': '447700900000', 'sticker': {'id': 'abc'}},
+    {
+        'channel': 'viber_service',
+        'message_type': 'text',
+        'from': 'vonage',
+        'text': 'Hello!',
+        'viber_service': {'category': 'transaction'},
+    },
+]
+
+
+def make_corpus(count):
+    corpus = []
+    for i in range(count):
+        params = dict(TEMPLATES[i % len(TEMPLATES)], to=f'44770090{i % 10000:04d}')
+        corpus.append(params)
+    # Messenger recipients are IDs rather than numbers
+    corpus[::50] = [
+        {'channel': 'messenger', 'message_type': 'text', 'from': '1234', 'to': str(i), 'text': 'Hi'}
+        for i in range(len(corpus[::50]))
+    ]
+    return corpus
+
+
+def previous_validate(params):
+    """The checks `validate_send_message_input` ran for each message before the validators were compiled."""
+    if type(params) is not dict:
+        raise MessagesError('Parameters to the send_message method must be specified as a dictionary.')
+    if params['channel'] not in Messages.valid_message_channels:
+        raise MessagesError(f'"{params["channel"]}" is an invalid message channel.')
+    if params['message_type'] not in Messages.valid_message_types[params['channel']]:
+        raise MessagesError(f'"{params["message_type"]}" is not a valid message type.')
+    if not isinstance(params['to'], str):
+        raise MessagesError(f'Message recipient ("to={params["to"]}") not in a valid format.')
+    elif params['channel'] != 'messenger' and not re.search(r'^[1-9]\d{6,14}$', params['to']):
+        raise MessagesError(f'Message recipient number ("to={params["to"]}") not in a valid format.')
+    elif params['channel'] == 'messenger' and not 0 < len(params['to']) < 50:
+        raise MessagesError(f'Message recipient ID ("to={params["to"]}") not in a valid format.')
+    if not isinstance(params['from'], str) or params['from'] == "":
+        raise MessagesError(f'Message sender ("frm={params["from"]}") set incorrectly.')
+    if (
+        (params['channel'] == 'whatsapp' and params['message_type'] == 'template' and 'whatsapp' not in params)
+        or (params['channel'] == 'whatsapp' and params['message_type'] == 'sticker' and 'sticker' not in params)
+        or (params['channel'] == 'viber_service' and 'viber_service' not in params)
+    ):
+        raise MessagesError(f'You must specify all required properties for message channel "{params["channel"]}".')
+    elif params['channel'] == 'whatsapp' and params['message_type'] == 'sticker':
+        sticker = params['sticker']
+        if ('id' not in sticker and 'url' not in sticker) or ('id' in sticker and 'url' in sticker):
+            raise MessagesError('Must specify one, and only one, of "id" or "url" in the "sticker" field.')
+    if 'client_ref' in params and len(params['client_ref']) > 100:
+        raise MessagesError('client_ref can be a maximum of 100 characters.')
+
+
+def bench(name, validate_corpus, corpus):
+    """Prints and returns the best time per message, in seconds."""
+    best = float('inf')
+    for _ in range(3):
+        start = time.perf_counter()
+        validate_corpus(corpus)
+        best = min(best, time.perf_counter() - start)
+    seconds = best / len(corpus)
+    print(f'{name:<50} {seconds * 1e9:8.0f} ns/message')
+    return seconds
+
+
+def main(count=1_000_000):
+    client = vonage.Client(key='my_api_key', secret='my_api_secret')
+    messages = client.messages
+    corpus = make_corpus(count)
+    assert not any(messages.validate_many(corpus))
+
+    print(f'{count} messages')
+
+    def validate_each_previous(corpus):
+        for params in corpus:
+            previous_validate(params)
+
+    def validate_each(corpus):
+        for params in corpus:
+            messages.validate_send_message_input(params)
+
+    def collect_errors(corpus):
+        """What validate_many replaces: validating each message and collecting the errors."""
+        results = []
+        for params in corpus:
+            try:
+                messages.validate_send_message_input(params)
+                results.append(None)
+            except MessagesError as err:
+                results.append(err)
+        return results
+
+    baseline = bench('previous checks', validate_each_previous, corpus)
+    single = bench('validate_send_message_input', validate_each, corpus)
+    print(f'  speedup: {baseline / single:.2f}x')
+    looped = bench('validate_send_message_input, collecting errors', collect_errors, corpus)
+    batched = bench('validate_many', messages.validate_many, corpus)
+    print(f'  speedup: {looped / batched:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
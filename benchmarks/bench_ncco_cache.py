@@ -0,0 +1,64 @@
+"""
+Compares returning a cached IVR menu NCCO from an NccoCache against creating and validating the
+actions and building the NCCO with `Ncco.build_ncco_json` for every call.
+
+Run with: python benchmarks/bench_ncco_cache.py
+"""
+import time
+
+from vonage import Ncco, NccoCache
+
+
+def build_menu_actions():
+    return [
+        Ncco.Talk(text='Press 1 for sales or 2 for support.', bargeIn=True, language='en-GB'),
+        Ncco.Input(
+            type=['dtmf', 'speech'],
+            dtmf={'maxDigits': 1, 'timeOut': 5},
+            speech={'language': 'en-GB', 'context': ['sales', 'support']},
+            eventUrl='https://example.com/menu',
+        ),
+    ]
+
+
+def bench(name, build, number):
+    """Prints and returns the number of NCCOs returned per second."""
+    best = float('inf')
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(number):
+            build()
+        best = min(best, time.perf_counter() - start)
+    nccos_per_second = number / best
+    print(f'{name:<45} {nccos_per_second:10.0f} nccos/s')
+    return nccos_per_second
+
+
+def main(number=5000):
+    cache = NccoCache()
+    assert cache.get_or_build('menu', build_menu_actions) == Ncco.build_ncco_json(
+        actions=build_menu_actions()
+    )
+
+    actions = build_menu_actions()
+    baseline = bench(
+        'build actions + build_ncco_json',
+        lambda: Ncco.build_ncco_json(actions=build_menu_actions()),
+        number,
+    )
+    bench(
+        'build_ncco_json (actions already built)',
+        lambda: Ncco.build_ncco_json(actions=actions),
+        number,
+    )
+    current = bench(
+        'NccoCache.get_or_build (hit)',
+        lambda: cache.get_or_build('menu', build_menu_actions),
+        number,
+    )
+    print(f'  speedup: {current / baseline:.2f}x')
+    assert cache.stats['misses'] == 1
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+"""
+Compares rendering an IVR answer NCCO from a compiled NccoTemplate against building and validating
+the actions for every call (or creating them with `construct_fast`, without validation), and encoding
+them as JSON with `json.dumps` or `Ncco.build_ncco_json`.
+
+Run with: python benchmarks/bench_ncco_template.py
+"""
+import json
+import time
+
+from vonage import Ncco
+
+
+def build_answer_ncco(caller_name, conversation_name, event_url, build=Ncco.build_ncco):
+    return build(
+        Ncco.Talk(text=f'Hello {caller_name}, thanks for calling.', bargeIn=True, language='en-GB'),
+        Ncco.Input(
+            type=['dtmf', 'speech'],
+            dtmf={'maxDigits': 1, 'timeOut': 5},
+            speech={'language': 'en-GB', 'context': ['sales', 'support']},
+            eventUrl=event_url,
+        ),
+        Ncco.Connect(
+            endpoint={'type': 'phone', 'number': '447700900000'},
+            from_='447700900001',
+            eventUrl=event_url,
+        ),
+        Ncco.Conversation(name=conversation_name, startOnEnter=True, record=True),
+    )
+
+
+def build_answer_ncco_fast(caller_name, conversation_name, event_url):
+    return Ncco.build_ncco_json(
+        Ncco.Talk.construct_fast(
+            text=f'Hello {caller_name}, thanks for calling.', bargeIn=True, language='en-GB'
+        ),
+        Ncco.Input.construct_fast(
+            type=['dtmf', 'speech'],
+            dtmf={'maxDigits': 1, 'timeOut': 5},
+            speech={'language': 'en-GB', 'context': ['sales', 'support']},
+            eventUrl=event_url,
+        ),
+        Ncco.Connect.construct_fast(
+            endpoint={'type': 'phone', 'number': '447700900000'},
+            from_='447700900001',
+            eventUrl=event_url,
+        ),
+        Ncco.Conversation.construct_fast(name=conversation_name, startOnEnter=True, record=True),
+    )
+
+
+def compile_answer_template():
+    return Ncco.compile_template(
+        Ncco.Talk(
+            text=f'Hello {Ncco.Placeholder("caller_name")}, thanks for calling.',
+            bargeIn=True,
+            language='en-GB',
+        ),
+        Ncco.Input(
+            type=['dtmf', 'speech'],
+            dtmf={'maxDigits': 1, 'timeOut': 5},
+            speech={'language': 'en-GB', 'context': ['sales', 'support']},
+            eventUrl=Ncco.Placeholder('event_url'),
+        ),
+        Ncco.Connect(
+            endpoint={'type': 'phone', 'number': '447700900000'},
+            from_='447700900001',
+            eventUrl=Ncco.Placeholder('event_url'),
+        ),
+        Ncco.Conversation(name=Ncco.Placeholder('conversation_name'), startOnEnter=True, record=True),
+    )
+
+
+def bench(name, render, number):
+    """Prints and returns the number of NCCOs rendered per second."""
+    best = float('inf')
+    for _ in range(5):
+        start = time.perf_counter()
+        for i in range(number):
+            render(i)
+        best = min(best, time.perf_counter() - start)
+    renders_per_second = number / best
+    print(f'{name:<45} {renders_per_second:10.0f} renders/s')
+    return renders_per_second
+
+
+def main(number=5000):
+    template = compile_answer_template()
+    values = {'caller_name': 'Alice', 'conversation_name': 'call-0', 'event_url': 'https://example.com/events'}
+    assert json.loads(template.render(**values)) == build_answer_ncco(**values)
+    assert json.loads(build_answer_ncco_fast(**values)) == build_answer_ncco(**values)
+
+    baseline = bench(
+        'build_ncco + json.dumps',
+        lambda i: json.dumps(build_answer_ncco('Alice', f'call-{i}', 'https://example.com/events')),
+        number,
+    )
+    bench(
+        'build_ncco_json',
+        lambda i: build_answer_ncco(
+            'Alice', f'call-{i}', 'https://example.com/events', build=Ncco.build_ncco_json
+        ),
+        number,
+    )
+    bench(
+        'construct_fast + build_ncco_json',
+        lambda i: build_answer_ncco_fast('Alice', f'call-{i}', 'https://example.com/events'),
+        number,
+    )
+    current = bench(
+        'NccoTemplate.render',
+        lambda i: template.render(
+            caller_name='Alice', conversation_name=f'call-{i}', event_url='https://example.com/events'
+        ),
+        number,
+    )
+    print(f'  speedup: {current / baseline:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
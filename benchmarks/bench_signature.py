@@ -0,0 +1,71 @@
+"""
+Compares signing and checking webhook signatures with the client's precomputed HMAC state against
+preparing a new HMAC for every signature, as the client did before.
+
+Run with: python benchmarks/bench_signature.py
+"""
+import hashlib
+import hmac
+import timeit
+
+import vonage
+
+SIGNATURE_SECRET = 'my_signature_secret'
+
+# A typical inbound SMS webhook
+PARAMS = {
+    'msisdn': '447700900001',
+    'to': '447700900000',
+    'messageId': '0A0000000123ABCD1',
+    'text': 'Hello world & welcome = yes',
+    'type': 'text',
+    'keyword': 'HELLO',
+    'api-key': 'abcd1234',
+    'message-timestamp': '2020-01-01 12:00:00',
+    'timestamp': '1578830400',
+    'nonce': 'aaaaaaaa-bbbb-cccc-dddd-0123456789ab',
+}
+
+
+def per_call_hmac_signature(params, signature_method):
+    hasher = hmac.new(SIGNATURE_SECRET.encode(), digestmod=signature_method)
+    for key in sorted(params):
+        value = params[key]
+        if isinstance(value, str):
+            value = value.replace('&', '_').replace('=', '_')
+        hasher.update(f'&{key}={value}'.encode('utf-8'))
+    return hasher.hexdigest()
+
+
+def per_call_hmac_check_signature(params, signature_method):
+    params = dict(params)
+    signature = params.pop('sig', '').lower()
+    return hmac.compare_digest(signature, per_call_hmac_signature(params, signature_method))
+
+
+def bench(name, func, number):
+    """Prints and returns the best time per signature, in seconds."""
+    seconds = min(timeit.repeat(func, number=number, repeat=5)) / number
+    print(f'{name:<45} {seconds * 1e6:8.2f} µs/signature')
+    return seconds
+
+
+def main(number=20000):
+    for method in ('sha256', 'sha512'):
+        client = vonage.Client(signature_secret=SIGNATURE_SECRET, signature_method=method)
+        digestmod = getattr(hashlib, method)
+        signed = dict(PARAMS, sig=client.signature(dict(PARAMS)))
+        assert per_call_hmac_check_signature(signed, digestmod)
+
+        print(f'HMAC-{method.upper()}')
+        baseline = bench(
+            '  check_signature (new HMAC per call)',
+            lambda: per_call_hmac_check_signature(signed, digestmod),
+            number,
+        )
+        current = bench('  check_signature', lambda: client.check_signature(signed), number)
+        print(f'  speedup: {baseline / current:.2f}x\n')
+
+
+if __name__ == '__main__':
+    main()
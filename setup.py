@@ -27,6 +27,11 @@ setup(
         "Deprecated",
         "pydantic>=1.10,==1.*",
     ],
+    extras_require={
+        "async": ["httpx>=0.23"],
+        "http2": ["httpx[http2]>=0.23"],
+        "orjson": ["orjson>=3.0"],
+    },
     python_requires=">=3.8",
     tests_require=["cryptography>=2.3.1"],
     classifiers=[
@@ -1,4 +1,14 @@
 from .client import *
+from .async_client import AsyncClient
+from .cache import InsightCache, SqliteCacheBackend, RedisCacheBackend
+from .jwt_verifier import JwtVerifier
+from .pricing import PricingIndex, Price
+from .rate_limiter import RateLimiter, MemoryBackend, FileBackend
+from .retry import RetryPolicy
+from .signing import KeySigner, ProcessPoolSigner
+from .transport import RequestsTransport, Http2Transport
+from .video import ClientTokenPool
 from .ncco_builder.ncco import *
+from .ncco_builder.ncco_cache import NccoCache
 
 __version__ = "3.12.0"
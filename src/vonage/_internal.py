@@ -4,6 +4,11 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from vonage import Client
 
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from urllib.parse import parse_qs, urlparse
+
+import asyncio
+
 
 def _format_date_param(params, key, format="%Y-%m-%d %H:%M:%S"):
     """
@@ -25,7 +30,168 @@ def set_auth_type(client: Client) -> str:
     """Sets the authentication type used. If a JWT Client has been created,
     it will create a JWT and use JWT authentication."""
 
-    if hasattr(client, '_jwt_client'):
+    if hasattr(client, '_jwt_client') or getattr(client, 'jwt_signer', None) is not None:
         return 'jwt'
     else:
         return 'header'
+
+
+def match_route(routes: dict, uri: str, default=None):
+    """
+    Returns the value in `routes` whose key is the longest prefix of `uri`, or `default` if none match.
+
+    Keys that start with "/" are matched against the URI's path, e.g. "/sms". Other keys are matched
+    against the host and path, e.g. "rest.nexmo.com/sms" or "api.nexmo.com".
+    """
+    if not routes:
+        return default
+    parsed_uri = urlparse(uri)
+    path = parsed_uri.path
+    host_and_path = f'{parsed_uri.netloc}{path}'
+
+    best_match_length = -1
+    value = default
+    for route, route_value in routes.items():
+        target = path if route.startswith('/') else host_and_path
+        if target.startswith(route) and len(route) > best_match_length:
+            best_match_length = len(route)
+            value = route_value
+    return value
+
+
+def iterate_pages(fetch_page, get_items, get_next_state, state=None, prefetch: bool = False):
+    """
+    Yields the items from each page of a paginated API, fetching pages only as they are needed.
+    The sub-APIs' `iter_*` methods are built on this, and pass their `prefetch` argument through.
+
+    :param fetch_page: Called with the `state` of a page (e.g. a page number or cursor) and returns the page.
+    :param get_items: Returns the list of items in a page.
+    :param get_next_state: Called with a page, its items and its state. Returns the state of the next page,
+        or `None` if this is the last page.
+    :param state: The state of the first page.
+    :param bool prefetch: Fetch the next page in a background thread while the current page's items
+        are consumed. If the caller stops early, at most one extra page is fetched.
+    """
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    try:
+        page = fetch_page(state)
+        while True:
+            items = get_items(page)
+            next_state = get_next_state(page, items, state) if items else None
+            if next_state is None:
+                yield from items
+                return
+
+            if prefetch:
+                next_page = executor.submit(fetch_page, next_state)
+            yield from items
+            page = next_page.result() if prefetch else fetch_page(next_state)
+            state = next_state
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+async def iterate_pages_async(
+    fetch_page, get_items, get_next_state, state=None, prefetch: bool = False
+):
+    """
+    The asyncio version of `iterate_pages`. `fetch_page` must return an awaitable, and a prefetched
+    page is fetched in a task on the running event loop.
+    """
+    next_page = None
+    try:
+        page = await fetch_page(state)
+        while True:
+            items = get_items(page)
+            next_state = get_next_state(page, items, state) if items else None
+            if next_state is None:
+                for item in items:
+                    yield item
+                return
+
+            if prefetch:
+                next_page = asyncio.ensure_future(fetch_page(next_state))
+            for item in items:
+                yield item
+            page = await next_page if prefetch else await fetch_page(next_state)
+            state = next_state
+    finally:
+        if next_page is not None and not next_page.done():
+            next_page.cancel()
+
+
+def get_query_param(href: str, name: str):
+    """Returns the value of the query parameter `name` in a URL, or `None` if it isn't present."""
+    values = parse_qs(urlparse(href).query).get(name)
+    return values[0] if values else None
+
+
+def map_concurrently(func, items, max_workers: int = 10):
+    """
+    Calls `func` on each of `items` from a pool of `max_workers` threads, yielding `(index, result)`
+    tuples in the order the calls complete. If a call raises an exception, the exception is yielded
+    as its result.
+
+    At most `2 * max_workers` items are taken from `items` before their results have been yielded, so
+    `items` can be a lazy iterator of any length. Closing the generator cancels calls that haven't started.
+    """
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    futures = {}
+    try:
+        for index, item in enumerate(items):
+            futures[executor.submit(func, item)] = index
+            if len(futures) >= 2 * max_workers:
+                yield from _pop_completed_futures(futures)
+        while futures:
+            yield from _pop_completed_futures(futures)
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def _pop_completed_futures(futures: dict):
+    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+    for future in done:
+        index = futures.pop(future)
+        try:
+            yield index, future.result()
+        except Exception as err:
+            yield index, err
+
+
+async def map_concurrently_async(func, items, max_concurrency: int = 10):
+    """
+    The asyncio version of `map_concurrently`. `func` must return an awaitable, and at most
+    `max_concurrency` of them are awaited at once.
+    """
+    tasks = {}
+    try:
+        for index, item in enumerate(items):
+            tasks[asyncio.ensure_future(_await_call(func, item))] = index
+            if len(tasks) >= max_concurrency:
+                for result in await _pop_completed_tasks(tasks):
+                    yield result
+        while tasks:
+            for result in await _pop_completed_tasks(tasks):
+                yield result
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def _await_call(func, item):
+    return await func(item)
+
+
+async def _pop_completed_tasks(tasks: dict):
+    done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    results = []
+    for task in done:
+        index = tasks.pop(task)
+        try:
+            results.append((index, task.result()))
+        except Exception as err:
+            results.append((index, err))
+    return results
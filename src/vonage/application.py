@@ -63,7 +63,7 @@ class ApplicationV2:
         Delete the application with `application_id`.
         """
 
-        self._client.delete(
+        return self._client.delete(
             self._client.api_host(),
             f"/v2/applications/{application_id}",
             auth_type=ApplicationV2.auth_type,
@@ -145,7 +145,7 @@ class Application:
         Delete the application with `application_id`.
         """
 
-        self._client.delete(
+        return self._client.delete(
             self._client.api_host(),
             f"/v2/applications/{application_id}",
             auth_type=Application.auth_type,
@@ -169,6 +169,21 @@ class Application:
             auth_type=Application.auth_type,
         )
 
+    def iter_applications(self, page_size=None, prefetch=False):
+        """Yields every application for your account, fetching pages of applications as they are needed."""
+
+        def get_next_page(page, applications, page_number):
+            if page.get('page', page_number) < page.get('total_pages', 0):
+                return page.get('page', page_number) + 1
+
+        return self._client._iterate_pages(
+            lambda page_number: self.list_applications(page_size=page_size, page=page_number),
+            lambda page: page.get('_embedded', {}).get('applications', []),
+            get_next_page,
+            state=1,
+            prefetch=prefetch,
+        )
+
 
 def _filter_none_values(d):
     return {k: v for k, v in d.items() if v is not None}
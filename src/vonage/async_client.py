@@ -0,0 +1,481 @@
+from ._internal import iterate_pages_async, map_concurrently_async
+from .client import Client, logger
+from .errors import MeetingsError, ProactiveConnectError
+from .meetings import Meetings
+from .messages import Messages, _ChannelThrottle, _validate
+from .number_insight import NumberInsight, _unique
+from .proactive_connect import (
+    DOWNLOAD_CHUNK_SIZE,
+    ProactiveConnect,
+    _CsvItemParser,
+    _CsvMultipartEncoder,
+    _get_content_length,
+)
+from .rate_limiter import TokenBucket
+from .sms import Sms, _SendThrottle
+from .transport import _create_httpx_timeout, _prepare_params
+from .verify2 import Verify2
+from .video import Video
+from .voice import RECORDING_CHUNK_SIZE, Voice, _open_recording_file
+
+import asyncio
+from typing import List
+from urllib.parse import urlparse
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+
+class AsyncClient(Client):
+    """
+    Create an AsyncClient object to make calls to Vonage/Nexmo APIs from asyncio code.
+
+    AsyncClient takes the same arguments as :class:`Client` and exposes the same sub-APIs
+    (``client.sms``, ``client.messages``, ``client.voice``, ``client.verify2``, ``client.video`` etc.).
+    Every method that calls a Vonage API returns an awaitable instead of the parsed response.
+    Arguments are validated, and the request's headers are built, when the method is called.
+
+    Requests are sent with `httpx <https://www.python-httpx.org/>`_, which keeps a pool of
+    keep-alive connections per host, so many requests can be in flight on a single event loop.
+    Install it with ``pip install vonage[async]``.
+
+    If the client has a ``jwt_signer`` with a ``sign_async`` method (e.g. a ``ProcessPoolSigner``),
+    JWTs are signed when the request is sent, without blocking the event loop.
+
+    The connection pool can hold up to ``pool_connections * pool_maxsize`` connections. Pass
+    ``http2=True`` to multiplex concurrent requests to a host over one HTTP/2 connection instead
+    (install it with ``pip install vonage[http2]``). AsyncClient doesn't take a ``transport``.
+    Call :meth:`close` (or use the client as an ``async with`` context manager) to release them.
+    """
+
+    def __init__(self, *args, http2: bool = False, **kwargs):
+        if httpx is None:
+            raise ImportError(
+                'The "httpx" package is required to use AsyncClient. Install it with "pip install vonage[async]".'
+            )
+        if kwargs.get('transport') is not None:
+            raise TypeError(
+                'AsyncClient sends requests with httpx and doesn\'t take a "transport". '
+                'Pass "http2=True" to send them over HTTP/2.'
+            )
+        self.http2 = http2
+        super().__init__(*args, **kwargs)
+
+        self.meetings = AsyncMeetings(self)
+        self.messages = AsyncMessages(self)
+        self.number_insight = AsyncNumberInsight(self)
+        self.proactive_connect = AsyncProactiveConnect(self)
+        self.sms = AsyncSms(self)
+        self.verify2 = AsyncVerify2(self)
+        self.video = AsyncVideo(self)
+        self.voice = AsyncVoice(self)
+
+    def _create_session(self, pool_connections, pool_maxsize, max_retries):
+        limits = httpx.Limits(
+            max_connections=pool_connections * pool_maxsize,
+            max_keepalive_connections=pool_connections * pool_maxsize,
+        )
+        self.adapter = httpx.AsyncHTTPTransport(limits=limits, retries=max_retries, http2=self.http2)
+        self.session = httpx.AsyncClient(
+            transport=self.adapter, timeout=_create_httpx_timeout(self.timeout)
+        )
+
+    async def close(self):
+        await self.session.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def _build_auth(self, auth_type, params, allow_params_auth=False):
+        if auth_type == 'jwt' and getattr(self.jwt_signer, 'sign_async', None) is not None:
+            headers = dict(self.headers, Authorization=_PendingJwt(dict(self._jwt_claims)))
+            return headers, params
+        return super()._build_auth(auth_type, params, allow_params_auth)
+
+    async def _create_jwt_auth_string_async(self):
+        """Creates a JWT Authorization header for requests that aren't sent with `_request`, e.g. downloads."""
+        if getattr(self.jwt_signer, 'sign_async', None) is None:
+            return self._create_jwt_auth_string()
+        return b'Bearer ' + await self._generate_application_jwt_async(dict(self._jwt_claims))
+
+    async def _generate_application_jwt_async(self, claims: dict) -> bytes:
+        if self.jwt_cache is not None:
+            return await self.jwt_cache.get_token_async(claims, self.jwt_signer.sign_async)
+        return await self.jwt_signer.sign_async(dict(claims))
+
+    async def _request(self, method, host, uri, params=None, data=None, **kwargs):
+        params = _prepare_params(params)
+        data = _prepare_params(data)
+        headers = kwargs.get('headers')
+        if headers is not None and isinstance(headers.get('Authorization'), _PendingJwt):
+            token = await self._generate_application_jwt_async(headers['Authorization'].claims)
+            kwargs['headers'] = dict(headers, Authorization=b'Bearer ' + token)
+        retry_policy = self._get_retry_policy(uri)
+        retry_number = 0
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(uri)
+            response = await self.session.request(method, uri, params=params, data=data, **kwargs)
+            delay = self._get_retry_delay(retry_policy, method, uri, response, retry_number)
+            if delay is None:
+                return self.parse(host, response)
+            await asyncio.sleep(delay)
+            retry_number += 1
+
+    def _iterate_pages(self, fetch_page, get_items, get_next_state, state=None, prefetch=False):
+        """Returns an async generator, so the sub-APIs' `iter_*` methods are used with `async for`."""
+        return iterate_pages_async(fetch_page, get_items, get_next_state, state, prefetch)
+
+
+class AsyncMeetings(Meetings):
+    async def upload_logo_to_theme(self, theme_id: str, path_to_image: str, logo_type: str):
+        upload_urls = await self._client.get(
+            self._meetings_api_host, '/themes/logos-upload-urls', auth_type=Meetings._auth_type
+        )
+        params = self._find_logo_upload_url(upload_urls, logo_type)
+        await self._upload_to_aws(params, path_to_image)
+        await self._add_logo_to_theme(theme_id, params['fields']['key'])
+        return f'Logo upload to theme: {theme_id} was successful.'
+
+    async def _upload_to_aws(self, params, path_to_image):
+        logger.debug(f"POST to {params['url']} to upload file {path_to_image}")
+        with open(path_to_image, 'rb') as image:
+            logo_upload = await self._client.session.post(
+                params['url'], data=params['fields'], files={'file': image}
+            )
+        if logo_upload.status_code != 204:
+            raise MeetingsError(f'Logo upload process failed. {logo_upload.content}')
+
+
+class AsyncMessages(Messages):
+    async def send_messages(self, messages, max_workers: int = 10, channel_rates: dict = None):
+        """
+        The asyncio version of `Messages.send_messages`, used with `async for`.
+        `max_workers` is the number of messages that can be in flight at once.
+        """
+        throttle = _ChannelThrottle(channel_rates)
+
+        async def send(message):
+            _validate(message)
+            delay = throttle.reserve(message['channel'])
+            if delay > 0:
+                await asyncio.sleep(delay)
+            return (await self._send_validated_message(message))['message_uuid']
+
+        async for result in map_concurrently_async(send, messages, max_concurrency=max_workers):
+            yield result
+
+
+class AsyncNumberInsight(NumberInsight):
+    async def _get_insight(self, level, params):
+        cache = self._client.number_insight_cache
+        if cache is not None:
+            insight = cache.get(level, params)
+            if insight is not None:
+                return insight
+
+        insight = await self._client.get(
+            self._client.api_host(),
+            f'/ni/{level}/json',
+            params,
+            auth_type=NumberInsight.auth_type,
+        )
+        if cache is not None:
+            cache.set(level, params, insight)
+        return insight
+
+    async def get_number_insights(
+        self,
+        numbers,
+        level: str = 'basic',
+        max_workers: int = 10,
+        requests_per_second: float = None,
+        **params,
+    ):
+        """The asyncio version of `NumberInsight.get_number_insights`, used with `async for`."""
+        lookup = self._get_lookup_method(level)
+        bucket = TokenBucket(requests_per_second) if requests_per_second else None
+
+        async def get_insight(number):
+            if bucket is not None:
+                await bucket.acquire_async()
+            return await lookup(dict(params, number=number))
+
+        unique_numbers = []
+        async for index, result in map_concurrently_async(
+            get_insight, _unique(numbers, unique_numbers), max_concurrency=max_workers
+        ):
+            yield unique_numbers[index], result
+
+
+class AsyncProactiveConnect(ProactiveConnect):
+    async def download_list_items(
+        self, list_id: str, file_path, chunk_size: int = DOWNLOAD_CHUNK_SIZE, on_progress=None
+    ):
+        response = await self._request_list_items(list_id)
+        try:
+            if not 200 <= response.status_code < 300:
+                await response.aread()
+                return self._client.parse(self._client.proactive_connect_host(), response)
+
+            chunks = _track_progress_async(response, response.aiter_bytes(chunk_size), on_progress)
+            if hasattr(file_path, 'write'):
+                async for chunk in chunks:
+                    file_path.write(chunk)
+            else:
+                with open(file_path, 'wb') as file:
+                    async for chunk in chunks:
+                        file.write(chunk)
+        finally:
+            await response.aclose()
+
+    async def iter_list_items(
+        self, list_id: str, chunk_size: int = DOWNLOAD_CHUNK_SIZE, on_progress=None
+    ):
+        """The asyncio version of `ProactiveConnect.iter_list_items`, used with `async for`."""
+        response = await self._request_list_items(list_id)
+        try:
+            if not 200 <= response.status_code < 300:
+                await response.aread()
+                self._client.parse(self._client.proactive_connect_host(), response)
+                return
+
+            parser = _CsvItemParser()
+            chunks = _track_progress_async(response, response.aiter_bytes(chunk_size), on_progress)
+            async for chunk in chunks:
+                for item in parser.feed(chunk):
+                    yield item
+            for item in parser.close():
+                yield item
+        finally:
+            await response.aclose()
+
+    async def _request_list_items(self, list_id):
+        auth = await self._client._create_jwt_auth_string_async()
+        uri, headers = self._build_download_request(list_id, auth)
+        request = self._client.session.build_request('GET', uri, headers=headers)
+        return await self._client.session.send(request, stream=True)
+
+    async def upload_list_items(self, list_id: str, file_path: str):
+        auth = await self._client._create_jwt_auth_string_async()
+        uri, headers = self._build_upload_request(list_id, auth)
+        with open(file_path, 'rb') as csv_file:
+            logger.debug(
+                f'POST request with Proactive Connect uploading {file_path} to {repr(uri)}'
+            )
+            response = await self._client.session.post(
+                uri,
+                headers=headers,
+                files={'file': ('list_items.csv', csv_file, 'text/csv')},
+            )
+        return self._client.parse(self._client.proactive_connect_host(), response)
+
+    async def upload_list_items_from_rows(
+        self, list_id: str, rows, fieldnames: List[str] = None, batch_size: int = None
+    ) -> List[dict]:
+        """
+        The asyncio version of `ProactiveConnect.upload_list_items_from_rows`.
+        `rows` can be an iterable or an async iterable.
+        """
+        if batch_size is not None and batch_size < 1:
+            raise ProactiveConnectError('"batch_size" must be at least 1.')
+
+        rows = _aiter(rows)
+        results = []
+        row = await _anext(rows)
+        while row is not None:
+            encoder = _CsvMultipartEncoder(fieldnames or list(row))
+            auth = await self._client._create_jwt_auth_string_async()
+            uri, headers = self._build_upload_request(list_id, auth, encoder.content_type)
+            logger.debug(f'POST request with Proactive Connect streaming list items to {repr(uri)}')
+            response = await self._client.session.post(
+                uri, headers=headers, content=_iter_chunks_async(encoder, row, rows, batch_size)
+            )
+            results.append(self._client.parse(self._client.proactive_connect_host(), response))
+            row = await _anext(rows)
+        return results
+
+
+class AsyncSms(Sms):
+    async def send_messages(
+        self,
+        messages,
+        max_workers: int = 10,
+        messages_per_second: float = None,
+        account_messages_per_second: float = None,
+    ):
+        """
+        The asyncio version of `Sms.send_messages`, used with `async for`.
+        `max_workers` is the number of messages that can be in flight at once.
+        """
+        throttle = _SendThrottle(messages_per_second, account_messages_per_second)
+
+        async def send(message):
+            delay = throttle.reserve(message)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            return await self.send_message(dict(message))
+
+        async for result in map_concurrently_async(send, messages, max_concurrency=max_workers):
+            yield result
+
+
+class AsyncVerify2(Verify2):
+    async def new_requests(self, requests, max_workers: int = 10):
+        """
+        The asyncio version of `Verify2.new_requests`, used with `async for`.
+        `max_workers` is the number of requests that can be in flight at once.
+        """
+        async for result in map_concurrently_async(self.new_request, requests, max_concurrency=max_workers):
+            yield result
+
+
+class AsyncVideo(Video):
+    async def create_session(self, session_options: dict = None):
+        params = self._build_session_params(session_options)
+        session = (
+            await self._client.post(
+                self._client.video_host(),
+                '/session/create',
+                params,
+                auth_type=Video.auth_type,
+                body_is_json=False,
+            )
+        )[0]
+
+        return self._build_session_info(session, params)
+
+
+async def _track_progress_async(response, chunks, on_progress):
+    """The asyncio version of `proactive_connect._track_progress`."""
+    total = _get_content_length(response)
+    downloaded = 0
+    async for chunk in chunks:
+        downloaded += len(chunk)
+        if on_progress is not None:
+            on_progress(downloaded, total)
+        yield chunk
+
+
+async def _iter_chunks_async(encoder, first_row, rows, batch_size):
+    """Yields the body of an import request for `first_row` and up to `batch_size - 1` more of `rows`."""
+    yield encoder.start()
+    chunk = encoder.write(first_row)
+    if chunk:
+        yield chunk
+    count = 1
+    while batch_size is None or count < batch_size:
+        row = await _anext(rows)
+        if row is None:
+            break
+        chunk = encoder.write(row)
+        if chunk:
+            yield chunk
+        count += 1
+    yield encoder.finish()
+
+
+async def _aiter(rows):
+    if hasattr(rows, '__aiter__'):
+        async for row in rows:
+            yield row
+    else:
+        for row in rows:
+            yield row
+
+
+async def _anext(rows):
+    """Returns the next item of an async iterator, or `None` once it is exhausted."""
+    try:
+        return await rows.__anext__()
+    except StopAsyncIteration:
+        return None
+
+
+class AsyncVoice(Voice):
+    async def iter_recording(self, url: str, chunk_size: int = RECORDING_CHUNK_SIZE, start: int = 0):
+        """The asyncio version of `Voice.iter_recording`, used with `async for`."""
+        response = await self._request_recording(url, start)
+        try:
+            if response.status_code == 416:
+                return
+            skip = start if start and response.status_code != 206 else 0
+            async for chunk in response.aiter_bytes(chunk_size):
+                if skip >= len(chunk):
+                    skip -= len(chunk)
+                    continue
+                yield chunk[skip:]
+                skip = 0
+        finally:
+            await response.aclose()
+
+    async def download_recording(
+        self,
+        url: str,
+        dest,
+        chunk_size: int = RECORDING_CHUNK_SIZE,
+        resume: bool = False,
+        max_resumes: int = 3,
+    ) -> int:
+        if hasattr(dest, 'write'):
+            return await self._write_recording(url, dest, 0, chunk_size, max_resumes)
+
+        with _open_recording_file(dest, resume) as (file, offset):
+            return await self._write_recording(url, file, offset, chunk_size, max_resumes)
+
+    async def download_recordings(self, downloads, max_workers: int = 10, **kwargs):
+        """The asyncio version of `Voice.download_recordings`, used with `async for`."""
+        async for result in map_concurrently_async(
+            lambda download: self.download_recording(*download, **kwargs),
+            downloads,
+            max_concurrency=max_workers,
+        ):
+            yield result
+
+    async def _request_recording(self, url, start=0):
+        auth = await self._client._create_jwt_auth_string_async()
+        request = self._client.session.build_request(
+            'GET', url, headers=self._build_recording_headers(auth, start)
+        )
+        response = await self._client.session.send(request, stream=True)
+        if not 200 <= response.status_code < 300 and not (start and response.status_code == 416):
+            try:
+                await response.aread()
+                self._client.parse(urlparse(url).hostname, response)
+            finally:
+                await response.aclose()
+        return response
+
+    async def _write_recording(self, url, file, offset, chunk_size, max_resumes):
+        resumes = 0
+        while True:
+            try:
+                response = await self._request_recording(url, offset)
+                try:
+                    if response.status_code == 416:
+                        return offset
+                    if offset and response.status_code != 206:
+                        offset = self._restart_recording(url, file)
+                    async for chunk in response.aiter_bytes(chunk_size):
+                        file.write(chunk)
+                        offset += len(chunk)
+                    return offset
+                finally:
+                    await response.aclose()
+            except httpx.TransportError as err:
+                if resumes >= max_resumes:
+                    raise
+                resumes += 1
+                logger.warning(f'Download of {url} interrupted after {offset} bytes, resuming: {err}')
+
+
+class _PendingJwt:
+    """Stands in for a JWT Authorization header until the request is sent and the token is signed."""
+
+    def __init__(self, claims):
+        self.claims = claims
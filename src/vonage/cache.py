@@ -0,0 +1,325 @@
+from collections import OrderedDict
+from copy import deepcopy
+from math import ceil
+from threading import Lock
+from time import monotonic, perf_counter, time
+
+import asyncio
+import json
+import sqlite3
+
+
+class TTLCache:
+    """
+    A thread-safe, size-bounded cache whose entries can expire after a time-to-live.
+
+    When the cache is full, the least recently used entry is evicted to make room for a new one.
+
+    :param int maxsize: The maximum number of entries to hold.
+    :param float ttl: (optional) The default number of seconds an entry stays valid for.
+        If `None`, entries only leave the cache when they are evicted.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: float = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at is None or monotonic() < expires_at:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return default
+
+    def set(self, key, value, ttl: float = None):
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = None if ttl is None else monotonic() + ttl
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key, default=None):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        return default if entry is None else entry[0]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def stats(self) -> dict:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._entries),
+        }
+
+
+class JwtCache:
+    """
+    Caches signed JWTs by their claims, so a token can be reused instead of being signed for every request.
+
+    A cached token is reused until `refresh_fraction` of its lifetime has passed, then a new token is
+    signed on the next request, ahead of the old token's expiry.
+    Claims that set their own `jti` are never cached, as a `jti` identifies a single token.
+
+    :param float refresh_fraction: The fraction of a token's lifetime after which it is replaced. Must be in (0, 1].
+    :param int maxsize: The maximum number of distinct claims sets to hold tokens for.
+    """
+
+    def __init__(self, refresh_fraction: float = 0.5, maxsize: int = 128):
+        if not 0 < refresh_fraction <= 1:
+            raise ValueError('"refresh_fraction" must be greater than 0 and at most 1.')
+        self.refresh_fraction = refresh_fraction
+        self.tokens_signed = 0
+        self.signing_time = 0.0
+        self._tokens = TTLCache(maxsize=maxsize)
+        self._pending = {}
+        self._lock = Lock()
+
+    def get_token(self, claims: dict, sign) -> bytes:
+        """
+        Returns a cached token for `claims`, or calls `sign` with a copy of `claims` to create one.
+
+        `sign` is expected to add any `iat` and `exp` claims it sets to the dict it is passed.
+        """
+        key, token = self._lookup(claims)
+        if token is not None:
+            return token
+
+        signed_claims = dict(claims)
+        start = perf_counter()
+        token = sign(signed_claims)
+        self._store(key, signed_claims, token, perf_counter() - start)
+        return token
+
+    async def get_token_async(self, claims: dict, sign_async) -> bytes:
+        """
+        Like `get_token`, but awaits `sign_async` to create a token. Concurrent calls for the same claims
+        wait for the same token to be signed.
+        """
+        key, token = self._lookup(claims)
+        if token is not None:
+            return token
+        if key is None:
+            return await self._sign_async(key, claims, sign_async)
+
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = self._pending[key] = asyncio.ensure_future(self._sign_async(key, claims, sign_async))
+            pending.add_done_callback(lambda _: self._pending.pop(key, None))
+        return await asyncio.shield(pending)
+
+    def clear(self):
+        self._tokens.clear()
+
+    @property
+    def stats(self) -> dict:
+        return {
+            'hits': self._tokens.hits,
+            'misses': self._tokens.misses,
+            'tokens_signed': self.tokens_signed,
+            'signing_time': self.signing_time,
+        }
+
+    def _lookup(self, claims):
+        """Returns the cache key for `claims` (None if they can't be cached) and the cached token, if any."""
+        if 'jti' in claims:
+            return None, None
+        key = json.dumps(claims, sort_keys=True, default=str)
+        return key, self._tokens.get(key)
+
+    async def _sign_async(self, key, claims, sign_async):
+        signed_claims = dict(claims)
+        start = perf_counter()
+        token = await sign_async(signed_claims)
+        self._store(key, signed_claims, token, perf_counter() - start)
+        return token
+
+    def _store(self, key, signed_claims, token, elapsed):
+        with self._lock:
+            self.tokens_signed += 1
+            self.signing_time += elapsed
+        if key is None:
+            return
+        ttl = self._get_reuse_period(signed_claims)
+        if ttl is not None and ttl > 0:
+            self._tokens.set(key, token, ttl)
+
+    def _get_reuse_period(self, signed_claims):
+        """Returns how many more seconds a token with these claims can be reused for."""
+        if 'exp' not in signed_claims:
+            return None
+        now = time()
+        issued_at = signed_claims.get('iat', now)
+        lifetime = signed_claims['exp'] - issued_at
+        return issued_at + lifetime * self.refresh_fraction - now
+
+
+class InsightCache:
+    """
+    Caches Number Insight responses, so repeated lookups of a number within a time-to-live don't
+    call the API again. Responses are keyed by the insight level, the number and the other request
+    parameters. Only successful responses (with a `status` of 0) are cached.
+
+    :param dict ttls: (optional) The number of seconds a response stays valid for, for each level
+        ("basic", "standard" and "advanced"). Levels that aren't set use `DEFAULT_TTLS`.
+    :param int maxsize: The maximum number of responses to hold, when using the default in-memory backend.
+    :param backend: (optional) Where responses are stored. Defaults to an in-memory TTLCache, which evicts
+        the least recently used response when it is full. Use a SqliteCacheBackend to keep responses on disk,
+        or a RedisCacheBackend to share them between hosts. Any object with the same `get(key)` and
+        `set(key, value, ttl)` methods can be used.
+    """
+
+    DEFAULT_TTLS = {'basic': 7 * 24 * 60 * 60, 'standard': 24 * 60 * 60, 'advanced': 60 * 60}
+
+    def __init__(self, ttls: dict = None, maxsize: int = 1024, backend=None):
+        self.ttls = {**InsightCache.DEFAULT_TTLS, **(ttls or {})}
+        self.backend = backend if backend is not None else TTLCache(maxsize=maxsize)
+        self.hits = 0
+        self.misses = 0
+        self._lock = Lock()
+
+    def get(self, level: str, params: dict):
+        """Returns the cached response for a lookup, or `None`."""
+        insight = self.backend.get(self._make_key(level, params))
+        with self._lock:
+            if insight is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return deepcopy(insight)
+
+    def set(self, level: str, params: dict, insight):
+        if isinstance(insight, dict) and insight.get('status') == 0:
+            self.backend.set(self._make_key(level, params), deepcopy(insight), self.ttls[level])
+
+    @property
+    def stats(self) -> dict:
+        return {'hits': self.hits, 'misses': self.misses}
+
+    def _make_key(self, level, params):
+        return f'{level}:' + json.dumps(params, sort_keys=True, default=str)
+
+
+class SqliteCacheBackend:
+    """
+    Stores cache entries in a SQLite database file, so they outlive the process and can be shared by
+    processes on the same host. When there are more than `maxsize` entries, expired entries and then
+    the least recently used entries are deleted. Values must be JSON serializable.
+
+    :param str path: The path of the database file. It is created if it doesn't exist.
+    :param int maxsize: The maximum number of entries to hold.
+    """
+
+    def __init__(self, path: str, maxsize: int = 100_000):
+        self.path = path
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = Lock()
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS cache '
+                '(key TEXT PRIMARY KEY, value TEXT, expires_at REAL, accessed_at REAL)'
+            )
+            self._connection.execute(
+                'CREATE INDEX IF NOT EXISTS cache_accessed_at ON cache (accessed_at)'
+            )
+
+    def get(self, key, default=None):
+        now = time()
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                'SELECT value, expires_at FROM cache WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None or (row[1] is not None and row[1] <= now):
+                self.misses += 1
+                return default
+            self._connection.execute('UPDATE cache SET accessed_at = ? WHERE key = ?', (now, key))
+            self.hits += 1
+        return json.loads(row[0])
+
+    def set(self, key, value, ttl: float = None):
+        now = time()
+        expires_at = None if ttl is None else now + ttl
+        with self._lock, self._connection:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?)',
+                (key, json.dumps(value), expires_at, now),
+            )
+            self._evict(now)
+
+    def clear(self):
+        with self._lock, self._connection:
+            self._connection.execute('DELETE FROM cache')
+
+    def close(self):
+        self._connection.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM cache').fetchone()[0]
+
+    @property
+    def stats(self) -> dict:
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions}
+
+    def _evict(self, now):
+        excess = self._connection.execute('SELECT COUNT(*) FROM cache').fetchone()[0] - self.maxsize
+        if excess <= 0:
+            return
+        excess -= self._connection.execute(
+            'DELETE FROM cache WHERE expires_at <= ?', (now,)
+        ).rowcount
+        if excess > 0:
+            self._connection.execute(
+                'DELETE FROM cache WHERE key IN (SELECT key FROM cache ORDER BY accessed_at LIMIT ?)',
+                (excess,),
+            )
+            self.evictions += excess
+
+
+class RedisCacheBackend:
+    """
+    Stores cache entries in Redis, so they can be shared by every process and host that uses the server.
+    Entries expire with Redis' own key expiry, and the server's `maxmemory-policy` decides which entries
+    are evicted when it is full. Values must be JSON serializable.
+
+    :param redis_client: A client from the `redis` package, e.g. `redis.Redis(host='localhost')`.
+    :param str prefix: A prefix for the keys of the entries.
+    """
+
+    def __init__(self, redis_client, prefix: str = 'vonage:'):
+        self.redis_client = redis_client
+        self.prefix = prefix
+
+    def get(self, key, default=None):
+        value = self.redis_client.get(self.prefix + key)
+        return default if value is None else json.loads(value)
+
+    def set(self, key, value, ttl: float = None):
+        self.redis_client.set(
+            self.prefix + key, json.dumps(value), ex=None if ttl is None else ceil(ttl)
+        )
@@ -2,7 +2,9 @@ import vonage
 from vonage_jwt.jwt import JwtClient
 
 from .account import Account
+from ._internal import iterate_pages, match_route
 from .application import ApplicationV2, Application
+from .cache import JwtCache
 from .errors import *
 from .meetings import Meetings
 from .messages import Messages
@@ -13,6 +15,7 @@ from .redact import Redact
 from .short_codes import ShortCodes
 from .sms import Sms
 from .subaccounts import Subaccounts
+from .transport import RequestsTransport
 from .users import Users
 from .ussd import Ussd
 from .video import Video
@@ -72,6 +75,22 @@ class Client:
         before giving up, as a float, or a (connect timeout, read
         timeout) tuple. If set this timeout is used for every call to the Vonage enpoints
     :type timeout: float or tuple
+    :param bool cache_jwts: (optional) Reuse signed JWTs for requests with the same claims, instead of
+        signing a new token for every request. Defaults to `True`.
+    :param float jwt_refresh_fraction: (optional) The fraction of a cached JWT's lifetime after which
+        a new token is signed. Defaults to 0.5.
+    :param RetryPolicy retry_policy: (optional) How to retry requests that get a 429 or 5xx response.
+        By default, requests are not retried. Policies for specific APIs can be set in `client.retry_policies`.
+    :param RateLimiter rate_limiter: (optional) Limits the rate of requests the client makes to groups of routes.
+        Every request (including retries) waits for the limiter before it is sent.
+    :param InsightCache number_insight_cache: (optional) Caches Number Insight responses, so repeated lookups
+        of a number don't call the API again until the cached response expires.
+    :param jwt_signer: (optional) Signs the client's JWTs instead of the client's own JWT client, e.g. a
+        `ProcessPoolSigner` to sign tokens on worker processes. Any object with a `sign(claims)` method
+        that returns the token as bytes can be used.
+    :param transport: (optional) Sends the client's API requests, e.g. an `Http2Transport` to multiplex
+        concurrent requests over HTTP/2. Defaults to a `RequestsTransport` for the client's `session`,
+        which is still used to stream recordings and Proactive Connect files.
     """
 
     def __init__(
@@ -88,6 +107,13 @@ class Client:
         pool_connections=10,
         pool_maxsize=10,
         max_retries=3,
+        cache_jwts=True,
+        jwt_refresh_fraction=0.5,
+        retry_policy=None,
+        rate_limiter=None,
+        number_insight_cache=None,
+        jwt_signer=None,
+        transport=None,
     ):
         self.api_key = key or os.environ.get("VONAGE_API_KEY", None)
         self.api_secret = secret or os.environ.get("VONAGE_API_SECRET", None)
@@ -105,10 +131,16 @@ class Client:
         }:
             self.signature_method = getattr(hashlib, signature_method)
 
+        self._signature_hasher = None
+        self._signature_hasher_key = None
+
+        self._private_key = private_key
         if private_key is not None and application_id is not None:
             self._jwt_client = JwtClient(application_id, private_key)
 
         self._jwt_claims = {}
+        self.jwt_signer = jwt_signer
+        self.jwt_cache = JwtCache(refresh_fraction=jwt_refresh_fraction) if cache_jwts else None
         self._host = "rest.nexmo.com"
         self._api_host = "api.nexmo.com"
         self._video_host = "video.api.vonage.com"
@@ -142,7 +174,17 @@ class Client:
         self.video = Video(self)
         self.voice = Voice(self)
 
+        self.retry_policy = retry_policy
+        # Maps route prefixes (e.g. "/sms" or "api.nexmo.com/v1/calls") to the RetryPolicy for that route
+        self.retry_policies = {}
+        self.rate_limiter = rate_limiter
+        self.number_insight_cache = number_insight_cache
+
         self.timeout = timeout
+        self.transport = transport
+        self._create_session(pool_connections, pool_maxsize, max_retries)
+
+    def _create_session(self, pool_connections, pool_maxsize, max_retries):
         self.session = Session()
         self.adapter = HTTPAdapter(
             pool_connections=pool_connections,
@@ -150,6 +192,8 @@ class Client:
             max_retries=max_retries,
         )
         self.session.mount("https://", self.adapter)
+        if self.transport is None:
+            self.transport = RequestsTransport(self.session)
 
     # Gets and sets _host attribute
     def host(self, value=None):
@@ -192,63 +236,47 @@ class Client:
         signature = params.pop("sig", "").lower()
         return hmac.compare_digest(signature, self.signature(params))
 
+    def check_signatures(self, params_list):
+        """
+        Checks the signatures of many signed requests (e.g. a batch of webhooks), returning a list of bools
+        in the same order as `params_list`.
+        """
+        return [self.check_signature(params) for params in params_list]
+
     def signature(self, params):
-        if self.signature_method:
-            hasher = hmac.new(
-                self.signature_secret.encode(),
-                digestmod=self.signature_method,
-            )
-        else:
-            hasher = hashlib.md5()
+        return self._sign(self._get_signature_hasher(), params)
 
+    def _sign(self, base_hasher, params):
         # Add timestamp if not already present
         if not params.get("timestamp"):
             params["timestamp"] = int(time.time())
 
-        for key in sorted(params):
-            value = params[key]
-
-            if isinstance(value, str):
-                value = value.replace("&", "_").replace("=", "_")
-
-            hasher.update(f"&{key}={value}".encode("utf-8"))
-
+        hasher = base_hasher.copy()
+        hasher.update(_canonicalize_signature_params(params))
         if self.signature_method is None:
             hasher.update(self.signature_secret.encode())
-
         return hasher.hexdigest()
 
+    def _get_signature_hasher(self):
+        """
+        Returns a hasher holding the state of the signature secret's HMAC key, which is copied for each
+        signature instead of being prepared again. It is rebuilt if the secret or method changes.
+        """
+        key = (self.signature_secret, self.signature_method)
+        if self._signature_hasher_key != key:
+            if self.signature_method:
+                hasher = hmac.new(self.signature_secret.encode(), digestmod=self.signature_method)
+            else:
+                hasher = hashlib.md5()
+            self._signature_hasher, self._signature_hasher_key = hasher, key
+        return self._signature_hasher
+
     def get(self, host, request_uri, params=None, auth_type=None):
         uri = f"https://{host}{request_uri}"
-        self._request_headers = self.headers
+        headers, params = self._build_auth(auth_type, params, allow_params_auth=True)
 
-        if auth_type == 'jwt':
-            self._request_headers['Authorization'] = self._create_jwt_auth_string()
-        elif auth_type == 'params':
-            params = dict(
-                params or {},
-                api_key=self.api_key,
-                api_secret=self.api_secret,
-            )
-        elif auth_type == 'header':
-            self._request_headers['Authorization'] = self._create_header_auth_string()
-        else:
-            raise InvalidAuthenticationTypeError(
-                f'Invalid authentication type. Must be one of "jwt", "header" or "params".'
-            )
-
-        logger.debug(
-            f"GET to {repr(uri)} with params {repr(params)}, headers {repr(self._request_headers)}"
-        )
-        return self.parse(
-            host,
-            self.session.get(
-                uri,
-                params=params,
-                headers=self._request_headers,
-                timeout=self.timeout,
-            ),
-        )
+        logger.debug(f"GET to {repr(uri)} with params {repr(params)}, headers {repr(headers)}")
+        return self._request('GET', host, uri, params=params, headers=headers)
 
     def post(
         self,
@@ -268,126 +296,102 @@ class Client:
             when initializing this client.
         """
         uri = f"https://{host}{request_uri}"
-        self._request_headers = self.headers
 
         if supports_signature_auth and self.signature_secret:
+            headers = dict(self.headers)
             params["api_key"] = self.api_key
             params["sig"] = self.signature(params)
-        elif auth_type == 'jwt':
-            self._request_headers['Authorization'] = self._create_jwt_auth_string()
-        elif auth_type == 'params':
-            params = dict(
-                params,
-                api_key=self.api_key,
-                api_secret=self.api_secret,
-            )
-        elif auth_type == 'header':
-            self._request_headers['Authorization'] = self._create_header_auth_string()
         else:
-            raise InvalidAuthenticationTypeError(
-                f'Invalid authentication type. Must be one of "jwt", "header" or "params".'
-            )
+            headers, params = self._build_auth(auth_type, params, allow_params_auth=True)
 
-        logger.debug(
-            f"POST to {repr(uri)} with params {repr(params)}, headers {repr(self._request_headers)}"
-        )
+        logger.debug(f"POST to {repr(uri)} with params {repr(params)}, headers {repr(headers)}")
         if body_is_json:
-            return self.parse(
-                host,
-                self.session.post(
-                    uri,
-                    json=params,
-                    headers=self._request_headers,
-                    timeout=self.timeout,
-                ),
-            )
+            return self._request('POST', host, uri, json=params, headers=headers)
         else:
-            return self.parse(
-                host,
-                self.session.post(
-                    uri,
-                    data=params,
-                    headers=self._request_headers,
-                    timeout=self.timeout,
-                ),
-            )
+            return self._request('POST', host, uri, data=params, headers=headers)
 
     def put(self, host, request_uri, params, auth_type=None):
         uri = f"https://{host}{request_uri}"
-        self._request_headers = self.headers
-
-        if auth_type == 'jwt':
-            self._request_headers['Authorization'] = self._create_jwt_auth_string()
-        elif auth_type == 'header':
-            self._request_headers['Authorization'] = self._create_header_auth_string()
-        else:
-            raise InvalidAuthenticationTypeError(
-                f'Invalid authentication type. Must be one of "jwt", "header" or "params".'
-            )
+        headers, params = self._build_auth(auth_type, params)
 
-        logger.debug(
-            f"PUT to {repr(uri)} with params {repr(params)}, headers {repr(self._request_headers)}"
-        )
+        logger.debug(f"PUT to {repr(uri)} with params {repr(params)}, headers {repr(headers)}")
         # All APIs that currently use put methods require a json-formatted body so don't need to check this
-        return self.parse(
-            host,
-            self.session.put(
-                uri,
-                json=params,
-                headers=self._request_headers,
-                timeout=self.timeout,
-            ),
-        )
+        return self._request('PUT', host, uri, json=params, headers=headers)
 
     def patch(self, host, request_uri, params, auth_type=None):
         uri = f"https://{host}{request_uri}"
-        self._request_headers = self.headers
-
-        if auth_type == 'jwt':
-            self._request_headers['Authorization'] = self._create_jwt_auth_string()
-        elif auth_type == 'header':
-            self._request_headers['Authorization'] = self._create_header_auth_string()
-        else:
-            raise InvalidAuthenticationTypeError(f"""Invalid authentication type.""")
+        headers, params = self._build_auth(auth_type, params)
 
-        logger.debug(
-            f"PATCH to {repr(uri)} with params {repr(params)}, headers {repr(self._request_headers)}"
-        )
+        logger.debug(f"PATCH to {repr(uri)} with params {repr(params)}, headers {repr(headers)}")
         # Only newer APIs (that expect json-bodies) currently use this method, so we will always send a json-formatted body
-        return self.parse(
-            host,
-            self.session.patch(
-                uri,
-                json=params,
-                headers=self._request_headers,
-            ),
-        )
+        return self._request('PATCH', host, uri, json=params, headers=headers)
 
     def delete(self, host, request_uri, params=None, auth_type=None):
         uri = f"https://{host}{request_uri}"
-        self._request_headers = self.headers
+        headers, params = self._build_auth(auth_type, params)
+
+        logger.debug(f"DELETE to {repr(uri)} with headers {repr(headers)}")
+        if params is not None:
+            logger.debug(f"DELETE call has params {repr(params)}")
+        return self._request('DELETE', host, uri, params=params, headers=headers)
+
+    def _build_auth(self, auth_type, params, allow_params_auth=False):
+        """
+        Returns the headers for a single request, and the params to send with it.
+
+        A new headers dict is created for every request and `self.headers` is never modified,
+        so a single client (and its connection pool) can be shared between threads.
+        """
+        headers = dict(self.headers)
 
         if auth_type == 'jwt':
-            self._request_headers['Authorization'] = self._create_jwt_auth_string()
+            headers['Authorization'] = self._create_jwt_auth_string()
+        elif auth_type == 'params' and allow_params_auth:
+            params = dict(
+                params or {},
+                api_key=self.api_key,
+                api_secret=self.api_secret,
+            )
         elif auth_type == 'header':
-            self._request_headers['Authorization'] = self._create_header_auth_string()
+            headers['Authorization'] = self._create_header_auth_string()
         else:
             raise InvalidAuthenticationTypeError(
                 f'Invalid authentication type. Must be one of "jwt", "header" or "params".'
             )
-
-        logger.debug(f"DELETE to {repr(uri)} with headers {repr(self._request_headers)}")
-        if params is not None:
-            logger.debug(f"DELETE call has params {repr(params)}")
-        return self.parse(
-            host,
-            self.session.delete(
-                uri,
-                headers=self._request_headers,
-                timeout=self.timeout,
-                params=params,
-            ),
-        )
+        return headers, params
+
+    def _request(self, method, host, uri, **kwargs):
+        """Sends a request with the client's transport, retrying it if allowed, and parses the response."""
+        retry_policy = self._get_retry_policy(uri)
+        retry_number = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(uri)
+            response = self.transport.request(method, uri, timeout=self.timeout, **kwargs)
+            delay = self._get_retry_delay(retry_policy, method, uri, response, retry_number)
+            if delay is None:
+                return self.parse(host, response)
+            time.sleep(delay)
+            retry_number += 1
+
+    def _iterate_pages(self, fetch_page, get_items, get_next_state, state=None, prefetch=False):
+        """Used by the sub-APIs' `iter_*` methods. See `vonage._internal.iterate_pages`."""
+        return iterate_pages(fetch_page, get_items, get_next_state, state, prefetch)
+
+    def _get_retry_policy(self, uri):
+        return match_route(self.retry_policies, uri, default=self.retry_policy)
+
+    def _get_retry_delay(self, retry_policy, method, uri, response, retry_number):
+        """Returns how long to wait before retrying a request, or None if it shouldn't be retried."""
+        if retry_policy is None:
+            return None
+        delay = retry_policy.get_delay(method, response, retry_number)
+        if delay is not None:
+            logger.warning(
+                f"{response.status_code} response to {method} {repr(uri)}, retrying in {delay:.2f} seconds"
+            )
+            retry_policy.record_retry(method, uri, response, retry_number + 1, delay)
+        return delay
 
     def parse(self, host, response: Response):
         logger.debug(f"Response headers {repr(response.headers)}")
@@ -447,9 +451,14 @@ class Client:
     def _create_jwt_auth_string(self):
         return b"Bearer " + self._generate_application_jwt()
 
-    def _generate_application_jwt(self):
+    def _generate_application_jwt(self, claims: dict = None):
+        """Signs a JWT for `claims`, or for the claims set with `auth` if `claims` isn't given."""
+        claims = self._jwt_claims if claims is None else claims
         try:
-            return self._jwt_client.generate_application_jwt(self._jwt_claims)
+            sign = self._get_jwt_sign()
+            if self.jwt_cache is not None:
+                return self.jwt_cache.get_token(claims, sign)
+            return sign(dict(claims))
         except AttributeError as err:
             if '_jwt_client' in str(err):
                 raise ClientError(
@@ -458,6 +467,22 @@ class Client:
             else:
                 raise err
 
+    def _get_jwt_sign(self):
+        if self.jwt_signer is not None:
+            return self.jwt_signer.sign
+        return self._jwt_client.generate_application_jwt
+
     def _create_header_auth_string(self):
         hash = base64.b64encode(f"{self.api_key}:{self.api_secret}".encode("utf-8")).decode("ascii")
         return f"Basic {hash}"
+
+
+def _canonicalize_signature_params(params):
+    """Joins sorted params into the "&key=value" string that is signed, with "&" and "=" in values replaced."""
+    parts = []
+    for key in sorted(params):
+        value = params[key]
+        if isinstance(value, str):
+            value = value.replace("&", "_").replace("=", "_")
+        parts.append(f"&{key}={value}")
+    return "".join(parts).encode("utf-8")
@@ -36,6 +36,10 @@ class InvalidAuthenticationTypeError(Error):
     """An authentication method was specified that is not allowed"""
 
 
+class NumberInsightError(ClientError):
+    """An error relating to the Number Insight API."""
+
+
 class MeetingsError(ClientError):
     """An error related to the Meetings class which calls the Vonage Meetings API."""
 
@@ -0,0 +1,108 @@
+from .cache import TTLCache
+
+from vonage_jwt.verify_jwt import VonageVerifyJwtError
+
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from threading import Lock
+from time import time
+
+import jwt
+import re
+
+# A JWT's segments are base64url encoded without padding
+_JWT_SEGMENTS = re.compile(r'[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+\.([A-Za-z0-9_-]+)')
+
+
+class JwtVerifier:
+    """
+    Verifies the HS256 JWTs that Vonage signs webhooks (e.g. Voice API events) with, for a signature secret.
+
+    Tokens are verified with PyJWT, as `Voice.verify_signature` does. The result of verifying a token
+    is cached, so a token that is seen again (e.g. a retried webhook) is verified from the cache. A valid
+    token is cached until it expires, or for at most `cache_ttl` seconds.
+
+    Like `Voice.verify_signature`, `verify` returns False if a token's signature is invalid, and raises
+    a `VonageVerifyJwtError` if the token can't be verified, e.g. because it has expired or is malformed.
+
+    :param str signature_secret: The signature secret from your Vonage dashboard.
+    :param int cache_size: The maximum number of tokens to cache the results for.
+    :param float cache_ttl: The maximum number of seconds to cache a result for.
+    :param float leeway: The number of seconds of clock skew to allow when checking `exp`, `nbf` and `iat`.
+    """
+
+    def __init__(
+        self,
+        signature_secret: str,
+        cache_size: int = 1024,
+        cache_ttl: float = 300,
+        leeway: float = 0,
+    ):
+        self.cache_ttl = cache_ttl
+        self.leeway = leeway
+        self.tokens_verified = 0
+        self._signature_secret = signature_secret
+        self._results = TTLCache(maxsize=cache_size)
+        self._lock = Lock()
+
+    def verify(self, token: str) -> bool:
+        result = self._results.get(token)
+        if result is not None:
+            return result
+
+        result, ttl = self._verify(token)
+        with self._lock:
+            self.tokens_verified += 1
+        if ttl > 0:
+            self._results.set(token, result, ttl)
+        return result
+
+    def verify_many(self, tokens) -> list:
+        """
+        Verifies a batch of tokens (e.g. queued webhook events), returning a result for each token in the
+        same order. Each result is True, False, or the `VonageVerifyJwtError` raised for that token.
+        """
+        results = []
+        for token in tokens:
+            try:
+                results.append(self.verify(token))
+            except VonageVerifyJwtError as err:
+                results.append(err)
+        return results
+
+    @property
+    def stats(self) -> dict:
+        return {
+            'hits': self._results.hits,
+            'misses': self._results.misses,
+            'tokens_verified': self.tokens_verified,
+        }
+
+    def _verify(self, token):
+        """Returns whether the token's signature is valid, and how long the result can be cached for."""
+        _check_encoding(token)
+        try:
+            claims = jwt.decode(
+                token, self._signature_secret, algorithms=['HS256'], leeway=self.leeway
+            )
+        except jwt.InvalidSignatureError:
+            return False, self.cache_ttl
+        except jwt.PyJWTError as err:
+            raise VonageVerifyJwtError(str(err))
+        if 'exp' not in claims:
+            return True, self.cache_ttl
+        return True, min(self.cache_ttl, claims['exp'] + self.leeway - time())
+
+
+def _check_encoding(token):
+    """
+    PyJWT decodes base64url leniently, so a signature could be altered (e.g. padded, or with stray characters
+    or unused bits changed) and still be valid. Tokens that aren't strictly encoded are rejected.
+    """
+    match = _JWT_SEGMENTS.fullmatch(token) if isinstance(token, str) else None
+    if match is not None:
+        signature = match.group(1)
+        if len(signature) % 4 != 1:
+            padded = signature + '=' * (-len(signature) % 4)
+            if urlsafe_b64encode(urlsafe_b64decode(padded)).rstrip(b'=') == signature.encode('ascii'):
+                return
+    raise VonageVerifyJwtError('The token is not a valid JWT')
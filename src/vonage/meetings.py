@@ -1,3 +1,4 @@
+from ._internal import get_query_param
 from .errors import MeetingsError
 
 from typing_extensions import Literal
@@ -24,6 +25,21 @@ class Meetings:
             self._meetings_api_host, '/rooms', params, auth_type=Meetings._auth_type
         )
 
+    def iter_rooms(self, page_size: int = 20, prefetch: bool = False):
+        """Yields every meeting room, fetching pages of rooms as they are needed."""
+
+        def fetch_page(start_id):
+            return self.list_rooms(page_size=page_size, start_id=start_id)
+
+        def get_next_start_id(page, rooms, start_id):
+            next_link = page.get('_links', {}).get('next')
+            if next_link is not None and len(rooms) >= int(page.get('page_size', page_size)):
+                return get_query_param(next_link['href'], 'start_id')
+
+        return self._client._iterate_pages(
+            fetch_page, lambda page: page.get('_embedded', []), get_next_start_id, prefetch=prefetch
+        )
+
     def create_room(self, params: dict = {}):
         if 'display_name' not in params:
             raise MeetingsError(
@@ -138,6 +154,10 @@ class Meetings:
         upload_urls = self._client.get(
             self._meetings_api_host, '/themes/logos-upload-urls', auth_type=Meetings._auth_type
         )
+        return self._find_logo_upload_url(upload_urls, logo_type)
+
+    @staticmethod
+    def _find_logo_upload_url(upload_urls, logo_type):
         for url_object in upload_urls:
             if url_object['fields']['logoType'] == logo_type:
                 return url_object
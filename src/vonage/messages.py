@@ -1,7 +1,9 @@
-from ._internal import set_auth_type
+from ._internal import map_concurrently, set_auth_type
 from .errors import MessagesError
+from .rate_limiter import TokenBucket
 
 import re
+from time import sleep
 
 
 class Messages:
@@ -20,7 +22,34 @@ class Messages:
 
     def send_message(self, params: dict):
         self.validate_send_message_input(params)
+        return self._send_validated_message(params)
 
+    def send_messages(self, messages, max_workers: int = 10, channel_rates: dict = None):
+        """
+        Send many messages, across any mix of channels, concurrently over the client's connection pool.
+
+        Returns a generator that yields `(index, message_uuid)` tuples as each message is sent, where `index`
+        is the position of the message in `messages`. If a message is invalid or sending it raises an error,
+        the error is yielded instead of the message UUID. `messages` can be a lazy iterator, as only a bounded
+        number of messages are held in memory at once.
+
+        :param messages: An iterable of dicts, each in the format passed to `send_message`.
+        :param int max_workers: The number of messages that can be in flight at once.
+        :param dict channel_rates: (optional) Maps channels (e.g. "whatsapp") to the maximum number of messages
+            per second to send on that channel. Channels that aren't in the dict aren't limited.
+        """
+        throttle = _ChannelThrottle(channel_rates)
+
+        def send(message):
+            _validate(message)
+            delay = throttle.reserve(message['channel'])
+            if delay > 0:
+                sleep(delay)
+            return self._send_validated_message(message)['message_uuid']
+
+        return map_concurrently(send, messages, max_workers=max_workers)
+
+    def _send_validated_message(self, params):
         return self._client.post(
             self._client.api_host(),
             "/v1/messages",
@@ -29,85 +58,136 @@ class Messages:
         )
 
     def validate_send_message_input(self, params):
-        self._check_input_is_dict(params)
-        self._check_valid_message_channel(params)
-        self._check_valid_message_type(params)
-        self._check_valid_recipient(params)
-        self._check_valid_sender(params)
-        self._channel_specific_checks(params)
-        self._check_valid_client_ref(params)
-
-    def _check_input_is_dict(self, params):
-        if type(params) is not dict:
-            raise MessagesError(
-                'Parameters to the send_message method must be specified as a dictionary.'
-            )
+        _validate(params)
+        if 'client_ref' in params:
+            self._client_ref = params['client_ref']
 
-    def _check_valid_message_channel(self, params):
-        if params['channel'] not in Messages.valid_message_channels:
-            raise MessagesError(
-                f"""
+    def validate_many(self, messages) -> list:
+        """
+        Validates a batch of messages, returning a result for each message in the same order.
+        Each result is None if the message is valid, or the `MessagesError` raised for it.
+        """
+        results = []
+        append = results.append
+        get_checks = _CHECKS.get
+        for params in messages:
+            try:
+                if type(params) is not dict:
+                    raise MessagesError(
+                        'Parameters to the send_message method must be specified as a dictionary.'
+                    )
+                checks = get_checks((params['channel'], params['message_type']))
+                if checks is None:
+                    _raise_invalid_channel_or_type(params)
+                for check in checks:
+                    check(params)
+                append(None)
+            except MessagesError as err:
+                append(err)
+        return results
+
+
+class _ChannelThrottle:
+    """Paces messages on each channel, for Messages.send_messages."""
+
+    def __init__(self, channel_rates=None):
+        self._buckets = {channel: TokenBucket(rate) for channel, rate in (channel_rates or {}).items()}
+
+    def reserve(self, channel) -> float:
+        """Returns the number of seconds to wait before sending a message on `channel`."""
+        bucket = self._buckets.get(channel)
+        return bucket.reserve() if bucket is not None else 0.0
+
+
+_PHONE_NUMBER = re.compile(r'[1-9]\d{6,14}')
+
+
+def _validate(params):
+    if type(params) is not dict:
+        raise MessagesError('Parameters to the send_message method must be specified as a dictionary.')
+    checks = _CHECKS.get((params['channel'], params['message_type']))
+    if checks is None:
+        _raise_invalid_channel_or_type(params)
+    for check in checks:
+        check(params)
+
+
+def _raise_invalid_channel_or_type(params):
+    if params['channel'] not in Messages.valid_message_channels:
+        raise MessagesError(
+            f"""
             "{params['channel']}" is an invalid message channel. 
-            Must be one of the following types: {self.valid_message_channels}'
+            Must be one of the following types: {Messages.valid_message_channels}'
             """
-            )
-
-    def _check_valid_message_type(self, params):
-        if params['message_type'] not in self.valid_message_types[params['channel']]:
-            raise MessagesError(
-                f"""
+        )
+    raise MessagesError(
+        f"""
                 "{params['message_type']}" is not a valid message type for channel "{params["channel"]}". 
-                Must be one of the following types: {self.valid_message_types[params["channel"]]}
+                Must be one of the following types: {Messages.valid_message_types[params["channel"]]}
             """
-            )
+    )
 
-    def _check_valid_recipient(self, params):
-        if not isinstance(params['to'], str):
-            raise MessagesError(f'Message recipient ("to={params["to"]}") not in a valid format.')
-        elif params['channel'] != 'messenger' and not re.search(r'^[1-9]\d{6,14}$', params['to']):
-            raise MessagesError(
-                f'Message recipient number ("to={params["to"]}") not in a valid format.'
-            )
-        elif params['channel'] == 'messenger' and not 0 < len(params['to']) < 50:
-            raise MessagesError(
-                f'Message recipient ID ("to={params["to"]}") not in a valid format.'
-            )
 
-    def _check_valid_sender(self, params):
-        if not isinstance(params['from'], str) or params['from'] == "":
-            raise MessagesError(
-                f'Message sender ("frm={params["from"]}") set incorrectly. Set a valid name or number for the sender.'
-            )
+def _check_number_recipient(params):
+    to = params['to']
+    if not isinstance(to, str):
+        raise MessagesError(f'Message recipient ("to={to}") not in a valid format.')
+    if _PHONE_NUMBER.fullmatch(to) is None:
+        raise MessagesError(f'Message recipient number ("to={to}") not in a valid format.')
 
-    def _channel_specific_checks(self, params):
-        if (
-            (
-                params['channel'] == 'whatsapp'
-                and params['message_type'] == 'template'
-                and 'whatsapp' not in params
-            )
-            or (
-                params['channel'] == 'whatsapp'
-                and params['message_type'] == 'sticker'
-                and 'sticker' not in params
-            )
-            or (params['channel'] == 'viber_service' and 'viber_service' not in params)
-        ):
+
+def _check_id_recipient(params):
+    to = params['to']
+    if not isinstance(to, str):
+        raise MessagesError(f'Message recipient ("to={to}") not in a valid format.')
+    if not 0 < len(to) < 50:
+        raise MessagesError(f'Message recipient ID ("to={to}") not in a valid format.')
+
+
+def _check_sender(params):
+    sender = params['from']
+    if not isinstance(sender, str) or sender == "":
+        raise MessagesError(
+            f'Message sender ("frm={sender}") set incorrectly. Set a valid name or number for the sender.'
+        )
+
+
+def _require_channel_property(name):
+    def check(params):
+        if name not in params:
             raise MessagesError(
                 f'''You must specify all required properties for message channel "{params["channel"]}".'''
             )
-        elif params['channel'] == 'whatsapp' and params['message_type'] == 'sticker':
-            self._check_valid_whatsapp_sticker(params['sticker'])
 
-    def _check_valid_client_ref(self, params):
-        if 'client_ref' in params:
-            if len(params['client_ref']) <= 100:
-                self._client_ref = params['client_ref']
-            else:
-                raise MessagesError('client_ref can be a maximum of 100 characters.')
+    return check
 
-    def _check_valid_whatsapp_sticker(self, sticker):
-        if ('id' not in sticker and 'url' not in sticker) or ('id' in sticker and 'url' in sticker):
-            raise MessagesError(
-                'Must specify one, and only one, of "id" or "url" in the "sticker" field.'
-            )
+
+def _check_whatsapp_sticker(params):
+    sticker = params['sticker']
+    if ('id' not in sticker and 'url' not in sticker) or ('id' in sticker and 'url' in sticker):
+        raise MessagesError('Must specify one, and only one, of "id" or "url" in the "sticker" field.')
+
+
+def _check_client_ref(params):
+    if 'client_ref' in params and len(params['client_ref']) > 100:
+        raise MessagesError('client_ref can be a maximum of 100 characters.')
+
+
+def _build_checks(channel, message_type):
+    """Returns the checks for a channel and message type, in the order they're reported."""
+    checks = [_check_id_recipient if channel == 'messenger' else _check_number_recipient, _check_sender]
+    if channel == 'whatsapp' and message_type == 'template':
+        checks.append(_require_channel_property('whatsapp'))
+    elif channel == 'whatsapp' and message_type == 'sticker':
+        checks += [_require_channel_property('sticker'), _check_whatsapp_sticker]
+    elif channel == 'viber_service':
+        checks.append(_require_channel_property('viber_service'))
+    checks.append(_check_client_ref)
+    return tuple(checks)
+
+
+_CHECKS = {
+    (channel, message_type): _build_checks(channel, message_type)
+    for channel, message_types in Messages.valid_message_types.items()
+    for message_type in message_types
+}
@@ -1 +1,2 @@
 from .ncco import *
+from .ncco_cache import NccoCache
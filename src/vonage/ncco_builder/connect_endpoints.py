@@ -2,11 +2,15 @@ from pydantic import BaseModel, HttpUrl, AnyUrl, Field, constr
 from typing import Optional, Dict
 from typing_extensions import Literal
 
+from .fast_models import construct_fast
+
 
 class ConnectEndpoints:
     class Endpoint(BaseModel):
         type: str = None
 
+        construct_fast = classmethod(construct_fast)
+
     class PhoneEndpoint(Endpoint):
         type = Field('phone', const=True)
         number: constr(regex=r'^[1-9]\d{6,14}$')
@@ -48,3 +52,19 @@ class ConnectEndpoints:
             raise ValueError(
                 'Invalid "type" specified for endpoint object. Cannot create a ConnectEndpoints.Endpoint model.'
             )
+
+    @classmethod
+    def create_fast_endpoint_from_dict(cls, d):
+        """Creates a lightweight, unvalidated endpoint (see `Ncco.Action.construct_fast`) from a trusted dict."""
+        endpoint_models = {
+            'phone': cls.PhoneEndpoint,
+            'app': cls.AppEndpoint,
+            'websocket': cls.WebsocketEndpoint,
+            'sip': cls.SipEndpoint,
+            'vbc': cls.VbcEndpoint,
+        }
+        if d.get('type') not in endpoint_models:
+            raise ValueError(
+                'Invalid "type" specified for endpoint object. Cannot create a ConnectEndpoints.Endpoint model.'
+            )
+        return endpoint_models[d['type']].construct_fast(**d)
@@ -0,0 +1,98 @@
+from pydantic import BaseModel
+
+import keyword
+
+
+class FastModel:
+    """
+    The base class of the lightweight objects that `construct_fast` returns for an NCCO builder model.
+
+    Fast models store their fields in `__slots__` and aren't validated. Values are normalized (e.g. a URL is
+    put in a list) as the model's validators would, so a fast model serializes to the same dict and JSON.
+    """
+
+    __slots__ = ()
+    _model = None
+    _fields = ()
+
+    def dict(self, exclude_none: bool = False) -> dict:
+        result = {}
+        for name, output_name in self._fields:
+            value = getattr(self, name)
+            if value is None and exclude_none:
+                continue
+            result[output_name] = _export(value, exclude_none)
+        return result
+
+    def __repr__(self):
+        fields = ', '.join(f'{name}={getattr(self, name)!r}' for name, _ in self._fields)
+        return f'{self._model.__qualname__}.construct_fast({fields})'
+
+
+def construct_fast(cls, **values) -> FastModel:
+    """
+    Creates a lightweight, unvalidated version of the model from trusted values, e.g. values set by your
+    own code rather than taken from a request. It serializes the same as the model with `Ncco.build_ncco`
+    and `Ncco.build_ncco_json`.
+    """
+    fast_class = _fast_classes.get(cls)
+    if fast_class is None:
+        fast_class = _fast_classes[cls] = _make_fast_class(cls)
+
+    defaults = fast_class._defaults
+    fields = {name: values.get(name, default) for name, default in defaults}
+    for name, normalize in fast_class._normalizers:
+        if fields[name] is not None:
+            fields[name] = normalize(fields[name], fields)
+
+    model = object.__new__(fast_class)
+    for name, value in fields.items():
+        object.__setattr__(model, name, value)
+    return model
+
+
+def to_list(value, values=None):
+    return value if type(value) is list else [value]
+
+
+def to_upper(value, values=None):
+    return value.upper()
+
+
+def to_lower(value, values=None):
+    return value.lower()
+
+
+def _make_fast_class(model):
+    names = tuple(model.__fields__)
+    return type(
+        f'Fast{model.__name__}',
+        (FastModel,),
+        {
+            '__slots__': names,
+            '_model': model,
+            '_fields': tuple((name, _get_output_name(name)) for name in names),
+            '_defaults': tuple((name, field.default) for name, field in model.__fields__.items()),
+            '_normalizers': tuple(getattr(model, '_fast_normalizers', {}).items()),
+        },
+    )
+
+
+def _get_output_name(name):
+    """Fields named after a Python keyword (e.g. "from_") are serialized without the trailing underscore."""
+    if name.endswith('_') and keyword.iskeyword(name[:-1]):
+        return name[:-1]
+    return name
+
+
+def _export(value, exclude_none):
+    if isinstance(value, (FastModel, BaseModel)):
+        return value.dict(exclude_none=exclude_none)
+    if type(value) is list:
+        return [_export(item, exclude_none) for item in value]
+    if type(value) is dict:
+        return {key: _export(item, exclude_none) for key, item in value.items()}
+    return value
+
+
+_fast_classes = {}
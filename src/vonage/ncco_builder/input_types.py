@@ -1,6 +1,8 @@
 from pydantic import BaseModel, confloat, conint
 from typing import Optional, List
 
+from .fast_models import construct_fast
+
 
 class InputTypes:
     class Dtmf(BaseModel):
@@ -8,6 +10,8 @@ class InputTypes:
         maxDigits: Optional[conint(ge=1, le=20)]
         submitOnHash: Optional[bool]
 
+        construct_fast = classmethod(construct_fast)
+
     class Speech(BaseModel):
         uuid: Optional[str]
         endOnSilence: Optional[confloat(ge=0.4, le=10.0)]
@@ -17,6 +21,8 @@ class InputTypes:
         maxDuration: Optional[conint(ge=1, le=60)]
         saveAudio: Optional[bool]
 
+        construct_fast = classmethod(construct_fast)
+
     @classmethod
     def create_dtmf_model(cls, dict) -> Dtmf:
         return cls.Dtmf.parse_obj(dict)
@@ -3,16 +3,29 @@ from typing import Optional, Union, List
 from typing_extensions import Literal
 
 from .connect_endpoints import ConnectEndpoints
+from .fast_models import FastModel, construct_fast, to_list, to_lower, to_upper
 from .input_types import InputTypes
+from .ncco_template import NccoTemplate, Placeholder
 from .pay_prompts import PayPrompts
 
 from deprecated import deprecated
 
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 
 class Ncco:
+    Placeholder = Placeholder
+
     class Action(BaseModel):
         action: str = None
 
+        construct_fast = classmethod(construct_fast)
+
     class Record(Action):
         """Use the record action to record a call or part of a call."""
 
@@ -27,6 +40,12 @@ class Ncco:
         eventUrl: Optional[Union[List[str], str]]
         eventMethod: Optional[constr(to_upper=True)]
 
+        _fast_normalizers = {
+            'channels': lambda v, values: _enable_split_fast(v, values),
+            'eventUrl': to_list,
+            'eventMethod': to_upper,
+        }
+
         @validator('channels')
         def enable_split(cls, v, values):
             if values['split'] is None:
@@ -52,6 +71,8 @@ class Ncco:
         canHear: Optional[List[str]]
         mute: Optional[bool]
 
+        _fast_normalizers = {'musicOnHoldUrl': to_list}
+
         @validator('musicOnHoldUrl')
         def ensure_url_in_list(cls, v):
             return Ncco._ensure_object_in_list(v)
@@ -78,6 +99,12 @@ class Ncco:
         eventMethod: Optional[constr(to_upper=True)]
         ringbackTone: Optional[str]
 
+        _fast_normalizers = {
+            'endpoint': lambda v, values: _endpoint_to_list_fast(v),
+            'eventUrl': to_list,
+            'eventMethod': to_upper,
+        }
+
         @validator('endpoint')
         def validate_endpoint(cls, v):
             if type(v) is dict:
@@ -140,6 +167,8 @@ class Ncco:
         bargeIn: Optional[bool]
         loop: Optional[conint(ge=0)]
 
+        _fast_normalizers = {'streamUrl': to_list}
+
         @validator('streamUrl')
         def ensure_url_in_list(cls, v):
             return Ncco._ensure_object_in_list(v)
@@ -159,6 +188,14 @@ class Ncco:
         eventUrl: Optional[Union[List[str], str]]
         eventMethod: Optional[constr(to_upper=True)]
 
+        _fast_normalizers = {
+            'type': to_list,
+            'dtmf': lambda v, values: _dict_to_model_fast(InputTypes.Dtmf, v),
+            'speech': lambda v, values: _dict_to_model_fast(InputTypes.Speech, v),
+            'eventUrl': to_list,
+            'eventMethod': to_upper,
+        }
+
         @validator('type', 'eventUrl')
         def ensure_value_in_list(cls, v):
             return Ncco._ensure_object_in_list(v)
@@ -185,6 +222,8 @@ class Ncco:
         eventUrl: Union[List[str], str]
         eventMethod: Optional[constr(to_upper=True)]
 
+        _fast_normalizers = {'eventUrl': to_list, 'eventMethod': to_upper}
+
         @validator('eventUrl')
         def ensure_url_in_list(cls, v):
             return Ncco._ensure_object_in_list(v)
@@ -200,6 +239,14 @@ class Ncco:
         prompts: Optional[Union[List[PayPrompts.TextPrompt], PayPrompts.TextPrompt, dict]]
         voice: Optional[Union[PayPrompts.VoicePrompt, dict]]
 
+        _fast_normalizers = {
+            'amount': lambda v, values: round(v, 2),
+            'currency': to_lower,
+            'eventUrl': to_list,
+            'prompts': lambda v, values: _dict_to_model_fast(PayPrompts.TextPrompt, v),
+            'voice': lambda v, values: _dict_to_model_fast(PayPrompts.VoicePrompt, v),
+        }
+
         @validator('amount')
         def round_amount(cls, v):
             return round(v, 2)
@@ -232,9 +279,118 @@ class Ncco:
             ncco.append(action.dict(exclude_none=True))
         return ncco
 
+    @staticmethod
+    def build_ncco_json(*args: Action, actions: List[Action] = None) -> bytes:
+        """
+        Builds the actions into an NCCO, like `build_ncco`, and returns it as UTF-8 encoded JSON.
+        The actions are serialized directly, and with orjson if it's installed (`pip install vonage[orjson]`).
+        """
+        ncco = []
+        if actions is not None:
+            for action in actions:
+                ncco.append(_to_json_value(action))
+        for action in args:
+            ncco.append(_to_json_value(action))
+        return _dump_json(ncco)
+
+    @staticmethod
+    def compile_template(*args: Action, actions: List[Action] = None) -> NccoTemplate:
+        """
+        Builds the actions into an NCCO once, and returns a template that renders it as JSON with the
+        values of any `Ncco.Placeholder`s used in the actions filled in.
+        """
+        return NccoTemplate(Ncco.build_ncco(*args, actions=actions))
+
     @staticmethod
     def _ensure_object_in_list(obj):
         if type(obj) != list:
             return [obj]
         else:
             return obj
+
+
+def _enable_split_fast(channels, values):
+    if values['split'] is None:
+        values['split'] = 'conversation'
+    return channels
+
+
+def _endpoint_to_list_fast(endpoint):
+    """Puts an endpoint in a list, like `Ncco.Connect` does. Only the first of a list of endpoints is used."""
+    if type(endpoint) is list:
+        endpoint = endpoint[0]
+    if type(endpoint) is dict:
+        endpoint = ConnectEndpoints.create_fast_endpoint_from_dict(endpoint)
+    return [endpoint]
+
+
+def _dict_to_model_fast(model, value):
+    return model.construct_fast(**value) if type(value) is dict else value
+
+
+def _model_to_dict(model: BaseModel) -> dict:
+    """
+    Returns the same dict as `model.dict(exclude_none=True)`, without pydantic's per-field export options.
+    A model's `__dict__` holds its fields in order (and the "from" field that `Ncco.Connect` sets).
+    """
+    result = {}
+    for name, value in model.__dict__.items():
+        if value is None:
+            continue
+        converter = _converters.get(type(value), _convert_new_type)
+        result[name] = value if converter is None else converter(value)
+    return result
+
+
+def _to_json_value(value):
+    converter = _converters.get(type(value), _convert_new_type)
+    return value if converter is None else converter(value)
+
+
+def _convert_new_type(value):
+    """
+    Converts a value of a type that hasn't been seen before, and caches the converter for its type:
+    None if values of the type can be used as they are.
+    """
+    value_type = type(value)
+    if issubclass(value_type, BaseModel):
+        converter = _model_to_dict
+    elif issubclass(value_type, FastModel):
+        converter = _fast_model_to_dict
+    elif issubclass(value_type, dict):
+        converter = _dict_to_json
+    elif issubclass(value_type, (list, tuple)):
+        converter = _list_to_json
+    else:
+        converter = None
+    _converters[value_type] = converter
+    return _to_json_value(value)
+
+
+def _fast_model_to_dict(model: FastModel) -> dict:
+    result = {}
+    for name, output_name in model._fields:
+        value = getattr(model, name)
+        if value is None:
+            continue
+        converter = _converters.get(type(value), _convert_new_type)
+        result[output_name] = value if converter is None else converter(value)
+    return result
+
+
+def _dict_to_json(value):
+    return {key: _to_json_value(item) for key, item in value.items()}
+
+
+def _list_to_json(value):
+    return [_to_json_value(item) for item in value]
+
+
+# The converter for each type of value found in a model, or None for types (e.g. str) that need no conversion
+_converters = {str: None, bool: None, int: None, float: None}
+
+
+def _dump_json(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
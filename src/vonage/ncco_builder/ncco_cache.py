@@ -0,0 +1,48 @@
+from typing import Callable, List
+
+from ..cache import TTLCache
+from .ncco import Ncco
+
+
+class NccoCache:
+    """
+    Caches NCCOs serialized as JSON bytes, for answer webhooks that return the same few NCCOs to many calls.
+
+    NCCOs are cached by a key you choose (e.g. "main_menu"), so the actions are only created, validated
+    and serialized the first time the key is used. Include anything the NCCO depends on in the key, e.g.
+    `("hold_music", language)`.
+
+    The least recently used NCCO is evicted when the cache is full.
+
+    :param int maxsize: The maximum number of NCCOs to cache.
+    :param int max_ncco_bytes: (optional) NCCOs larger than this many bytes are built but not cached.
+    :param float ttl: (optional) The number of seconds to cache an NCCO for. By default, NCCOs are cached
+        until they're evicted.
+    """
+
+    def __init__(self, maxsize: int = 256, max_ncco_bytes: int = 64 * 1024, ttl: float = None):
+        self.max_ncco_bytes = max_ncco_bytes
+        self._nccos = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def get_or_build(self, key, build_actions: Callable[[], List]) -> bytes:
+        """
+        Returns the NCCO cached for `key`, or calls `build_actions` to create the NCCO's actions,
+        then builds and caches it with `Ncco.build_ncco_json`.
+        """
+        ncco_json = self._nccos.get(key)
+        if ncco_json is None:
+            ncco_json = Ncco.build_ncco_json(actions=build_actions())
+            if self.max_ncco_bytes is None or len(ncco_json) <= self.max_ncco_bytes:
+                self._nccos.set(key, ncco_json)
+        return ncco_json
+
+    def invalidate(self, key):
+        """Removes the NCCO cached for `key`, so it's built again the next time it's used."""
+        self._nccos.pop(key)
+
+    def clear(self):
+        self._nccos.clear()
+
+    @property
+    def stats(self) -> dict:
+        return self._nccos.stats
@@ -0,0 +1,95 @@
+from typing import List
+
+import json
+import re
+
+# Placeholders are marked with characters from Unicode's private use area, which NCCOs don't contain
+_PLACEHOLDER_START = '\ue000'
+_PLACEHOLDER_SEPARATOR = '\ue002'
+_PLACEHOLDER_END = '\ue001'
+# The name is also encoded as private use characters, which case conversions (e.g. of an `eventMethod`)
+# don't change, so a placeholder whose name was changed by a field's validator can be detected
+_ENCODED_NAME_OFFSET = 0xF0000
+_MARKED_NAME = (
+    f'{_PLACEHOLDER_START}([^{_PLACEHOLDER_SEPARATOR}]*){_PLACEHOLDER_SEPARATOR}'
+    f'([\U000F0000-\U000F007F]+){_PLACEHOLDER_END}'
+)
+# A placeholder in quotes is the whole value of a field, otherwise it's part of a longer string
+_PLACEHOLDER = re.compile(f'"{_MARKED_NAME}"|{_MARKED_NAME}')
+
+
+class Placeholder(str):
+    """
+    A named value to fill in when an NccoTemplate is rendered.
+
+    A placeholder can be passed as the whole value of a string field (e.g. `eventUrl` or a conversation's `name`),
+    or be formatted into a longer string, e.g. `f'Hello {Ncco.Placeholder("caller_name")}'`. Placeholders can't
+    be used in fields whose values are transformed when they're validated, e.g. `eventMethod`, which is
+    upper-cased.
+    """
+
+    def __new__(cls, name: str):
+        if not re.fullmatch(r'\w+', name, re.ASCII):
+            raise ValueError(f'Invalid placeholder name "{name}". Use only letters, digits and underscores.')
+        encoded_name = ''.join(chr(_ENCODED_NAME_OFFSET + ord(char)) for char in name)
+        placeholder = super().__new__(
+            cls,
+            f'{_PLACEHOLDER_START}{name}{_PLACEHOLDER_SEPARATOR}{encoded_name}{_PLACEHOLDER_END}',
+        )
+        placeholder.name = name
+        return placeholder
+
+
+def _decode_name(marked_name, encoded_name):
+    """Returns a placeholder's name, checking that the field it's in didn't change it."""
+    name = ''.join(chr(ord(char) - _ENCODED_NAME_OFFSET) for char in encoded_name)
+    if marked_name != name:
+        raise ValueError(
+            f'Placeholder "{name}" was changed to "{marked_name}" when its action was validated. '
+            'Placeholders can\'t be used in fields whose values are transformed, e.g. "eventMethod".'
+        )
+    return name
+
+
+class NccoTemplate:
+    """
+    An NCCO that has been validated once, with named placeholders that are filled in when it's rendered.
+
+    Rendering only substitutes the placeholders' values into the NCCO's JSON, so the actions aren't
+    built or validated again. Values that fill a whole field are encoded as JSON values, and values
+    formatted into a longer string are escaped as part of that string.
+    """
+
+    def __init__(self, ncco: List[dict]):
+        self._parts = []
+        self.placeholders = set()
+        position = 0
+        text = json.dumps(ncco, ensure_ascii=False)
+        for match in _PLACEHOLDER.finditer(text):
+            whole_value_marked, whole_value_encoded, marked_name, encoded_name = match.groups()
+            is_whole_value = whole_value_encoded is not None
+            if is_whole_value:
+                name = _decode_name(whole_value_marked, whole_value_encoded)
+            else:
+                name = _decode_name(marked_name, encoded_name)
+            self._parts.append(text[position : match.start()])
+            self._parts.append((name, is_whole_value))
+            self.placeholders.add(name)
+            position = match.end()
+        self._parts.append(text[position:])
+
+    def render(self, **values) -> str:
+        """Returns the NCCO as a JSON string, with each placeholder replaced by the value passed for it."""
+        missing = self.placeholders.difference(values)
+        if missing:
+            raise ValueError(f'No values passed for placeholders: {sorted(missing)}')
+
+        rendered = []
+        for part in self._parts:
+            if type(part) is str:
+                rendered.append(part)
+            elif part[1]:
+                rendered.append(json.dumps(values[part[0]], ensure_ascii=False))
+            else:
+                rendered.append(json.dumps(str(values[part[0]]), ensure_ascii=False)[1:-1])
+        return ''.join(rendered)
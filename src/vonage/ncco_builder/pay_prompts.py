@@ -2,12 +2,16 @@ from pydantic import BaseModel, validator
 from typing import Optional, Dict
 from typing_extensions import Literal
 
+from .fast_models import construct_fast
+
 
 class PayPrompts:
     class VoicePrompt(BaseModel):
         language: Optional[str]
         style: Optional[int]
 
+        construct_fast = classmethod(construct_fast)
+
     class TextPrompt(BaseModel):
         type: Literal['CardNumber', 'ExpirationDate', 'SecurityCode']
         text: str
@@ -22,6 +26,8 @@ class PayPrompts:
             Dict[Literal['text'], str],
         ]
 
+        construct_fast = classmethod(construct_fast)
+
         @validator('errors')
         def check_valid_error_format(cls, v, values):
             if values['type'] == 'CardNumber':
@@ -1,4 +1,8 @@
-from .errors import CallbackRequiredError
+from ._internal import map_concurrently
+from .errors import CallbackRequiredError, NumberInsightError
+from .rate_limiter import TokenBucket
+
+from time import sleep
 
 
 class NumberInsight:
@@ -8,28 +12,79 @@ class NumberInsight:
         self._client = client
 
     def get_basic_number_insight(self, params=None, **kwargs):
-        return self._client.get(
-            self._client.api_host(),
-            "/ni/basic/json",
-            params or kwargs,
-            auth_type=NumberInsight.auth_type,
-        )
+        return self._get_insight('basic', params or kwargs)
 
     def get_standard_number_insight(self, params=None, **kwargs):
-        return self._client.get(
-            self._client.api_host(),
-            "/ni/standard/json",
-            params or kwargs,
-            auth_type=NumberInsight.auth_type,
-        )
+        return self._get_insight('standard', params or kwargs)
 
     def get_advanced_number_insight(self, params=None, **kwargs):
-        return self._client.get(
+        return self._get_insight('advanced', params or kwargs)
+
+    def get_number_insights(
+        self,
+        numbers,
+        level: str = 'basic',
+        max_workers: int = 10,
+        requests_per_second: float = None,
+        **params,
+    ):
+        """
+        Looks up many numbers concurrently, over the client's connection pool.
+
+        Each distinct number is looked up once, however many times it appears in `numbers`. Returns a
+        generator that yields `(number, insight)` tuples as each lookup completes. If a lookup raises an
+        error, the error is yielded instead of the insight. `numbers` can be a lazy iterator, as only a
+        bounded number of lookups are queued at once.
+
+        :param numbers: An iterable of numbers to look up.
+        :param str level: The level of insight to get: "basic", "standard" or "advanced".
+        :param int max_workers: The number of lookups that can be in flight at once.
+        :param float requests_per_second: (optional) The maximum rate to make lookups at. Lookups also
+            respect the client's `rate_limiter`, if it has one.
+        :param params: Other parameters to send with each lookup, e.g. `cnam=True`.
+        """
+        lookup = self._get_lookup_method(level)
+        bucket = TokenBucket(requests_per_second) if requests_per_second else None
+
+        def get_insight(number):
+            if bucket is not None:
+                bucket.acquire()
+            return lookup(dict(params, number=number))
+
+        unique_numbers = []
+        results = map_concurrently(
+            get_insight, _unique(numbers, unique_numbers), max_workers=max_workers
+        )
+        return _key_by_number(results, unique_numbers)
+
+    def _get_insight(self, level, params):
+        cache = self._client.number_insight_cache
+        if cache is not None:
+            insight = cache.get(level, params)
+            if insight is not None:
+                return insight
+
+        insight = self._client.get(
             self._client.api_host(),
-            "/ni/advanced/json",
-            params or kwargs,
+            f'/ni/{level}/json',
+            params,
             auth_type=NumberInsight.auth_type,
         )
+        if cache is not None:
+            cache.set(level, params, insight)
+        return insight
+
+    def _get_lookup_method(self, level):
+        lookup_methods = {
+            'basic': self.get_basic_number_insight,
+            'standard': self.get_standard_number_insight,
+            'advanced': self.get_advanced_number_insight,
+        }
+        if level not in lookup_methods:
+            raise NumberInsightError(
+                f'Invalid insight level "{level}". Must be one of {list(lookup_methods)}.'
+            )
+        return lookup_methods[level]
 
     def get_async_advanced_number_insight(self, params=None, **kwargs):
         argoparams = params or kwargs
@@ -46,3 +101,22 @@ class NumberInsight:
             )
         else:
             raise CallbackRequiredError("A callback is needed for async advanced number insight")
+
+
+def _unique(numbers, seen_numbers: list):
+    """Yields each distinct number once, appending it to `seen_numbers`."""
+    seen = set()
+    for number in numbers:
+        if number not in seen:
+            seen.add(number)
+            seen_numbers.append(number)
+            yield number
+
+
+def _key_by_number(results, unique_numbers):
+    """Replaces the index in each `(index, result)` tuple with the number that was looked up."""
+    try:
+        for index, result in results:
+            yield unique_numbers[index], result
+    finally:
+        results.close()
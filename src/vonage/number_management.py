@@ -10,6 +10,29 @@ class Numbers:
             self._client.host(), "/account/numbers", params or kwargs, auth_type=Numbers.auth_type
         )
 
+    def iter_account_numbers(self, params=None, prefetch=False, **kwargs):
+        """
+        Yields every number owned by the account that matches the filters in `params`, which are the same
+        as for `get_account_numbers`. The `size` filter sets the number of numbers fetched in each page.
+        """
+        params = dict(params or kwargs)
+        size = int(params.get('size', 10))
+
+        def fetch_page(index):
+            return self.get_account_numbers(dict(params, index=index))
+
+        def get_next_index(page, numbers, index):
+            if index * size < page.get('count', 0):
+                return index + 1
+
+        return self._client._iterate_pages(
+            fetch_page,
+            lambda page: page.get('numbers', []),
+            get_next_index,
+            state=params.pop('index', 1),
+            prefetch=prefetch,
+        )
+
     def get_available_numbers(self, country_code, params=None, **kwargs):
         return self._client.get(
             self._client.host(),
@@ -0,0 +1,172 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, NamedTuple, Optional
+
+if TYPE_CHECKING:
+    from vonage import Account
+
+from decimal import Decimal, InvalidOperation
+from threading import Event, Lock, Thread
+from time import time
+
+import logging
+
+from .errors import PricingTypeError
+
+logger = logging.getLogger("vonage")
+
+
+class Price(NamedTuple):
+    """The price of sending a message or making a call to a number, as found by a PricingIndex."""
+
+    price: Decimal
+    currency: str
+    prefix: str
+    country_code: str
+    country_name: str
+    network_code: Optional[str] = None
+    network_name: Optional[str] = None
+
+
+class PricingIndex:
+    """
+    A local copy of your account's outbound pricing, to price numbers without calling the Pricing API.
+
+    The full pricing table for each type is downloaded once with `Account.get_all_countries_pricing`, and
+    numbers are then matched to the longest prefix in the table. Networks that list their own number
+    prefixes are matched by those prefixes, other numbers are priced at their country's default price.
+    Where countries share a dialing prefix (e.g. "1"), the most expensive country's price is used.
+
+    :param Account account: The Account API to download pricing with, e.g. `client.account`.
+    :param types: The pricing types to index. Each type is downloaded the first time it is used.
+    :param float refresh_interval: The number of seconds between refreshes, once `start_refreshing`
+        is called. Defaults to a day.
+    """
+
+    def __init__(
+        self,
+        account: Account,
+        types=('sms', 'sms-transit', 'voice'),
+        refresh_interval: float = 24 * 60 * 60,
+    ):
+        for type in types:
+            account._check_allowed_pricing_type(type)
+        self._account = account
+        self.types = tuple(types)
+        self.refresh_interval = refresh_interval
+        self.refreshed_at = {}
+        self._tries = {}
+        self._lock = Lock()
+        self._stop_refreshing = Event()
+        self._refresh_thread = None
+
+    def get_price(self, number: str, type: str = 'sms') -> Optional[Price]:
+        """Returns the price for `number`, or `None` if no prefix in the pricing table matches it."""
+        trie = self._tries.get(type)
+        if trie is None:
+            trie = self._load(type)
+
+        node = trie
+        match = None
+        for digit in number:
+            if not digit.isdigit():
+                continue
+            node = node.get(digit)
+            if node is None:
+                break
+            match = node.get(None, match)
+        return match
+
+    def refresh(self, types=None):
+        """
+        Downloads the pricing table for each of `types` (by default, every indexed type) and replaces that
+        type's index once it's built, so lookups keep using the previous table until then.
+        """
+        for type in types or self.types:
+            self._load(type, force=True)
+
+    def start_refreshing(self):
+        """Refreshes the index every `refresh_interval` seconds in a background thread."""
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            return
+        self._stop_refreshing.clear()
+        self._refresh_thread = Thread(target=self._refresh_periodically, daemon=True)
+        self._refresh_thread.start()
+
+    def stop_refreshing(self):
+        self._stop_refreshing.set()
+        if self._refresh_thread is not None:
+            self._refresh_thread.join()
+            self._refresh_thread = None
+
+    def _load(self, type, force=False):
+        if type not in self.types:
+            self._account._check_allowed_pricing_type(type)
+            raise PricingTypeError(f'Pricing type "{type}" is not in this index.')
+        if not force and type in self._tries:
+            return self._tries[type]
+        # The table is downloaded and indexed without holding the lock, so lookups of other types (and
+        # of this type, once it's loaded) aren't blocked. Threads loading the same type for the first
+        # time may each download it, but only the first index built is kept.
+        pricing = self._account.get_all_countries_pricing(type)
+        trie = _build_trie(pricing.get('countries', []))
+        with self._lock:
+            if not force and type in self._tries:
+                return self._tries[type]
+            self._tries[type] = trie
+            self.refreshed_at[type] = time()
+        logger.debug(f'Indexed {type} pricing for {len(pricing.get("countries", []))} countries')
+        return trie
+
+    def _refresh_periodically(self):
+        while not self._stop_refreshing.wait(self.refresh_interval):
+            for type in self.types:
+                try:
+                    self._load(type, force=True)
+                except Exception as err:
+                    logger.warning(f'Failed to refresh {type} pricing, using the previous table: {err}')
+
+
+def _build_trie(countries):
+    trie = {}
+    for country in countries:
+        prefix = country.get('dialingPrefix')
+        networks = country.get('networks', [])
+        default_price = country.get('defaultPrice') or max(
+            (network.get('price') for network in networks), key=_to_decimal, default=None
+        )
+        if prefix and default_price is not None:
+            _insert(trie, prefix, _make_price(country, country, prefix, default_price))
+
+        for network in networks:
+            for network_prefix in network.get('prefixes', []):
+                _insert(trie, network_prefix, _make_price(country, network, network_prefix))
+    return trie
+
+
+def _make_price(country, entry, prefix, price=None):
+    is_network = entry is not country
+    return Price(
+        price=_to_decimal(price if price is not None else entry.get('price')),
+        currency=entry.get('currency') or country.get('currency'),
+        prefix=prefix,
+        country_code=country.get('countryCode'),
+        country_name=country.get('countryName'),
+        network_code=entry.get('networkCode') if is_network else None,
+        network_name=entry.get('networkName') if is_network else None,
+    )
+
+
+def _insert(trie, prefix, price):
+    node = trie
+    for digit in prefix:
+        node = node.setdefault(digit, {})
+    existing = node.get(None)
+    if existing is None or price.price > existing.price:
+        node[None] = price
+
+
+def _to_decimal(value):
+    try:
+        return Decimal(str(value))
+    except InvalidOperation:
+        return Decimal(0)
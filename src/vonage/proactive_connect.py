@@ -1,11 +1,19 @@
 from .errors import ProactiveConnectError
 
-import requests
+import codecs
+import csv
+import io
 import logging
+from functools import partial
+from itertools import chain, islice
 from typing import List
+from uuid import uuid4
 
 logger = logging.getLogger("vonage")
 
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
 
 class ProactiveConnect:
     def __init__(self, client):
@@ -21,6 +29,10 @@ class ProactiveConnect:
             auth_type=self._auth_type,
         )
 
+    def iter_all_lists(self, page_size: int = None, prefetch: bool = False):
+        """Yields every list, fetching pages of lists as they are needed."""
+        return self._iterate_pages(self.list_all_lists, 'lists', page_size, prefetch)
+
     def create_list(self, params: dict):
         self._validate_list_params(params)
         return self._client.post(
@@ -78,6 +90,12 @@ class ProactiveConnect:
             auth_type=self._auth_type,
         )
 
+    def iter_all_items(self, list_id: str, page_size: int = None, prefetch: bool = False):
+        """Yields every item in a list, fetching pages of items as they are needed."""
+        return self._iterate_pages(
+            partial(self.list_all_items, list_id), 'items', page_size, prefetch
+        )
+
     def create_item(self, list_id: str, data: dict):
         params = {'data': data}
         return self._client.post(
@@ -110,39 +128,118 @@ class ProactiveConnect:
             auth_type=self._auth_type,
         )
 
-    def download_list_items(self, list_id: str, file_path: str) -> List[dict]:
-        uri = f'https://{self._client.proactive_connect_host()}/v0.1/bulk/lists/{list_id}/items/download'
-        logger.debug(
-            f'GET request with Proactive Connect to {repr(uri)}, downloading items from list {list_id} to file {file_path}'
-        )
-        headers = {**self._client.headers, 'Authorization': self._client._create_jwt_auth_string()}
-        response = requests.get(
-            uri,
-            headers=headers,
+    def download_list_items(
+        self,
+        list_id: str,
+        file_path,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        on_progress=None,
+    ):
+        """
+        Downloads the items in a list as CSV to `file_path`, which can be a path or a writable binary file.
+
+        The download is streamed to the file in chunks of `chunk_size` bytes, so memory use doesn't grow with
+        the size of the list. `on_progress` is called after each chunk with the number of bytes downloaded
+        so far and the total number of bytes (or `None` if the server didn't send a Content-Length).
+        """
+        with self._request_list_items(list_id) as response:
+            if not 200 <= response.status_code < 300:
+                return self._client.parse(self._client.proactive_connect_host(), response)
+
+            chunks = _track_progress(response, response.iter_content(chunk_size), on_progress)
+            if hasattr(file_path, 'write'):
+                for chunk in chunks:
+                    file_path.write(chunk)
+            else:
+                with open(file_path, 'wb') as file:
+                    for chunk in chunks:
+                        file.write(chunk)
+
+    def iter_list_items(
+        self, list_id: str, chunk_size: int = DOWNLOAD_CHUNK_SIZE, on_progress=None
+    ):
+        """
+        Downloads the items in a list and yields each item as a dict, keyed by the CSV's header row.
+        Items are parsed as the download is streamed, so the whole list is never held in memory.
+        """
+        with self._request_list_items(list_id) as response:
+            if not 200 <= response.status_code < 300:
+                self._client.parse(self._client.proactive_connect_host(), response)
+                return
+
+            parser = _CsvItemParser()
+            for chunk in _track_progress(response, response.iter_content(chunk_size), on_progress):
+                yield from parser.feed(chunk)
+            yield from parser.close()
+
+    def _request_list_items(self, list_id):
+        uri, headers = self._build_download_request(list_id, self._client._create_jwt_auth_string())
+        return self._client.session.get(
+            uri, headers=headers, stream=True, timeout=self._client.timeout
         )
-        if 200 <= response.status_code < 300:
-            with open(file_path, 'wb') as file:
-                file.write(response.content)
-        else:
-            return self._client.parse(self._client.proactive_connect_host(), response)
+
+    def _build_download_request(self, list_id, auth):
+        uri = f'https://{self._client.proactive_connect_host()}/v0.1/bulk/lists/{list_id}/items/download'
+        logger.debug(f'GET request with Proactive Connect to {repr(uri)}, downloading items from list {list_id}')
+        headers = {**self._client.headers, 'Authorization': auth}
+        return uri, headers
 
     def upload_list_items(self, list_id: str, file_path: str):
-        uri = f'https://{self._client.proactive_connect_host()}/v0.1/bulk/lists/{list_id}/items/import'
+        uri, headers = self._build_upload_request(list_id, self._client._create_jwt_auth_string())
         with open(file_path, 'rb') as csv_file:
             logger.debug(
                 f'POST request with Proactive Connect uploading {file_path} to {repr(uri)}'
             )
-            headers = {
-                **self._client.headers,
-                'Authorization': self._client._create_jwt_auth_string(),
-            }
-            response = requests.post(
+            response = self._client.session.post(
                 uri,
                 headers=headers,
                 files={'file': ('list_items.csv', csv_file, 'text/csv')},
+                timeout=self._client.timeout,
             )
         return self._client.parse(self._client.proactive_connect_host(), response)
 
+    def upload_list_items_from_rows(
+        self, list_id: str, rows, fieldnames: List[str] = None, batch_size: int = None
+    ) -> List[dict]:
+        """
+        Uploads items to a list from an iterable of dicts (e.g. rows from a database cursor), without
+        writing them to a file first. The rows are encoded as CSV while the request body is streamed,
+        so only a small buffer of rows is held in memory at once.
+
+        :param list rows: The items to upload, as dicts keyed by column name.
+        :param list fieldnames: (optional) The CSV's columns. Defaults to the keys of the first row. Keys of
+            other rows that aren't in `fieldnames` are left out, and missing keys are left empty.
+        :param int batch_size: (optional) The maximum number of rows to upload in each import request.
+            If not set, all rows are uploaded in a single request.
+        :return: The response to each import request.
+        """
+        if batch_size is not None and batch_size < 1:
+            raise ProactiveConnectError('"batch_size" must be at least 1.')
+
+        rows = iter(rows)
+        results = []
+        row = next(rows, None)
+        while row is not None:
+            encoder = _CsvMultipartEncoder(fieldnames or list(row))
+            batch = chain([row], rows if batch_size is None else islice(rows, batch_size - 1))
+            uri, headers = self._build_upload_request(
+                list_id, self._client._create_jwt_auth_string(), encoder.content_type
+            )
+            logger.debug(f'POST request with Proactive Connect streaming list items to {repr(uri)}')
+            response = self._client.session.post(
+                uri, headers=headers, data=encoder.iter_chunks(batch), timeout=self._client.timeout
+            )
+            results.append(self._client.parse(self._client.proactive_connect_host(), response))
+            row = next(rows, None)
+        return results
+
+    def _build_upload_request(self, list_id, auth, content_type=None):
+        uri = f'https://{self._client.proactive_connect_host()}/v0.1/bulk/lists/{list_id}/items/import'
+        headers = {**self._client.headers, 'Authorization': auth}
+        if content_type is not None:
+            headers['Content-Type'] = content_type
+        return uri, headers
+
     def list_events(self, page: int = None, page_size: int = None):
         params = self._check_pagination_params(page, page_size)
         return self._client.get(
@@ -152,6 +249,23 @@ class ProactiveConnect:
             auth_type=self._auth_type,
         )
 
+    def iter_events(self, page_size: int = None, prefetch: bool = False):
+        """Yields every event, fetching pages of events as they are needed."""
+        return self._iterate_pages(self.list_events, 'events', page_size, prefetch)
+
+    def _iterate_pages(self, list_page, embedded_key: str, page_size: int, prefetch: bool):
+        def get_next_page(page, items, page_number):
+            if page.get('page', page_number) < page.get('total_pages', 0):
+                return page.get('page', page_number) + 1
+
+        return self._client._iterate_pages(
+            lambda page_number: list_page(page=page_number, page_size=page_size),
+            lambda page: page.get('_embedded', {}).get(embedded_key, []),
+            get_next_page,
+            state=1,
+            prefetch=prefetch,
+        )
+
     def _check_pagination_params(self, page: int = None, page_size: int = None) -> dict:
         params = {}
         if page is not None:
@@ -185,3 +299,116 @@ class ProactiveConnect:
             raise ProactiveConnectError(
                 'You must supply values for "integration_id" and "soql" as strings.'
             )
+
+
+def _track_progress(response, chunks, on_progress):
+    """
+    Yields the chunks of a streamed download, calling `on_progress` after each one with the number of bytes
+    downloaded so far and the total number of bytes (or `None` if the response has no Content-Length).
+    """
+    total = _get_content_length(response)
+    downloaded = 0
+    for chunk in chunks:
+        downloaded += len(chunk)
+        if on_progress is not None:
+            on_progress(downloaded, total)
+        yield chunk
+
+
+def _get_content_length(response):
+    content_length = response.headers.get('Content-Length')
+    return int(content_length) if content_length else None
+
+
+class _CsvItemParser:
+    """
+    Parses the chunks of a streamed CSV download into dicts, keyed by the CSV's header row.
+
+    Chunks are split into complete records before they are parsed, as a record can be split across
+    chunks and a quoted field can contain newlines. A record is complete at a newline once it holds
+    an even number of quote characters.
+    """
+
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder('utf-8-sig')()
+        self._record = ''
+        self._quotes = 0
+        self._fieldnames = None
+
+    def feed(self, chunk: bytes) -> List[dict]:
+        *lines, last_line = self._decoder.decode(chunk).split('\n')
+        records = []
+        for line in lines:
+            self._record += line + '\n'
+            self._quotes += line.count('"')
+            if self._quotes % 2 == 0:
+                records.append(self._record)
+                self._record = ''
+                self._quotes = 0
+        self._record += last_line
+        self._quotes += last_line.count('"')
+        return self._parse(records)
+
+    def close(self) -> List[dict]:
+        record = self._record + self._decoder.decode(b'', final=True)
+        self._record = ''
+        self._quotes = 0
+        return self._parse([record] if record else [])
+
+    def _parse(self, records):
+        items = []
+        for row in csv.reader(records):
+            if not row:
+                continue
+            if self._fieldnames is None:
+                self._fieldnames = row
+            else:
+                items.append(dict(zip(self._fieldnames, row)))
+        return items
+
+
+class _CsvMultipartEncoder:
+    """
+    Encodes rows as a CSV file in a multipart/form-data request body, a chunk at a time,
+    so the body can be streamed while the rows are read.
+    """
+
+    def __init__(self, fieldnames: List[str], chunk_size: int = UPLOAD_CHUNK_SIZE):
+        self.boundary = uuid4().hex
+        self.content_type = f'multipart/form-data; boundary={self.boundary}'
+        self.chunk_size = chunk_size
+        self._buffer = io.StringIO()
+        # Rows are only seen once the body is being streamed, so a row with an unknown key can't be
+        # rejected before the request is sent. Unknown keys are dropped instead.
+        self._writer = csv.DictWriter(self._buffer, fieldnames, extrasaction='ignore')
+
+    def start(self) -> bytes:
+        self._writer.writeheader()
+        part_headers = (
+            f'--{self.boundary}\r\n'
+            'Content-Disposition: form-data; name="file"; filename="list_items.csv"\r\n'
+            'Content-Type: text/csv\r\n\r\n'
+        )
+        return part_headers.encode() + self._flush()
+
+    def write(self, row: dict) -> bytes:
+        """Adds a row to the body. Returns the next chunk of the body once enough rows are buffered, otherwise b''."""
+        self._writer.writerow(row)
+        return self._flush() if self._buffer.tell() >= self.chunk_size else b''
+
+    def finish(self) -> bytes:
+        return self._flush() + f'\r\n--{self.boundary}--\r\n'.encode()
+
+    def iter_chunks(self, rows):
+        yield self.start()
+        for row in rows:
+            chunk = self.write(row)
+            if chunk:
+                yield chunk
+        yield self.finish()
+
+    def _flush(self):
+        data = self._buffer.getvalue().encode()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return data
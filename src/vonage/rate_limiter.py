@@ -0,0 +1,210 @@
+from ._internal import match_route
+
+from threading import Lock
+from time import monotonic, sleep, time
+
+import asyncio
+import json
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket that paces calls to an average `rate` per second.
+
+    Up to `capacity` calls can be made at once before callers have to wait. Each call to `reserve`
+    takes a token straight away and returns how long the caller must wait before using it, so callers
+    are served in the order they ask, even when they are waiting.
+
+    :param float rate: The number of tokens added to the bucket per second.
+    :param float capacity: (optional) The maximum number of tokens the bucket holds. Defaults to `rate`
+        (or 1, if `rate` is less than 1).
+    """
+
+    def __init__(self, rate: float, capacity: float = None):
+        if rate <= 0:
+            raise ValueError('"rate" must be greater than 0.')
+        self.rate = rate
+        self.capacity = capacity or max(rate, 1)
+        self._tokens = self.capacity
+        self._updated_at = monotonic()
+        self._lock = Lock()
+
+    def reserve(self, tokens: float = 1) -> float:
+        """Takes `tokens` from the bucket and returns the number of seconds to wait before using them."""
+        with self._lock:
+            now = monotonic()
+            self._tokens, delay = _take_tokens(
+                self._tokens, self._updated_at, now, self.rate, self.capacity, tokens
+            )
+            self._updated_at = now
+            return delay
+
+    def acquire(self, tokens: float = 1):
+        """Blocks until `tokens` are available."""
+        delay = self.reserve(tokens)
+        if delay > 0:
+            sleep(delay)
+
+    async def acquire_async(self, tokens: float = 1):
+        """Waits without blocking the event loop until `tokens` are available."""
+        delay = self.reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class TokenBucketGroup:
+    """
+    A group of TokenBuckets that share a rate, e.g. one bucket per sender. A key's bucket is created
+    the first time the key is used.
+
+    :param float rate: The number of tokens added to each bucket per second.
+    :param float capacity: (optional) The maximum number of tokens each bucket holds.
+    """
+
+    def __init__(self, rate: float, capacity: float = None):
+        self.rate = rate
+        self.capacity = capacity
+        self._buckets = {}
+        self._lock = Lock()
+
+    def __getitem__(self, key) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(self.rate, self.capacity)
+            return bucket
+
+    def reserve(self, key, tokens: float = 1) -> float:
+        return self[key].reserve(tokens)
+
+
+class MemoryBackend:
+    """Stores a RateLimiter's token buckets in memory, shared by all threads in this process."""
+
+    def __init__(self):
+        self._buckets = {}
+        self._lock = Lock()
+
+    def reserve(self, key: str, rate: float, capacity: float, tokens: float = 1) -> float:
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None or (bucket.rate, bucket.capacity) != (rate, capacity):
+                bucket = self._buckets[key] = TokenBucket(rate, capacity)
+        return bucket.reserve(tokens)
+
+
+class FileBackend:
+    """
+    Stores a RateLimiter's token buckets in a file, so processes on the same host (e.g. gunicorn workers)
+    can share them. The file is locked with `fcntl.flock` while a bucket is updated, so this backend
+    is only available on POSIX systems.
+
+    :param str path: The path of the file to store the buckets in. It is created if it doesn't exist.
+    """
+
+    def __init__(self, path: str):
+        if fcntl is None:
+            raise RuntimeError('FileBackend needs the "fcntl" module, which is only available on POSIX.')
+        self.path = path
+
+    def reserve(self, key: str, rate: float, capacity: float, tokens: float = 1) -> float:
+        with open(self.path, 'a+') as file:
+            fcntl.flock(file, fcntl.LOCK_EX)
+            try:
+                file.seek(0)
+                contents = file.read()
+                buckets = json.loads(contents) if contents else {}
+
+                now = time()
+                available, updated_at = buckets.get(key, (capacity, now))
+                available, delay = _take_tokens(available, updated_at, now, rate, capacity, tokens)
+                buckets[key] = (available, now)
+
+                file.seek(0)
+                file.truncate()
+                file.write(json.dumps(buckets))
+                # Flushed to the page cache before unlocking, which other processes read from.
+                # It isn't synced to disk, as buckets don't need to survive a crash.
+                file.flush()
+            finally:
+                fcntl.flock(file, fcntl.LOCK_UN)
+        return delay
+
+
+class RateLimiter:
+    """
+    Limits the rate of requests a client makes to groups of Vonage API routes, with a token bucket per group.
+
+    Routes are keyed the same way as `Client.retry_policies`: keys that start with "/" match the start of the
+    request path (e.g. "/sms" or "/ni/"), other keys match the start of the host and path
+    (e.g. "api.nexmo.com/v2/verify"). A request uses the limit of the longest matching route.
+    Requests that don't match a route aren't limited.
+
+    :param dict limits: Maps routes to a rate in requests per second, or a (rate, capacity) tuple
+        where `capacity` is the largest burst of requests allowed.
+    :param backend: (optional) Where the token buckets are stored. Defaults to a MemoryBackend.
+        Use a FileBackend to share the limits between processes.
+    """
+
+    def __init__(self, limits: dict, backend=None):
+        self.backend = backend or MemoryBackend()
+        self.waits = 0
+        self.wait_time = 0.0
+        self._limits = {}
+        self._lock = Lock()
+        for route, limit in limits.items():
+            self.set_limit(route, limit)
+
+    def set_limit(self, route: str, limit):
+        rate, capacity = limit if isinstance(limit, tuple) else (limit, None)
+        if rate <= 0:
+            raise ValueError('Rate limits must be greater than 0.')
+        self._limits[route] = (route, rate, capacity or max(rate, 1))
+
+    def reserve(self, uri: str) -> float:
+        """Takes a token for a request to `uri` and returns the number of seconds to wait before sending it."""
+        limit = match_route(self._limits, uri)
+        if limit is None:
+            return 0.0
+        delay = self.backend.reserve(*limit)
+        if delay > 0:
+            with self._lock:
+                self.waits += 1
+                self.wait_time += delay
+        return delay
+
+    def acquire(self, uri: str):
+        """Blocks until a request to `uri` can be sent."""
+        delay = self.reserve(uri)
+        if delay > 0:
+            sleep(delay)
+
+    async def acquire_async(self, uri: str):
+        """Waits without blocking the event loop until a request to `uri` can be sent."""
+        if isinstance(self.backend, MemoryBackend):
+            delay = self.reserve(uri)
+        else:
+            # Other backends, e.g. a FileBackend, block while they read and lock their storage
+            delay = await asyncio.get_running_loop().run_in_executor(None, self.reserve, uri)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    @property
+    def stats(self) -> dict:
+        return {'waits': self.waits, 'wait_time': self.wait_time}
+
+
+def _take_tokens(available, updated_at, now, rate, capacity, tokens):
+    """
+    Refills a bucket holding `available` tokens since `updated_at`, then takes `tokens` from it.
+    Returns the tokens left (negative if the caller must wait) and the number of seconds to wait.
+    """
+    available = min(capacity, available + (now - updated_at) * rate) - tokens
+    if available >= 0:
+        return available, 0.0
+    return available, -available / rate
@@ -0,0 +1,101 @@
+from email.utils import parsedate_to_datetime
+from threading import Lock
+from time import time
+
+import random
+
+
+class RetryPolicy:
+    """
+    Decides whether, and after how long, to retry a request that was throttled or failed with a server error.
+
+    Delays grow exponentially with each retry and are "fully jittered" (a random delay between 0 and the
+    exponential backoff value), so clients that were throttled at the same time don't retry in lockstep.
+    If the response has a `Retry-After` or `X-RateLimit-Reset` header, the client waits at least that long,
+    up to `max_backoff` seconds.
+
+    Requests with methods that aren't idempotent (e.g. POST) are only retried after a 429 response,
+    as the request was rejected before it was processed. Retrying them after a server error could
+    e.g. send the same message twice.
+
+    :param int max_retries: The maximum number of times to retry a request.
+    :param float backoff_factor: The base delay in seconds. Retry `n` waits up to `backoff_factor * 2 ** n` seconds.
+    :param float max_backoff: The maximum delay in seconds between retries, including delays that the
+        server asks for.
+    :param status_codes: The HTTP status codes to retry.
+    :param idempotent_methods: The HTTP methods that are safe to retry after a server error.
+    :param on_retry: (optional) A function called before each retry with the request method and URI,
+        the response, the number of the retry and the delay in seconds. Use this to record retries.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30,
+        status_codes=frozenset({429, 500, 502, 503, 504}),
+        idempotent_methods=frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'}),
+        on_retry=None,
+    ):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.status_codes = status_codes
+        self.idempotent_methods = idempotent_methods
+        self.on_retry = on_retry
+        self.retries = 0
+        self.retries_by_status_code = {}
+        self._lock = Lock()
+
+    def get_delay(self, method: str, response, retry_number: int):
+        """
+        Returns the number of seconds to wait before retrying a request that got `response`,
+        or `None` if it shouldn't be retried. `retry_number` is the number of retries already made.
+        """
+        status_code = response.status_code
+        if retry_number >= self.max_retries or status_code not in self.status_codes:
+            return None
+        if status_code != 429 and method.upper() not in self.idempotent_methods:
+            return None
+
+        delay = random.uniform(0, min(self.max_backoff, self.backoff_factor * 2**retry_number))
+        server_delay = self._get_server_delay(response.headers)
+        if server_delay is not None:
+            # Capped, so a server can't make the client wait for an unbounded time
+            delay = max(delay, min(server_delay, self.max_backoff))
+        return delay
+
+    def record_retry(self, method: str, uri: str, response, retry_number: int, delay: float):
+        with self._lock:
+            self.retries += 1
+            self.retries_by_status_code[response.status_code] = (
+                self.retries_by_status_code.get(response.status_code, 0) + 1
+            )
+        if self.on_retry is not None:
+            self.on_retry(method, uri, response, retry_number, delay)
+
+    @property
+    def stats(self) -> dict:
+        return {'retries': self.retries, 'retries_by_status_code': dict(self.retries_by_status_code)}
+
+    def _get_server_delay(self, headers):
+        """Returns the delay the server asked for in the Retry-After or X-RateLimit-Reset header."""
+        retry_after = headers.get('Retry-After')
+        if retry_after is not None:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                try:
+                    return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time())
+                except (TypeError, ValueError):
+                    pass
+
+        rate_limit_reset = headers.get('X-RateLimit-Reset')
+        if rate_limit_reset is not None:
+            try:
+                reset = float(rate_limit_reset)
+            except ValueError:
+                return None
+            # Either a number of seconds, or a Unix timestamp
+            return max(0.0, reset - time()) if reset > 1e9 else reset
+        return None
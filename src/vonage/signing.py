@@ -0,0 +1,118 @@
+from concurrent.futures import Future, ProcessPoolExecutor
+from time import time
+from typing import List
+from uuid import uuid4
+
+import asyncio
+import jwt
+import os
+from jwt.algorithms import RSAAlgorithm
+
+JWT_HEADERS = {'alg': 'RS256', 'typ': 'JWT'}
+
+
+def set_default_claims(claims: dict, application_id: str) -> dict:
+    """
+    Adds the claims that every Vonage application JWT has, in the same way as `JwtClient.generate_application_jwt`.
+    `claims` is updated in place, so callers (e.g. a JwtCache) can read the `iat` and `exp` a token is signed with.
+    """
+    iat = int(time())
+    claims['application_id'] = application_id
+    claims.setdefault('iat', iat)
+    claims.setdefault('jti', str(uuid4()))
+    claims.setdefault('exp', iat + 15 * 60)
+    return claims
+
+
+class KeySigner:
+    """
+    Signs application JWTs in this process with a private key that is parsed once, instead of for every token.
+
+    :param str application_id: The ID of the Vonage application.
+    :param private_key: The application's private key, or the path to it.
+    """
+
+    def __init__(self, application_id: str, private_key):
+        self.application_id = application_id
+        self._key = RSAAlgorithm(RSAAlgorithm.SHA256).prepare_key(_read_private_key(private_key))
+
+    def sign(self, claims: dict) -> bytes:
+        set_default_claims(claims, self.application_id)
+        return jwt.encode(claims, self._key, algorithm='RS256', headers=JWT_HEADERS).encode('utf-8')
+
+
+class ProcessPoolSigner:
+    """
+    Signs application JWTs on a pool of worker processes, so RSA signing doesn't compete for the GIL with
+    the threads serving requests, and many tokens can be signed at once on a multi-core host.
+
+    Pass one to `Client(jwt_signer=...)` to sign the client's JWTs with it. `submit` queues a token and
+    returns a Future, so many tokens can be queued at once, and `sign_async` awaits a token from asyncio code.
+
+    Each worker parses the private key once, when it starts. The default claims (`iat`, `jti` and `exp`)
+    are added to the claims in this process, before they're sent to a worker.
+
+    :param str application_id: The ID of the Vonage application.
+    :param private_key: The application's private key, or the path to it.
+    :param int max_workers: (optional) The number of worker processes. Defaults to the number of CPUs.
+    :param mp_context: (optional) The multiprocessing context to start the workers with.
+    """
+
+    def __init__(self, application_id: str, private_key, max_workers: int = None, mp_context=None):
+        self.application_id = application_id
+        self.max_workers = (os.cpu_count() or 1) if max_workers is None else max_workers
+        pem = _read_private_key(private_key)
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=mp_context,
+            initializer=_start_worker,
+            initargs=(application_id, pem),
+        )
+
+    def submit(self, claims: dict) -> Future:
+        """Starts signing a token for `claims` and returns a Future for the token."""
+        return self._executor.submit(_sign_in_worker, set_default_claims(claims, self.application_id))
+
+    def sign(self, claims: dict) -> bytes:
+        return self.submit(claims).result()
+
+    async def sign_async(self, claims: dict) -> bytes:
+        """Signs a token on a worker process without blocking the event loop."""
+        return await asyncio.wrap_future(self.submit(claims))
+
+    def sign_many(self, claims_list) -> List[bytes]:
+        """Signs a token for each of `claims_list`, returning the tokens in the same order."""
+        claims_list = [set_default_claims(claims, self.application_id) for claims in claims_list]
+        chunksize = max(1, len(claims_list) // (4 * self.max_workers))
+        return list(self._executor.map(_sign_in_worker, claims_list, chunksize=chunksize))
+
+    def close(self, wait: bool = True):
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _read_private_key(private_key):
+    """Returns the PEM of a private key that is passed directly (as str or bytes) or as a path."""
+    if isinstance(private_key, str) and '-----BEGIN' in private_key:
+        return private_key
+    if isinstance(private_key, bytes) and b'-----BEGIN' in private_key:
+        return private_key
+    with open(private_key, 'rb') as key_file:
+        return key_file.read()
+
+
+_worker_signer = None
+
+
+def _start_worker(application_id, private_key):
+    global _worker_signer
+    _worker_signer = KeySigner(application_id, private_key)
+
+
+def _sign_in_worker(claims):
+    return _worker_signer.sign(claims)
@@ -1,6 +1,8 @@
 import pytz
 from datetime import datetime
-from ._internal import _format_date_param
+from time import sleep
+from ._internal import _format_date_param, map_concurrently
+from .rate_limiter import TokenBucket, TokenBucketGroup
 
 
 class Sms:
@@ -23,6 +25,36 @@ class Sms:
             **Sms.defaults,
         )
 
+    def send_messages(
+        self,
+        messages,
+        max_workers: int = 10,
+        messages_per_second: float = None,
+        account_messages_per_second: float = None,
+    ):
+        """
+        Send many SMS messages concurrently, over the client's connection pool.
+
+        Returns a generator that yields `(index, response)` tuples as each message is sent, where `index`
+        is the position of the message in `messages`. If sending a message raises an error, the error is
+        yielded instead of the response. `messages` can be a lazy iterator, as only a bounded number of
+        messages are held in memory at once.
+
+        :param messages: An iterable of dicts, each in the format passed to `send_message`.
+        :param int max_workers: The number of messages that can be in flight at once.
+        :param float messages_per_second: (optional) The maximum rate to send messages from each `from` number.
+        :param float account_messages_per_second: (optional) The maximum rate to send all of the messages.
+        """
+        throttle = _SendThrottle(messages_per_second, account_messages_per_second)
+
+        def send(message):
+            delay = throttle.reserve(message)
+            if delay > 0:
+                sleep(delay)
+            return self.send_message(dict(message))
+
+        return map_concurrently(send, messages, max_workers=max_workers)
+
     def submit_sms_conversion(self, message_id, delivered=True, timestamp=None):
         """
         Notify Vonage that an SMS was successfully received.
@@ -45,3 +77,22 @@ class Sms:
         return self._client.post(
             self._client.api_host(), "/conversions/sms", params, **Sms.defaults
         )
+
+
+class _SendThrottle:
+    """Paces messages per sender and across the account, for Sms.send_messages."""
+
+    def __init__(self, messages_per_second=None, account_messages_per_second=None):
+        self._sender_buckets = TokenBucketGroup(messages_per_second) if messages_per_second else None
+        self._account_bucket = (
+            TokenBucket(account_messages_per_second) if account_messages_per_second else None
+        )
+
+    def reserve(self, message) -> float:
+        """Returns the number of seconds to wait before sending `message`."""
+        delay = 0.0
+        if self._account_bucket is not None:
+            delay = self._account_bucket.reserve()
+        if self._sender_buckets is not None:
+            delay = max(delay, self._sender_buckets.reserve(message.get('from')))
+        return delay
@@ -0,0 +1,119 @@
+from requests.adapters import HTTPAdapter
+from requests.sessions import Session
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+try:
+    import h2
+except ImportError:  # pragma: no cover
+    h2 = None
+
+
+class RequestsTransport:
+    """
+    Sends the client's requests with a `requests` Session. This is the default transport.
+
+    Each request that is in flight needs its own connection, so a session keeps a pool of up to
+    `pool_maxsize` keep-alive connections for each host.
+
+    :param Session session: (optional) The session to send requests with. By default, a new session is
+        created with an HTTPAdapter for the pool sizes and retries passed.
+    """
+
+    def __init__(self, session: Session = None, pool_connections=10, pool_maxsize=10, max_retries=3):
+        if session is None:
+            session = Session()
+            adapter = HTTPAdapter(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                max_retries=max_retries,
+            )
+            session.mount("https://", adapter)
+        self.session = session
+
+    def request(self, method, url, timeout=None, **kwargs):
+        return self.session.request(method, url, timeout=timeout, **kwargs)
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class Http2Transport:
+    """
+    Sends the client's requests over HTTP/2 with `httpx <https://www.python-httpx.org/>`_, which multiplexes
+    concurrent requests to a host (e.g. `api.nexmo.com` or `rest.nexmo.com`) over a single connection.
+    Threads sending many requests at once share a few connections instead of opening one each, so fewer
+    TCP and TLS handshakes are made. Install it with ``pip install vonage[http2]``.
+
+    Pass one to `Client(transport=...)`. A transport can be shared by several clients, and is thread safe.
+    Call :meth:`close` (or use the transport as a context manager) to close its connections.
+
+    :param int max_connections: The maximum number of connections to keep open across all hosts.
+    :param float keepalive_expiry: The number of seconds an idle connection is kept open for.
+    :param int max_retries: The number of times to retry a request that fails to connect.
+    """
+
+    def __init__(self, max_connections: int = 20, keepalive_expiry: float = 30, max_retries: int = 3):
+        if httpx is None or h2 is None:
+            raise ImportError(
+                'The "httpx" and "h2" packages are required to use Http2Transport. '
+                'Install them with "pip install vonage[http2]".'
+            )
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.adapter = httpx.HTTPTransport(http2=True, limits=limits, retries=max_retries)
+        self.session = httpx.Client(transport=self.adapter)
+
+    def request(self, method, url, timeout=None, params=None, data=None, **kwargs):
+        return self.session.request(
+            method,
+            url,
+            params=_prepare_params(params),
+            data=_prepare_params(data),
+            timeout=_create_httpx_timeout(timeout),
+            **kwargs,
+        )
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _create_httpx_timeout(timeout):
+    """Converts a requests-style timeout (a float, or a (connect, read) tuple) to an httpx.Timeout."""
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(None, connect=connect, read=read)
+    return httpx.Timeout(timeout)
+
+
+def _prepare_params(params):
+    """
+    Encodes query or form params for httpx the way requests does. requests drops params with a value
+    of None, which httpx sends as empty strings, and sends booleans as "True" and "False" rather than
+    "true" and "false".
+    """
+    if params is None:
+        return None
+    return {
+        key: str(value) if type(value) is bool else value
+        for key, value in params.items()
+        if value is not None
+    }
@@ -5,7 +5,7 @@ if TYPE_CHECKING:
     from vonage import Client
 
 from .errors import UsersError
-from ._internal import set_auth_type
+from ._internal import get_query_param, set_auth_type
 
 
 class Users:
@@ -40,8 +40,31 @@ class Users:
             auth_type=self._auth_type,
         )
 
+    def iter_users(
+        self,
+        page_size: int = None,
+        order: str = 'asc',
+        name: str = None,
+        prefetch: bool = False,
+    ):
+        """Yields every user associated with the account, following the cursor in each page of results."""
+
+        def fetch_page(cursor):
+            return self.list_users(page_size=page_size, order=order, cursor=cursor, name=name)
+
+        def get_next_cursor(page, users, cursor):
+            next_link = page.get('_links', {}).get('next')
+            if next_link is not None:
+                return get_query_param(next_link['href'], 'cursor')
+
+        return self._client._iterate_pages(
+            fetch_page,
+            lambda page: page.get('_embedded', {}).get('users', []),
+            get_next_cursor,
+            prefetch=prefetch,
+        )
+
     def create_user(self, params: dict = None):
-        self._client.headers['Content-Type'] = 'application/json'
         return self._client.post(
             self._client.api_host(),
             '/v1/users',
@@ -4,13 +4,12 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from vonage import Client
 
-from pydantic import BaseModel, ValidationError, validator, conint, constr
+from pydantic import BaseModel, validator, conint, constr
 from typing import Optional, List
 
-import copy
 import re
 
-from ._internal import set_auth_type
+from ._internal import map_concurrently, set_auth_type
 from .errors import Verify2Error
 
 
@@ -30,11 +29,7 @@ class Verify2:
 
     def new_request(self, params: dict):
         self._remove_unnecessary_fraud_check(params)
-        try:
-            params_to_verify = copy.deepcopy(params)
-            Verify2.VerifyRequest.parse_obj(params_to_verify)
-        except (ValidationError, Verify2Error) as err:
-            raise err
+        _validate_request(params)
 
         return self._client.post(
             self._client.api_host(),
@@ -43,6 +38,20 @@ class Verify2:
             auth_type=self._auth_type,
         )
 
+    def new_requests(self, requests, max_workers: int = 10):
+        """
+        Start many verifications concurrently, over the client's connection pool.
+
+        Returns a generator that yields `(index, response)` tuples as each request is made, where `index`
+        is the position of the request in `requests`. If a request is invalid or making it raises an error,
+        the error is yielded instead of the response. `requests` can be a lazy iterator, as only a bounded
+        number of requests are held in memory at once.
+
+        :param requests: An iterable of dicts, each in the format passed to `new_request`.
+        :param int max_workers: The number of requests that can be in flight at once.
+        """
+        return map_concurrently(self.new_request, requests, max_workers=max_workers)
+
     def check_code(self, request_id: str, code: str):
         params = {'code': str(code)}
 
@@ -79,13 +88,12 @@ class Verify2:
         @validator('workflow')
         def check_valid_workflow(cls, v):
             for workflow in v:
-                Verify2._check_valid_channel(workflow)
-                Verify2._check_valid_recipient(workflow)
-                Verify2._check_app_hash(workflow)
-                if workflow['channel'] == 'whatsapp' and 'from' in workflow:
-                    Verify2._check_whatsapp_sender(workflow)
-                if workflow['channel'] == 'silent_auth':
-                    Verify2._check_silent_auth_workflow(workflow)
+                Verify2._check_workflow(workflow)
+
+    def _check_workflow(workflow):
+        Verify2._check_valid_channel(workflow)
+        for check in _WORKFLOW_CHECKS[workflow['channel']]:
+            check(workflow)
 
     def _check_valid_channel(workflow):
         if 'channel' not in workflow or workflow['channel'] not in Verify2.valid_channels:
@@ -95,7 +103,7 @@ class Verify2:
 
     def _check_valid_recipient(workflow):
         if 'to' not in workflow or (
-            workflow['channel'] != 'email' and not re.search(r'^[1-9]\d{6,14}$', workflow['to'])
+            workflow['channel'] != 'email' and _PHONE_NUMBER.fullmatch(workflow['to']) is None
         ):
             raise Verify2Error(
                 f'You must specify a valid "to" value for channel "{workflow["channel"]}"'
@@ -114,7 +122,7 @@ class Verify2:
             )
 
     def _check_whatsapp_sender(workflow):
-        if not re.search(r'^[1-9]\d{6,14}$', workflow['from']):
+        if 'from' in workflow and _PHONE_NUMBER.fullmatch(workflow['from']) is None:
             raise Verify2Error('You must specify a valid "from" value if included.')
 
     def _check_silent_auth_workflow(workflow):
@@ -124,3 +132,51 @@ class Verify2:
         if 'sandbox' in workflow:
             if type(workflow['sandbox']) != bool:
                 raise Verify2Error('"sandbox" must be a boolean if specified.')
+
+
+_PHONE_NUMBER = re.compile(r'[1-9]\d{6,14}')
+_CODE = re.compile(r'[a-zA-Z0-9]{4,10}')
+
+_WORKFLOW_CHECKS = {
+    channel: (Verify2._check_valid_recipient, Verify2._check_app_hash)
+    + {
+        'whatsapp': (Verify2._check_whatsapp_sender,),
+        'silent_auth': (Verify2._check_silent_auth_workflow,),
+    }.get(channel, ())
+    for channel in Verify2.valid_channels
+}
+
+
+def _validate_request(params):
+    """
+    Validates a new verification request without copying it. Requests whose fields all have the types
+    and values the API expects are checked directly. Other requests (e.g. with values pydantic would coerce,
+    or that are invalid) are parsed with `Verify2.VerifyRequest`, which raises the same errors as before.
+    """
+    if _has_valid_fields(params):
+        try:
+            for workflow in params['workflow']:
+                Verify2._check_workflow(workflow)
+            return
+        except (ValueError, TypeError, AssertionError):
+            pass
+    Verify2.VerifyRequest.parse_obj(params)
+
+
+def _has_valid_fields(params):
+    workflow = params.get('workflow')
+    if type(params.get('brand')) is not str or type(workflow) is not list:
+        return False
+    if not all(type(channel) is dict for channel in workflow):
+        return False
+    for name in ('locale', 'client_ref'):
+        if params.get(name) is not None and type(params[name]) is not str:
+            return False
+    for name, low, high in (('channel_timeout', 60, 900), ('code_length', 4, 10)):
+        value = params.get(name)
+        if value is not None and not (type(value) is int and low <= value <= high):
+            return False
+    if params.get('fraud_check') is not None and type(params['fraud_check']) is not bool:
+        return False
+    code = params.get('code')
+    return code is None or (type(code) is str and _CODE.fullmatch(code) is not None)
@@ -11,7 +11,12 @@ from .errors import (
     VideoError,
 )
 
+from .signing import ProcessPoolSigner
+
+import json
 import re
+from collections import deque
+from threading import Lock
 from time import time
 from uuid import uuid4
 
@@ -26,6 +31,18 @@ class Video:
         self._client = client
 
     def create_session(self, session_options: dict = None):
+        params = self._build_session_params(session_options)
+        session = self._client.post(
+            self._client.video_host(),
+            '/session/create',
+            params,
+            auth_type=Video.auth_type,
+            body_is_json=False,
+        )[0]
+
+        return self._build_session_info(session, params)
+
+    def _build_session_params(self, session_options: dict = None):
         if session_options is None:
             session_options = {}
 
@@ -57,24 +74,17 @@ class Video:
         if 'location' in session_options:
             params['location'] = session_options['location']
 
-        session = self._client.post(
-            self._client.video_host(),
-            '/session/create',
-            params,
-            auth_type=Video.auth_type,
-            body_is_json=False,
-        )[0]
+        return params
 
+    def _build_session_info(self, session: dict, params: dict):
         media_mode = self.get_media_mode(params['p2p.preference'])
-        session_info = {
+        return {
             'session_id': session['session_id'],
             'archive_mode': params['archiveMode'],
             'media_mode': media_mode,
             'location': params['location'],
         }
 
-        return session_info
-
     def get_media_mode(self, p2p_preference):
         if p2p_preference == 'disabled':
             return 'routed'
@@ -153,6 +163,24 @@ class Video:
             auth_type=Video.auth_type,
         )
 
+    def iter_archives(self, filter_params=None, prefetch=False, **filter_kwargs):
+        """
+        Yields every archive matching the filters, which are the same as for `list_archives`.
+        The `count` filter sets the number of archives fetched in each page.
+        """
+        params = dict(filter_params or filter_kwargs)
+
+        def fetch_page(offset):
+            return self.list_archives(dict(params, offset=offset))
+
+        return self._client._iterate_pages(
+            fetch_page,
+            lambda page: page.get('items', []),
+            Video._get_next_offset,
+            state=params.pop('offset', 0),
+            prefetch=prefetch,
+        )
+
     def create_archive(self, params=None, **kwargs):
         return self._client.post(
             self._client.video_host(),
@@ -250,7 +278,11 @@ class Video:
         if count is not None and (type(count) != int or count < 0 or count > 1000):
             raise VideoError('Count must be an int between 0 and 1000.')
 
-        params = {'offset': str(offset), 'count': str(count), 'sessionId': session_id}
+        params = {'sessionId': session_id}
+        if offset is not None:
+            params['offset'] = str(offset)
+        if count is not None:
+            params['count'] = str(count)
 
         return self._client.get(
             self._client.video_host(),
@@ -259,6 +291,25 @@ class Video:
             auth_type=Video.auth_type,
         )
 
+    def iter_broadcasts(self, count: int = None, session_id: str = None, prefetch: bool = False):
+        """
+        Yields every broadcast, optionally only those for `session_id`.
+        `count` sets the number of broadcasts fetched in each page.
+        """
+        return self._client._iterate_pages(
+            lambda offset: self.list_broadcasts(offset=offset, count=count, session_id=session_id),
+            lambda page: page.get('items', []),
+            Video._get_next_offset,
+            state=0,
+            prefetch=prefetch,
+        )
+
+    @staticmethod
+    def _get_next_offset(page, items, offset):
+        next_offset = offset + len(items)
+        if next_offset < int(page.get('count', 0)):
+            return next_offset
+
     def start_broadcast(self, params: dict):
         return self._client.post(
             self._client.video_host(),
@@ -313,6 +364,10 @@ class Video:
         )
 
     def generate_client_token(self, session_id, token_options={}):
+        claims = self._build_client_token_claims(session_id, token_options)
+        return self._client._generate_application_jwt(claims)
+
+    def _build_client_token_claims(self, session_id, token_options):
         now = int(time())
         claims = {
             'scope': 'session.connect',
@@ -340,8 +395,7 @@ class Video:
             claims['acl'] = token_options['acl']
 
         self.validate_client_token_options(claims)
-        self._client.auth(claims)
-        return self._client._generate_application_jwt()
+        return claims
 
     def validate_client_token_options(self, claims):
         now = int(time())
@@ -351,3 +405,86 @@ class Video:
             )
         if 'exp' in claims and claims['exp'] > now + 3600 * 24 * 30:
             raise TokenExpiryError('Token expiry date must be less than 30 days from now.')
+
+
+class ClientTokenPool:
+    """
+    Mints Video client tokens on a pool of worker processes, and can mint tokens for a session ahead of time,
+    so a burst of participants joining a session doesn't wait on RSA signing.
+
+    Tokens minted with `prefill` are kept until `get_token` is called with the same session ID and token
+    options. Tokens that expire within `min_validity` seconds are discarded. Tokens default to expiring
+    15 minutes after they're minted, so pass an `expireTime` in the token options when minting tokens
+    long before a session starts.
+
+    :param Client client: The client whose application ID and private key sign the tokens.
+    :param int max_workers: (optional) The number of worker processes. Defaults to the number of CPUs.
+    :param float min_validity: The minimum number of seconds a minted token must still be valid for to be used.
+    """
+
+    def __init__(self, client: Client, max_workers: int = None, min_validity: float = 60):
+        if getattr(client, '_jwt_client', None) is None:
+            raise VideoError('A ClientTokenPool needs a client with an application ID and private key.')
+        self.min_validity = min_validity
+        self._video = client.video
+        self._signer = ProcessPoolSigner(client.application_id, client._private_key, max_workers=max_workers)
+        self._tokens = {}
+        self._lock = Lock()
+
+    def prefill(self, session_id: str, count: int, token_options: dict = {}):
+        """
+        Starts minting `count` tokens for a session in the background, and returns their Futures.
+        The token options are validated straight away.
+        """
+        key = _make_token_pool_key(session_id, token_options)
+        minted = []
+        for _ in range(count):
+            claims = self._video._build_client_token_claims(session_id, token_options)
+            future = self._signer.submit(claims)
+            minted.append((claims['exp'], future))
+        with self._lock:
+            self._tokens.setdefault(key, deque()).extend(minted)
+        return [future for _, future in minted]
+
+    def get_token(self, session_id: str, token_options: dict = {}) -> bytes:
+        """Returns a token minted ahead of time for the session and options, or mints a new one."""
+        token = self._pop(_make_token_pool_key(session_id, token_options))
+        if token is not None:
+            return token
+        return self._signer.sign(self._video._build_client_token_claims(session_id, token_options))
+
+    def generate_tokens(self, session_id: str, count: int, token_options: dict = {}) -> list:
+        """Mints `count` tokens for a session at once, spread across the worker processes."""
+        return self._signer.sign_many(
+            [self._video._build_client_token_claims(session_id, token_options) for _ in range(count)]
+        )
+
+    def available(self, session_id: str, token_options: dict = {}) -> int:
+        """Returns the number of tokens minted ahead of time that are waiting for the session and options."""
+        with self._lock:
+            return len(self._tokens.get(_make_token_pool_key(session_id, token_options), ()))
+
+    def close(self):
+        self._signer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _pop(self, key):
+        """Returns the next usable minted token, waiting for it if it's still being signed."""
+        while True:
+            with self._lock:
+                tokens = self._tokens.get(key)
+                if not tokens:
+                    return None
+                exp, future = tokens.popleft()
+            if exp - time() < self.min_validity or future.cancelled() or future.exception() is not None:
+                continue
+            return future.result()
+
+
+def _make_token_pool_key(session_id, token_options):
+    return session_id, json.dumps(token_options, sort_keys=True, default=str)
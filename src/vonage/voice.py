@@ -1,12 +1,50 @@
+from ._internal import map_concurrently
+from .errors import ClientError
+from .jwt_verifier import JwtVerifier
+
+from contextlib import contextmanager
 from urllib.parse import urlparse
 from vonage_jwt.verify_jwt import verify_signature
 
+import logging
+import os
+import requests
+
+logger = logging.getLogger("vonage")
+
+RECORDING_CHUNK_SIZE = 64 * 1024
+
+
+@contextmanager
+def _open_recording_file(dest, resume):
+    """
+    Opens the file to download a recording to `dest` with, and the offset to download from. Partly
+    downloaded recordings are appended to when resuming, otherwise the recording is written to a
+    `.part` file that only replaces `dest` once it has been downloaded.
+    """
+    offset = os.path.getsize(dest) if resume and os.path.exists(dest) else 0
+    if offset:
+        with open(dest, 'ab') as file:
+            yield file, offset
+        return
+
+    part_path = f'{dest}.part'
+    with open(part_path, 'wb') as file:
+        try:
+            yield file, 0
+        except BaseException:
+            file.close()
+            os.remove(part_path)
+            raise
+    os.replace(part_path, dest)
+
 
 class Voice:
     auth_type = 'jwt'
 
     def __init__(self, client):
         self._client = client
+        self._jwt_verifiers = {}
 
     # Creates a new call session
     def create_call(self, params, **kwargs):
@@ -36,6 +74,26 @@ class Voice:
             self._client.api_host(), "/v1/calls", params or kwargs, auth_type=Voice.auth_type
         )
 
+    def iter_calls(self, params=None, prefetch=False, **kwargs):
+        """Yields every call record matching the filters in `params`, which are the same as for `get_calls`."""
+        params = dict(params or kwargs)
+
+        def fetch_page(record_index):
+            return self.get_calls(dict(params, record_index=record_index))
+
+        def get_next_record_index(page, calls, record_index):
+            next_record_index = page.get('record_index', record_index) + len(calls)
+            if next_record_index < page.get('count', 0):
+                return next_record_index
+
+        return self._client._iterate_pages(
+            fetch_page,
+            lambda page: page.get('_embedded', {}).get('calls', []),
+            get_next_record_index,
+            state=params.pop('record_index', 0),
+            prefetch=prefetch,
+        )
+
     # Get a single call record by identifier
     def get_call(self, uuid):
         return self._client.get(
@@ -92,9 +150,137 @@ class Voice:
 
     def get_recording(self, url):
         hostname = urlparse(url).hostname
-        headers = self._client.headers
-        headers['Authorization'] = self._client._create_jwt_auth_string()
-        return self._client.parse(hostname, self._client.session.get(url, headers=headers))
+        # `_build_auth` lets an AsyncClient sign the JWT when the request is sent
+        headers, _ = self._client._build_auth('jwt', None)
+        return self._client._request('GET', hostname, url, headers=headers)
+
+    def iter_recording(self, url: str, chunk_size: int = RECORDING_CHUNK_SIZE, start: int = 0):
+        """
+        Streams a recording, yielding it in chunks of up to `chunk_size` bytes so the whole recording is never
+        held in memory. If `start` is set, the recording is streamed from that byte offset.
+        """
+        with self._request_recording(url, start) as response:
+            if response.status_code == 416:
+                return
+            chunks = response.iter_content(chunk_size)
+            if start and response.status_code != 206:
+                chunks = _skip_bytes(chunks, start)
+            yield from chunks
+
+    def download_recording(
+        self,
+        url: str,
+        dest,
+        chunk_size: int = RECORDING_CHUNK_SIZE,
+        resume: bool = False,
+        max_resumes: int = 3,
+    ) -> int:
+        """
+        Streams a recording to `dest` and returns the size of the recording in bytes.
+
+        :param str url: The URL of the recording, from the `recording_url` of a recording webhook.
+        :param dest: A path, or a writable binary file (e.g. an object store's upload stream).
+        :param int chunk_size: The number of bytes to read into memory at once.
+        :param bool resume: If `dest` is the path of a partly downloaded recording, download the rest of it
+            instead of starting again. Only set this if the file at `dest` was left by an earlier download
+            of the same recording, as the rest of the recording is appended to it. Otherwise, the recording
+            is downloaded to a temporary file that replaces `dest` once the download succeeds, so a failed
+            download leaves `dest` untouched.
+        :param int max_resumes: The number of times to resume the download from the last byte received
+            if the connection drops.
+        """
+        if hasattr(dest, 'write'):
+            return self._write_recording(url, dest, 0, chunk_size, max_resumes)
+
+        with _open_recording_file(dest, resume) as (file, offset):
+            return self._write_recording(url, file, offset, chunk_size, max_resumes)
+
+    def download_recordings(self, downloads, max_workers: int = 10, **kwargs):
+        """
+        Downloads many recordings concurrently, sharing the client's connection pool.
+
+        `downloads` is an iterable of `(url, dest)` tuples, and `kwargs` are passed to `download_recording`.
+        Yields `(index, size)` tuples in the order the downloads finish, where `index` is the position of
+        the download in `downloads`. If a download fails, the exception is yielded instead of its size.
+        Keep `max_workers` at or below the client's `pool_maxsize`, so every download can reuse a connection.
+        """
+        return map_concurrently(
+            lambda download: self.download_recording(*download, **kwargs), downloads, max_workers
+        )
+
+    def _build_recording_headers(self, auth, start=0):
+        """Builds the headers for streaming a recording, with a JWT `auth` header created by the caller."""
+        headers = {**self._client.headers, 'Authorization': auth}
+        if start:
+            headers['Range'] = f'bytes={start}-'
+        return headers
+
+    def _request_recording(self, url, start=0):
+        response = self._client.session.get(
+            url,
+            headers=self._build_recording_headers(self._client._create_jwt_auth_string(), start),
+            stream=True,
+            timeout=self._client.timeout,
+        )
+        # A 416 response to a ranged request means there is nothing after `start` left to download
+        if not 200 <= response.status_code < 300 and not (start and response.status_code == 416):
+            with response:
+                self._client.parse(urlparse(url).hostname, response)
+        return response
+
+    def _write_recording(self, url, file, offset, chunk_size, max_resumes):
+        resumes = 0
+        while True:
+            try:
+                with self._request_recording(url, offset) as response:
+                    if response.status_code == 416:
+                        return offset
+                    if offset and response.status_code != 206:
+                        offset = self._restart_recording(url, file)
+                    for chunk in response.iter_content(chunk_size):
+                        file.write(chunk)
+                        offset += len(chunk)
+                    return offset
+            except (requests.ConnectionError, requests.exceptions.ChunkedEncodingError) as err:
+                if resumes >= max_resumes:
+                    raise
+                resumes += 1
+                logger.warning(f'Download of {url} interrupted after {offset} bytes, resuming: {err}')
+
+    def _restart_recording(self, url, file):
+        """Empties `file` when the server ignored the Range header and sent the whole recording."""
+        if not file.seekable():
+            raise ClientError(
+                f'Could not resume the download of {url}, as the server sent the whole recording and the '
+                'destination file is not seekable.'
+            )
+        file.seek(0)
+        file.truncate()
+        return 0
 
     def verify_signature(self, token: str, signature: str) -> bool:
         return verify_signature(token, signature)
+
+    def verify_signatures(self, tokens, signature: str) -> list:
+        """
+        Verifies a batch of webhook JWTs signed with the `signature` secret, returning True, False, or the
+        `VonageVerifyJwtError` raised for each token, in the same order. A JwtVerifier is kept for each secret,
+        so tokens seen in an earlier batch are verified from its cache.
+        """
+        return self._get_jwt_verifier(signature).verify_many(tokens)
+
+    def _get_jwt_verifier(self, signature):
+        verifier = self._jwt_verifiers.get(signature)
+        if verifier is None:
+            verifier = self._jwt_verifiers[signature] = JwtVerifier(signature)
+        return verifier
+
+
+def _skip_bytes(chunks, count):
+    """Yields the chunks of a stream after its first `count` bytes."""
+    for chunk in chunks:
+        if count >= len(chunk):
+            count -= len(chunk)
+            continue
+        yield chunk[count:]
+        count = 0
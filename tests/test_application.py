@@ -274,3 +274,29 @@ def test_server_error(client):
     )
     with pytest.raises(vonage.ServerError):
         client.application.delete_application("xx-xx-xx-xx")
+
+
+@responses.activate
+def test_iter_applications(client):
+    def list_applications(request):
+        page = int(parse_qs(urlparse(request.url).query)["page"][0])
+        body = {
+            "page": page,
+            "total_pages": 3,
+            "_embedded": {"applications": [{"id": str(page)}]},
+        }
+        return 200, {}, json.dumps(body)
+
+    responses.add_callback(
+        responses.GET,
+        "https://api.nexmo.com/v2/applications",
+        callback=list_applications,
+        content_type="application/json",
+    )
+
+    applications = client.application.iter_applications(page_size=1)
+
+    assert next(applications)["id"] == "1"
+    assert len(responses.calls) == 1
+    assert [app["id"] for app in applications] == ["2", "3"]
+    assert len(responses.calls) == 3
@@ -0,0 +1,374 @@
+import vonage
+from util import *
+from vonage.errors import ClientError, InvalidAuthenticationTypeError
+
+import asyncio
+import io
+import json
+from urllib.parse import parse_qs
+
+import httpx
+import jwt
+from pytest import raises
+
+
+def async_client(dummy_data, handler, **kwargs):
+    client = vonage.AsyncClient(
+        key=dummy_data.api_key,
+        secret=dummy_data.api_secret,
+        application_id=dummy_data.application_id,
+        private_key=dummy_data.private_key,
+        **kwargs,
+    )
+    client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+def test_async_client_has_all_sub_apis(dummy_data):
+    client = vonage.AsyncClient(key=dummy_data.api_key, secret=dummy_data.api_secret)
+    for name in ('account', 'messages', 'number_insight', 'sms', 'verify', 'verify2', 'users'):
+        assert getattr(client, name)._client is client
+    assert isinstance(client.video, vonage.Video)
+    assert isinstance(client.voice, vonage.Voice)
+    assert isinstance(client.session, httpx.AsyncClient)
+
+
+def test_async_sms_send_message(dummy_data):
+    requests = []
+    client = async_client(dummy_data, recording_handler(requests))
+
+    response = asyncio.run(
+        client.sms.send_message({'from': 'Python', 'to': '447525856424', 'text': 'Hey!'})
+    )
+
+    assert response == {'key': 'value'}
+    assert requests[0].method == 'POST'
+    assert requests[0].url == 'https://rest.nexmo.com/sms/json'
+    assert requests[0].headers['User-Agent'] == dummy_data.user_agent
+    body = parse_qs(requests[0].content.decode())
+    assert body['api_key'] == [dummy_data.api_key]
+    assert body['api_secret'] == [dummy_data.api_secret]
+    assert body['text'] == ['Hey!']
+
+
+def test_async_voice_create_call_uses_jwt(dummy_data):
+    requests = []
+    client = async_client(dummy_data, recording_handler(requests))
+
+    asyncio.run(client.voice.create_call({'to': [{'type': 'phone', 'number': '14843331234'}]}))
+
+    assert requests[0].url == 'https://api.nexmo.com/v1/calls'
+    assert requests[0].headers['Authorization'].startswith('Bearer ')
+    assert json.loads(requests[0].content)['to'][0]['number'] == '14843331234'
+
+
+def test_async_client_signs_jwts_with_async_signer(dummy_data):
+    requests = []
+    with vonage.ProcessPoolSigner(dummy_data.application_id, dummy_data.private_key, max_workers=1) as signer:
+        client = async_client(dummy_data, recording_handler(requests), jwt_signer=signer)
+
+        async def create_calls():
+            params = {'to': [{'type': 'phone', 'number': '14843331234'}]}
+            return await asyncio.gather(*(client.voice.create_call(params) for _ in range(3)))
+
+        asyncio.run(create_calls())
+
+    tokens = {request.headers['Authorization'] for request in requests}
+    assert len(tokens) == 1
+    token = tokens.pop()[len('Bearer ') :]
+    claims = jwt.decode(token, dummy_data.public_key, algorithms='RS256')
+    assert claims['application_id'] == dummy_data.application_id
+    assert client.jwt_cache.stats['tokens_signed'] == 1
+
+
+class AsyncOnlySigner:
+    """Fails if a token is signed synchronously, which would block the event loop."""
+
+    def __init__(self, dummy_data):
+        self._signer = vonage.KeySigner(dummy_data.application_id, dummy_data.private_key)
+        self.tokens_signed = 0
+
+    def sign(self, claims):
+        raise AssertionError('Signed a JWT synchronously')
+
+    async def sign_async(self, claims):
+        self.tokens_signed += 1
+        return self._signer.sign(claims)
+
+
+def test_async_streaming_requests_sign_jwts_asynchronously(dummy_data):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.url.path.endswith('/items/download'):
+            return httpx.Response(200, content=b'"name"\n"Alice"\n')
+        if request.url.path.endswith('/items/import'):
+            return httpx.Response(200, json={'inserted': 1})
+        return httpx.Response(200, content=b'THISISANMP3', headers={'content-type': 'audio/mpeg'})
+
+    signer = AsyncOnlySigner(dummy_data)
+    client = async_client(dummy_data, handler, jwt_signer=signer, cache_jwts=False)
+    url = 'https://api.nexmo.com/v1/files/abc'
+
+    async def stream():
+        await client.voice.get_recording(url)
+        await client.voice.download_recording(url, io.BytesIO())
+        [item async for item in client.proactive_connect.iter_list_items('list_id')]
+        await client.proactive_connect.upload_list_items_from_rows('list_id', [{'name': 'Bob'}])
+
+    asyncio.run(stream())
+
+    assert signer.tokens_signed == 4
+    assert all(request.headers['Authorization'].startswith('Bearer ') for request in requests)
+
+
+def test_async_get_drops_none_params(dummy_data):
+    requests = []
+    client = async_client(dummy_data, recording_handler(requests))
+
+    asyncio.run(client.users.list_users())
+
+    assert requests[0].url.params.get('order') == 'asc'
+    assert 'cursor' not in requests[0].url.params
+    assert 'Authorization' not in client.headers
+
+
+def test_async_video_create_session(dummy_data):
+    requests = []
+    handler = recording_handler(requests, body=[{'session_id': 'my_session_id'}])
+    client = async_client(dummy_data, handler)
+
+    session_info = asyncio.run(client.video.create_session({'media_mode': 'relayed'}))
+
+    assert session_info == {
+        'session_id': 'my_session_id',
+        'archive_mode': 'manual',
+        'media_mode': 'relayed',
+        'location': None,
+    }
+    assert parse_qs(requests[0].content.decode())['p2p.preference'] == ['enabled']
+
+
+def test_async_voice_get_recording(dummy_data):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, content=b'THISISANMP3', headers={'content-type': 'audio/mpeg'})
+
+    client = async_client(dummy_data, handler)
+    url = 'https://api.nexmo.com/v1/files/d6e47a2e-3414-11e8-8c2c-2f8b643ed957'
+
+    assert asyncio.run(client.voice.get_recording(url)) == b'THISISANMP3'
+    assert requests[0].headers['Authorization'].startswith('Bearer ')
+
+
+def test_async_client_error(dummy_data):
+    body = {'type': 'BAD_REQUEST', 'title': 'Bad Request', 'detail': 'Missing field'}
+    client = async_client(dummy_data, recording_handler([], status_code=400, body=body))
+
+    with raises(ClientError) as err:
+        asyncio.run(client.verify2.cancel_verification('c11236f4-00bf-4b89-84ba-88b25df97315'))
+    assert str(err.value) == 'Bad Request: Missing field (BAD_REQUEST)'
+
+
+def test_async_invalid_auth_type_raises_error(dummy_data):
+    client = async_client(dummy_data, recording_handler([]))
+
+    with raises(InvalidAuthenticationTypeError):
+        asyncio.run(client.get(client.host(), '/my/request/uri', auth_type='magic'))
+
+
+def test_async_client_context_manager_closes_session(dummy_data):
+    async def use_client():
+        async with async_client(dummy_data, recording_handler([])) as client:
+            await client.account.get_balance()
+        return client
+
+    client = asyncio.run(use_client())
+    assert client.session.is_closed
+
+
+def test_async_client_timeout(dummy_data):
+    client = vonage.AsyncClient(key=dummy_data.api_key, secret=dummy_data.api_secret, timeout=(1, 5))
+    assert client.session.timeout.connect == 1
+    assert client.session.timeout.read == 5
+
+
+def test_async_sms_send_messages(dummy_data):
+    requests = []
+    client = async_client(dummy_data, recording_handler(requests))
+    messages = ({'from': 'Python', 'to': '447525856424', 'text': str(i)} for i in range(10))
+
+    async def send():
+        return [result async for result in client.sms.send_messages(messages, max_workers=3)]
+
+    results = asyncio.run(send())
+
+    assert sorted(index for index, _ in results) == list(range(10))
+    assert all(response == {'key': 'value'} for _, response in results)
+    assert len(requests) == 10
+
+
+def test_async_messages_send_messages(dummy_data):
+    requests = []
+    handler = recording_handler(requests, body={'message_uuid': 'my-uuid'})
+    client = async_client(dummy_data, handler)
+    messages = [
+        {'channel': 'sms', 'message_type': 'text', 'to': '447525856424', 'from': 'Python', 'text': str(i)}
+        for i in range(5)
+    ]
+    messages.append({'channel': 'carrier_pigeon', 'message_type': 'text'})
+
+    async def send():
+        results = client.messages.send_messages(messages, max_workers=2, channel_rates={'sms': 100})
+        return dict([result async for result in results])
+
+    results = asyncio.run(send())
+
+    assert [results[i] for i in range(5)] == ['my-uuid'] * 5
+    assert isinstance(results[5], vonage.MessagesError)
+    assert len(requests) == 5
+
+
+def test_async_verify2_new_requests(dummy_data):
+    requests = []
+    handler = recording_handler(requests, body={'request_id': 'my-request-id'})
+    client = async_client(dummy_data, handler)
+    verify_requests = [
+        {'brand': 'ACME, Inc', 'workflow': [{'channel': 'sms', 'to': f'44770090000{i}'}]} for i in range(4)
+    ]
+
+    async def verify():
+        return dict([result async for result in client.verify2.new_requests(verify_requests, max_workers=2)])
+
+    results = asyncio.run(verify())
+
+    assert [results[i] for i in range(4)] == [{'request_id': 'my-request-id'}] * 4
+    assert len(requests) == 4
+
+
+def test_async_client_retries_requests(dummy_data):
+    statuses = [503, 200]
+
+    def handler(request):
+        return httpx.Response(statuses.pop(0), json={'value': 10.0})
+
+    client = async_client(dummy_data, handler, retry_policy=vonage.RetryPolicy(backoff_factor=0))
+
+    assert asyncio.run(client.account.get_balance()) == {'value': 10.0}
+    assert client.retry_policy.retries == 1
+
+
+def test_async_iter_users(dummy_data):
+    def handler(request):
+        cursor = request.url.params.get('cursor', 'page1')
+        body = {'page_size': 1, '_embedded': {'users': [{'name': cursor}]}}
+        if cursor == 'page1':
+            body['_links'] = {'next': {'href': 'https://api.nexmo.com/v1/users?cursor=page2'}}
+        return httpx.Response(200, json=body)
+
+    client = async_client(dummy_data, handler)
+
+    async def iterate():
+        return [user['name'] async for user in client.users.iter_users(page_size=1, prefetch=True)]
+
+    assert asyncio.run(iterate()) == ['page1', 'page2']
+
+
+def test_async_proactive_connect_iter_list_items(dummy_data):
+    def handler(request):
+        return httpx.Response(200, content=b'"name","number"\n"Alice",1\n"Bob",2\n')
+
+    client = async_client(dummy_data, handler)
+
+    async def iterate():
+        return [item async for item in client.proactive_connect.iter_list_items('list_id', chunk_size=5)]
+
+    assert asyncio.run(iterate()) == [{'name': 'Alice', 'number': '1'}, {'name': 'Bob', 'number': '2'}]
+
+
+def test_async_proactive_connect_upload_list_items_from_rows(dummy_data):
+    bodies = []
+
+    async def handler(request):
+        bodies.append(await request.aread())
+        return httpx.Response(200, json={'inserted': 2})
+
+    client = async_client(dummy_data, handler)
+
+    async def rows():
+        for i in range(3):
+            yield {'firstName': f'Name {i}'}
+
+    results = asyncio.run(
+        client.proactive_connect.upload_list_items_from_rows('list_id', rows(), batch_size=2)
+    )
+
+    assert results == [{'inserted': 2}, {'inserted': 2}]
+    assert b'firstName\r\nName 0\r\nName 1\r\n' in bodies[0]
+    assert b'firstName\r\nName 2\r\n' in bodies[1]
+
+
+def test_async_voice_download_recording_resumes(dummy_data, tmp_path):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(206, content=b'ANMP3')
+
+    client = async_client(dummy_data, handler)
+    dest = tmp_path / 'recording.mp3'
+    dest.write_bytes(b'THISIS')
+
+    size = asyncio.run(
+        client.voice.download_recording('https://api.nexmo.com/v1/files/abc', str(dest), resume=True)
+    )
+
+    assert size == 11
+    assert dest.read_bytes() == b'THISISANMP3'
+    assert requests[0].headers['Range'] == 'bytes=6-'
+
+
+def test_async_voice_failed_download_recording_leaves_missing_file_missing(dummy_data, tmp_path):
+    client = async_client(dummy_data, lambda request: httpx.Response(404, json={}))
+    dest = tmp_path / 'recording.mp3'
+
+    with raises(ClientError):
+        asyncio.run(client.voice.download_recording('https://api.nexmo.com/v1/files/abc', str(dest)))
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_async_voice_download_recordings(dummy_data, tmp_path):
+    client = async_client(dummy_data, lambda request: httpx.Response(200, content=b'THISISANMP3'))
+    downloads = [(f'https://api.nexmo.com/v1/files/{i}', str(tmp_path / f'{i}.mp3')) for i in range(3)]
+
+    async def download():
+        return [result async for result in client.voice.download_recordings(downloads)]
+
+    assert sorted(asyncio.run(download())) == [(0, 11), (1, 11), (2, 11)]
+    assert (tmp_path / '2.mp3').read_bytes() == b'THISISANMP3'
+
+
+def test_async_number_insight_get_number_insights(dummy_data):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={'status': 0, 'number': request.url.params['number']})
+
+    client = async_client(dummy_data, handler)
+
+    async def look_up():
+        numbers = ['447700900000', '447700900001', '447700900000']
+        return dict([result async for result in client.number_insight.get_number_insights(numbers)])
+
+    insights = asyncio.run(look_up())
+
+    assert insights == {
+        '447700900000': {'status': 0, 'number': '447700900000'},
+        '447700900001': {'status': 0, 'number': '447700900001'},
+    }
+    assert len(requests) == 2
@@ -0,0 +1,198 @@
+from vonage.cache import (
+    TTLCache,
+    JwtCache,
+    InsightCache,
+    SqliteCacheBackend,
+    RedisCacheBackend,
+)
+
+from time import time
+from unittest.mock import patch
+from pytest import raises
+
+
+def test_ttl_cache_get_and_set():
+    cache = TTLCache(maxsize=2)
+    cache.set('a', 1)
+
+    assert cache.get('a') == 1
+    assert cache.get('b') is None
+    assert cache.get('b', 'default') == 'default'
+    assert cache.stats == {'hits': 1, 'misses': 2, 'evictions': 0, 'size': 1}
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('c', 3)
+
+    assert cache.get('a') == 1
+    assert cache.get('b') is None
+    assert cache.get('c') == 3
+    assert cache.evictions == 1
+    assert len(cache) == 2
+
+
+def test_ttl_cache_entries_expire():
+    cache = TTLCache(ttl=10)
+    with patch('vonage.cache.monotonic', return_value=100):
+        cache.set('a', 1)
+        cache.set('b', 2, ttl=30)
+    with patch('vonage.cache.monotonic', return_value=115):
+        assert cache.get('a') is None
+        assert cache.get('b') == 2
+    assert len(cache) == 1
+
+
+def test_ttl_cache_pop_and_clear():
+    cache = TTLCache()
+    cache.set('a', 1)
+    cache.set('b', 2)
+
+    assert cache.pop('a') == 1
+    assert cache.pop('a') is None
+    cache.clear()
+    assert len(cache) == 0
+
+
+def sign(claims):
+    claims.setdefault('iat', int(time()))
+    claims.setdefault('exp', claims['iat'] + 900)
+    return f'token-{claims.get("jti", "")}-{claims.get("sub", "")}'.encode()
+
+
+def test_jwt_cache_reuses_tokens_for_the_same_claims():
+    cache = JwtCache()
+
+    assert cache.get_token({'sub': 'alice'}, sign) == b'token--alice'
+    assert cache.get_token({'sub': 'alice'}, sign) == b'token--alice'
+    assert cache.get_token({'sub': 'bob'}, sign) == b'token--bob'
+    assert cache.stats['hits'] == 1
+    assert cache.stats['misses'] == 2
+    assert cache.stats['tokens_signed'] == 2
+    assert cache.stats['signing_time'] > 0
+
+
+def test_jwt_cache_refreshes_token_after_refresh_fraction():
+    cache = JwtCache(refresh_fraction=0.5)
+    with patch('vonage.cache.monotonic', return_value=1000):
+        cache.get_token({'sub': 'alice'}, sign)
+
+    # Tokens from `sign` last 900 seconds, so they are reused for 450 seconds
+    with patch('vonage.cache.monotonic', return_value=1400):
+        cache.get_token({'sub': 'alice'}, sign)
+    assert cache.stats['tokens_signed'] == 1
+
+    with patch('vonage.cache.monotonic', return_value=1460):
+        cache.get_token({'sub': 'alice'}, sign)
+    assert cache.stats['tokens_signed'] == 2
+
+
+def test_jwt_cache_does_not_cache_tokens_with_a_jti():
+    cache = JwtCache()
+    cache.get_token({'jti': 'abc'}, sign)
+    cache.get_token({'jti': 'abc'}, sign)
+
+    assert cache.stats['tokens_signed'] == 2
+    assert cache.stats['hits'] == 0
+
+
+def test_jwt_cache_does_not_cache_expired_tokens():
+    cache = JwtCache()
+    cache.get_token({'exp': int(time()) - 10}, sign)
+    cache.get_token({'exp': int(time()) - 10}, sign)
+
+    assert cache.stats['tokens_signed'] == 2
+
+
+def test_jwt_cache_invalid_refresh_fraction():
+    with raises(ValueError):
+        JwtCache(refresh_fraction=0)
+    with raises(ValueError):
+        JwtCache(refresh_fraction=1.5)
+
+
+def test_insight_cache_only_caches_successful_responses():
+    cache = InsightCache()
+    cache.set('basic', {'number': '447700900000'}, {'status': 0, 'country_code': 'GB'})
+    cache.set('basic', {'number': '447700900001'}, {'status': 3, 'status_message': 'Invalid'})
+
+    assert cache.get('basic', {'number': '447700900000'}) == {'status': 0, 'country_code': 'GB'}
+    assert cache.get('standard', {'number': '447700900000'}) is None
+    assert cache.get('basic', {'number': '447700900001'}) is None
+    assert cache.stats == {'hits': 1, 'misses': 2}
+
+
+def test_insight_cache_copies_nested_objects():
+    cache = InsightCache()
+    insight = {'status': 0, 'roaming': {'status': 'not_roaming'}}
+    cache.set('advanced', {'number': '447700900000'}, insight)
+    insight['roaming']['status'] = 'roaming'
+    cache.get('advanced', {'number': '447700900000'})['roaming']['status'] = 'unknown'
+
+    assert cache.get('advanced', {'number': '447700900000'}) == {
+        'status': 0,
+        'roaming': {'status': 'not_roaming'},
+    }
+
+
+def test_insight_cache_uses_ttl_for_level():
+    cache = InsightCache(ttls={'advanced': 60})
+    with patch('vonage.cache.monotonic', side_effect=[1000, 1030, 1061]):
+        cache.set('advanced', {'number': '447700900000'}, {'status': 0})
+        assert cache.get('advanced', {'number': '447700900000'}) == {'status': 0}
+        assert cache.get('advanced', {'number': '447700900000'}) is None
+    assert cache.ttls['basic'] == InsightCache.DEFAULT_TTLS['basic']
+
+
+def test_sqlite_cache_backend(tmp_path):
+    path = str(tmp_path / 'cache.db')
+    backend = SqliteCacheBackend(path, maxsize=2)
+    backend.set('a', {'status': 0})
+    backend.set('b', {'status': 0}, ttl=-1)
+
+    assert backend.get('a') == {'status': 0}
+    assert backend.get('b') is None
+    assert backend.stats == {'hits': 1, 'misses': 1, 'evictions': 0}
+
+    # Entries are kept on disk, so another backend using the same file can read them
+    assert SqliteCacheBackend(path).get('a') == {'status': 0}
+
+
+def test_sqlite_cache_backend_evicts_expired_then_least_recently_used(tmp_path):
+    backend = SqliteCacheBackend(str(tmp_path / 'cache.db'), maxsize=2)
+    with patch('vonage.cache.time', side_effect=[100, 101, 102, 103, 104]):
+        backend.set('a', 1)
+        backend.set('b', 2, ttl=1)
+        assert backend.get('a') == 1
+        # 'b' has expired, so it is deleted to make room for 'c'
+        backend.set('c', 3)
+        # 'a' is the least recently used entry, so it is evicted to make room for 'd'
+        backend.set('d', 4)
+
+    assert len(backend) == 2
+    assert backend.get('a') is None
+    assert backend.get('c') == 3
+    assert backend.get('d') == 4
+    assert backend.stats['evictions'] == 1
+
+
+def test_redis_cache_backend():
+    class FakeRedis:
+        def __init__(self):
+            self.values = {}
+
+        def get(self, key):
+            return self.values.get(key, (None,))[0]
+
+        def set(self, key, value, ex=None):
+            self.values[key] = (value, ex)
+
+    redis_client = FakeRedis()
+    cache = InsightCache(backend=RedisCacheBackend(redis_client))
+    cache.set('standard', {'number': '447700900000'}, {'status': 0})
+
+    assert cache.get('standard', {'number': '447700900000'}) == {'status': 0}
+    assert redis_client.values['vonage:standard:{"number": "447700900000"}'][1] == 86400
@@ -2,6 +2,8 @@ import vonage
 from util import *
 from vonage.errors import InvalidAuthenticationTypeError
 
+from concurrent.futures import ThreadPoolExecutor
+
 
 def test_client_doesnt_require_api_key(dummy_data):
     client = vonage.Client(application_id="myid", private_key=dummy_data.private_key)
@@ -34,3 +36,37 @@ def test_timeout_is_set_on_client_calls(dummy_data):
 
     assert len(responses.calls) == 1
     assert responses.calls[0].request.req_kwargs["timeout"] == 1
+
+
+@responses.activate
+def test_requests_do_not_modify_client_headers(client):
+    stub(responses.GET, "https://api.nexmo.com/v1/calls")
+    stub(responses.POST, "https://api.nexmo.com/v1/users")
+    headers = dict(client.headers)
+
+    client.voice.get_calls()
+    client.users.create_user({'name': 'my_user_name'})
+    client.get(client.api_host(), '/v1/calls', auth_type='header')
+
+    assert client.headers == headers
+    assert 'Authorization' not in client.headers
+
+
+@responses.activate
+def test_client_can_be_shared_between_threads(client):
+    stub(responses.GET, "https://api.nexmo.com/v1/calls")
+    auth_types = ['jwt', 'header'] * 50
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(
+            executor.map(
+                lambda auth_type: client.get(client.api_host(), '/v1/calls', auth_type=auth_type),
+                auth_types,
+            )
+        )
+
+    authorizations = [call.request.headers['Authorization'] for call in responses.calls]
+    authorizations = [auth.decode() if type(auth) is bytes else auth for auth in authorizations]
+    assert len(authorizations) == 100
+    assert sum(1 for auth in authorizations if auth.startswith('Bearer ')) == 50
+    assert sum(1 for auth in authorizations if auth.startswith('Basic ')) == 50
@@ -52,3 +52,34 @@ def test_create_jwt_error_no_application_id_or_private_key():
         str(err.value)
         == 'JWT generation failed. Check that you passed in valid values for "application_id" and "private_key".'
     )
+
+
+def test_generate_application_jwt_reuses_cached_token(client):
+    first_jwt = client._generate_application_jwt()
+    second_jwt = client._generate_application_jwt()
+
+    assert first_jwt == second_jwt
+    assert client.jwt_cache.stats['hits'] == 1
+    assert client.jwt_cache.stats['misses'] == 1
+    assert client.jwt_cache.stats['tokens_signed'] == 1
+    assert client._jwt_claims == {}
+
+
+def test_generate_application_jwt_new_claims_signs_new_token(client):
+    first_jwt = client._generate_application_jwt()
+    client.auth(nbf=now, exp=now + 1000)
+    second_jwt = client._generate_application_jwt()
+
+    assert first_jwt != second_jwt
+    assert client.jwt_cache.stats['tokens_signed'] == 2
+
+
+def test_generate_application_jwt_cache_disabled(dummy_data):
+    client = Client(
+        application_id=dummy_data.application_id,
+        private_key=dummy_data.private_key,
+        cache_jwts=False,
+    )
+    assert client.jwt_cache is None
+    assert client._generate_application_jwt() != client._generate_application_jwt()
+    assert client._jwt_claims == {}
@@ -0,0 +1,90 @@
+from vonage import JwtVerifier
+from vonage_jwt.verify_jwt import VonageVerifyJwtError
+
+import jwt
+import string
+from time import monotonic, time
+from unittest.mock import patch
+from pytest import raises
+
+SIGNATURE_SECRET = 'qwertyuiopasdfghjklzxcvbnm123456'
+
+
+def make_token(secret=SIGNATURE_SECRET, **claims):
+    return jwt.encode({'iat': int(time()), 'exp': int(time()) + 300, **claims}, secret, algorithm='HS256')
+
+
+def test_verify_valid_token():
+    verifier = JwtVerifier(SIGNATURE_SECRET)
+    assert verifier.verify(make_token(payload_hash='abc')) is True
+
+
+def test_verify_invalid_signature():
+    verifier = JwtVerifier(SIGNATURE_SECRET)
+    assert verifier.verify(make_token(secret='a different secret of 32 bytes!!')) is False
+
+
+def test_verify_expired_token():
+    verifier = JwtVerifier(SIGNATURE_SECRET)
+    token = make_token(iat=int(time()) - 600, exp=int(time()) - 300)
+
+    with raises(VonageVerifyJwtError) as err:
+        verifier.verify(token)
+    assert str(err.value) == 'Signature has expired'
+    assert JwtVerifier(SIGNATURE_SECRET, leeway=600).verify(token) is True
+
+
+def test_verify_rejects_other_algorithms_and_malformed_tokens():
+    verifier = JwtVerifier(SIGNATURE_SECRET)
+    with raises(VonageVerifyJwtError):
+        verifier.verify(jwt.encode({'a': 1}, SIGNATURE_SECRET * 2, algorithm='HS512'))
+    with raises(VonageVerifyJwtError):
+        verifier.verify('not a token')
+
+
+def test_verify_rejects_altered_signature_encodings():
+    verifier = JwtVerifier(SIGNATURE_SECRET)
+    token = make_token()
+    # The last character of an HS256 signature has 2 unused bits, which lenient decoders ignore
+    alphabet = string.ascii_uppercase + string.ascii_lowercase + string.digits + '-_'
+    unused_bit_changed = token[:-1] + alphabet[alphabet.index(token[-1]) ^ 1]
+    altered = [token + '=', token + '==', token[:-1] + '!' + token[-1], unused_bit_changed]
+
+    for altered_token in altered:
+        with raises(VonageVerifyJwtError):
+            verifier.verify(altered_token)
+    assert verifier.verify(token) is True
+    assert verifier.stats['hits'] == 0
+
+
+def test_verify_caches_results_until_token_expires():
+    verifier = JwtVerifier(SIGNATURE_SECRET)
+    token = make_token(exp=int(time()) + 10)
+
+    assert verifier.verify(token) is True
+    assert verifier.verify(token) is True
+    assert verifier.stats == {'hits': 1, 'misses': 1, 'tokens_verified': 1}
+
+    with patch('vonage.cache.monotonic', return_value=monotonic() + 11):
+        assert verifier.verify(token) is True
+    assert verifier.stats['tokens_verified'] == 2
+
+
+def test_verify_rejects_payloads_that_are_not_objects():
+    token = jwt.api_jws.encode(b'[1, 2]', SIGNATURE_SECRET, algorithm='HS256')
+
+    with raises(VonageVerifyJwtError):
+        JwtVerifier(SIGNATURE_SECRET).verify(token)
+
+
+def test_verify_many():
+    verifier = JwtVerifier(SIGNATURE_SECRET)
+    valid = make_token()
+    tokens = [valid, make_token(secret='a different secret of 32 bytes!!'), 'not a token', valid]
+
+    results = verifier.verify_many(tokens)
+
+    assert results[0] is True and results[3] is True
+    assert results[1] is False
+    assert isinstance(results[2], VonageVerifyJwtError)
+    assert verifier.tokens_verified == 2
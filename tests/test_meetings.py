@@ -781,3 +781,28 @@ def test_add_logo_to_theme_not_found_error(meetings):
         str(err.value)
         == 'Status Code 404: NotFoundError: could not find theme 90a21428-b74a-4221-adc3-783935d654dc'
     )
+
+
+@responses.activate
+def test_iter_rooms(meetings):
+    def list_rooms(request):
+        start_id = parse_qs(urlparse(request.url).query).get('start_id', ['0'])[0]
+        rooms = [{'id': f'{start_id}-{i}'} for i in range(2 if start_id == '0' else 1)]
+        body = {
+            'page_size': 2,
+            '_embedded': rooms,
+            '_links': {'next': {'href': 'https://api-eu.vonage.com/v1/meetings/rooms?page_size=2&start_id=2'}},
+        }
+        return 200, {}, json.dumps(body)
+
+    responses.add_callback(
+        responses.GET,
+        'https://api-eu.vonage.com/v1/meetings/rooms',
+        callback=list_rooms,
+        content_type='application/json',
+    )
+
+    rooms = [room['id'] for room in meetings.iter_rooms(page_size=2)]
+
+    assert rooms == ['0-0', '0-1', '2-0']
+    assert len(responses.calls) == 2
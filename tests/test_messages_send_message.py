@@ -1,4 +1,8 @@
 from util import *
+from vonage.errors import ClientError, MessagesError
+
+import json
+from unittest.mock import patch
 
 
 @responses.activate
@@ -40,3 +44,58 @@ def test_send_whatsapp_image_with_messages_api(messages, dummy_data):
         b'"image": {"url": "https://example.com/image.jpg", "caption": "fake test image"}'
         in request_body()
     )
+
+
+def message_uuid_callback(request):
+    body = json.loads(request.body)
+    if body['to'] == '447000000000':
+        return (422, {}, '{"title": "Invalid params"}')
+    return (202, {}, json.dumps({'message_uuid': f'uuid-{body["text"]}'}))
+
+
+@responses.activate
+def test_send_messages_across_channels(messages):
+    responses.add_callback(
+        responses.POST,
+        'https://api.nexmo.com/v1/messages',
+        callback=message_uuid_callback,
+        content_type='application/json',
+    )
+    params = [
+        {'channel': 'sms', 'message_type': 'text', 'to': '447123456789', 'from': 'Vonage', 'text': '0'},
+        {'channel': 'whatsapp', 'message_type': 'text', 'to': '447123456789', 'from': '440123456789', 'text': '1'},
+        {'channel': 'viber_service', 'message_type': 'text', 'to': '447123456789', 'from': 'Vonage', 'text': '2'},
+        {'channel': 'mms', 'message_type': 'video', 'to': 'not a number', 'from': 'Vonage', 'text': '3'},
+        {'channel': 'sms', 'message_type': 'text', 'to': '447000000000', 'from': 'Vonage', 'text': '4'},
+    ]
+    params[2]['viber_service'] = {'category': 'transaction'}
+
+    results = dict(messages.send_messages(iter(params), max_workers=3))
+
+    assert [results[i] for i in range(3)] == ['uuid-0', 'uuid-1', 'uuid-2']
+    assert isinstance(results[3], MessagesError)
+    assert isinstance(results[4], ClientError)
+    assert len(responses.calls) == 4
+    sent_channels = sorted(json.loads(call.request.body)['channel'] for call in responses.calls)
+    assert sent_channels == ['sms', 'sms', 'viber_service', 'whatsapp']
+
+
+@responses.activate
+def test_send_messages_throttles_each_channel(messages):
+    responses.add_callback(
+        responses.POST,
+        'https://api.nexmo.com/v1/messages',
+        callback=message_uuid_callback,
+        content_type='application/json',
+    )
+    params = [
+        {'channel': channel, 'message_type': 'text', 'to': '447123456789', 'from': '440123456789', 'text': str(i)}
+        for i, channel in enumerate(['whatsapp', 'whatsapp', 'whatsapp', 'sms', 'sms'])
+    ]
+
+    with patch('vonage.messages.sleep') as mock_sleep:
+        results = list(messages.send_messages(params, max_workers=1, channel_rates={'whatsapp': 1}))
+
+    assert len(results) == 5
+    # The first WhatsApp message is sent straight away, then WhatsApp is paced at 1 per second
+    assert mock_sleep.call_count == 2
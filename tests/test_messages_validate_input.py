@@ -98,7 +98,7 @@ def test_invalid_sender(messages):
 
 
 def test_set_client_ref(messages):
-    messages._check_valid_client_ref(
+    messages.validate_send_message_input(
         {
             'channel': 'sms',
             'message_type': 'text',
@@ -113,7 +113,7 @@ def test_set_client_ref(messages):
 
 def test_invalid_client_ref(messages):
     with pytest.raises(MessagesError) as err:
-        messages._check_valid_client_ref(
+        messages.validate_send_message_input(
             {
                 'channel': 'sms',
                 'message_type': 'text',
@@ -313,3 +313,35 @@ def test_whatsapp_sticker_exclusive_keys_error(messages):
     assert (
         str(err.value) == 'Must specify one, and only one, of "id" or "url" in the "sticker" field.'
     )
+
+
+def test_recipient_number_with_trailing_newline(messages):
+    with pytest.raises(MessagesError) as err:
+        messages.validate_send_message_input(
+            {
+                'channel': 'sms',
+                'message_type': 'text',
+                'to': '441234567890\n',
+                'from': 'vonage',
+                'text': 'my important message',
+            }
+        )
+    assert str(err.value) == 'Message recipient number ("to=441234567890\n") not in a valid format.'
+
+
+def test_validate_many(messages):
+    results = messages.validate_many(
+        [
+            {'channel': 'sms', 'message_type': 'text', 'to': '441234567890', 'from': 'vonage', 'text': 'Hi'},
+            {'channel': 'sms', 'message_type': 'video', 'to': '441234567890', 'from': 'vonage'},
+            'not a dict',
+            {'channel': 'messenger', 'message_type': 'text', 'to': '0123456789', 'from': '9876543210', 'text': 'Hi'},
+            {'channel': 'viber_service', 'message_type': 'text', 'to': '44123456789', 'from': 'vonage'},
+        ]
+    )
+
+    assert results[0] is None
+    assert '"video" is not a valid message type for channel "sms".' in str(results[1])
+    assert str(results[2]) == 'Parameters to the send_message method must be specified as a dictionary.'
+    assert results[3] is None
+    assert str(results[4]) == 'You must specify all required properties for message channel "viber_service".'
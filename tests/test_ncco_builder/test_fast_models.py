@@ -0,0 +1,97 @@
+import json
+
+from vonage import Ncco, ConnectEndpoints, InputTypes, PayPrompts
+
+from pytest import mark, raises
+
+actions = [
+    (Ncco.Record, {'eventUrl': 'http://example.com/events', 'eventMethod': 'put'}),
+    (Ncco.Record, {'channels': 4}),
+    (
+        Ncco.Conversation,
+        {'name': 'my_conversation', 'musicOnHoldUrl': 'http://example.com/music.mp3', 'record': True},
+    ),
+    (
+        Ncco.Connect,
+        {
+            'endpoint': {'type': 'phone', 'number': '447000000000', 'dtmfAnswer': '2p02p'},
+            'from_': '447400000000',
+            'eventUrl': 'http://example.com',
+            'eventMethod': 'put',
+        },
+    ),
+    (Ncco.Connect, {'endpoint': [{'type': 'app', 'user': 'test_user'}], 'randomFromNumber': True}),
+    (Ncco.Connect, {'endpoint': ConnectEndpoints.PhoneEndpoint(number='447000000000')}),
+    (Ncco.Talk, {'text': 'hello', 'bargeIn': True, 'loop': 3, 'level': 0.5, 'premium': True}),
+    (Ncco.Stream, {'streamUrl': 'https://example.com/stream/music.mp3', 'loop': 10}),
+    (
+        Ncco.Input,
+        {
+            'type': 'dtmf',
+            'dtmf': {'maxDigits': 1, 'timeOut': 5},
+            'speech': InputTypes.Speech(language='en-GB'),
+            'eventUrl': 'http://example.com/speech',
+        },
+    ),
+    (Ncco.Notify, {'payload': {'message': 'world'}, 'eventUrl': ['http://example.com']}),
+    (Ncco.Pay, {'amount': 10.555, 'currency': 'GBP', 'voice': {'language': 'en-GB', 'style': 1}}),
+    (
+        Ncco.Pay,
+        {
+            'amount': 99.99,
+            'prompts': {
+                'type': 'CardNumber',
+                'text': 'Enter your card number.',
+                'errors': {'InvalidCardType': {'text': 'The card you are trying to use is not valid.'}},
+            },
+        },
+    ),
+]
+
+
+@mark.parametrize('action, values', actions)
+def test_construct_fast_serializes_like_the_model(action, values):
+    model = action(**values)
+    fast_model = action.construct_fast(**values)
+
+    assert Ncco.build_ncco(fast_model) == Ncco.build_ncco(model)
+    assert Ncco.build_ncco_json(fast_model) == Ncco.build_ncco_json(model)
+    assert fast_model.dict(exclude_none=True) == model.dict(exclude_none=True)
+
+
+def test_construct_fast_with_fast_endpoint():
+    endpoint = ConnectEndpoints.PhoneEndpoint.construct_fast(number='447000000000')
+    connect = Ncco.Connect.construct_fast(endpoint=endpoint, timeout=15)
+
+    assert Ncco.build_ncco_json(connect) == Ncco.build_ncco_json(
+        Ncco.Connect(endpoint=ConnectEndpoints.PhoneEndpoint(number='447000000000'), timeout=15)
+    )
+
+
+def test_construct_fast_uses_slots():
+    talk = Ncco.Talk.construct_fast(text='hello')
+
+    assert talk.action == 'talk'
+    assert talk.text == 'hello'
+    assert talk.bargeIn is None
+    assert not hasattr(talk, '__dict__')
+    assert repr(talk).startswith("Ncco.Talk.construct_fast(action='talk', text='hello'")
+
+
+def test_construct_fast_skips_validation():
+    talk = Ncco.Talk.construct_fast(text='x' * 2000)
+    assert json.loads(Ncco.build_ncco_json(talk)) == [{'action': 'talk', 'text': 'x' * 2000}]
+
+
+def test_construct_fast_prompt_models():
+    voice = PayPrompts.VoicePrompt.construct_fast(language='en-GB')
+    dtmf = InputTypes.Dtmf.construct_fast(maxDigits=4)
+
+    assert voice.dict(exclude_none=True) == {'language': 'en-GB'}
+    assert dtmf.dict(exclude_none=True) == {'maxDigits': 4}
+
+
+def test_construct_fast_invalid_endpoint_type():
+    with raises(ValueError) as err:
+        Ncco.Connect.construct_fast(endpoint={'type': 'carrier_pigeon'})
+    assert 'Invalid "type" specified for endpoint object.' in str(err.value)
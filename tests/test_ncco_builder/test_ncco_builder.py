@@ -1,4 +1,5 @@
 import json
+from unittest.mock import patch
 
 from vonage import Ncco
 import ncco_samples.ncco_builder_samples as nbs
@@ -38,3 +39,34 @@ def test_build_insane_ncco():
     ]
     ncco = Ncco.build_ncco(actions=action_list)
     assert ncco == nbs.insane_ncco
+
+
+def test_build_ncco_json():
+    action_list = [
+        nbs.record,
+        nbs.conversation,
+        nbs.connect,
+        nbs.talk,
+        nbs.stream,
+        nbs.input,
+        nbs.notify,
+        nbs.pay_voice_prompt,
+        nbs.pay_text_prompt,
+    ]
+    ncco_json = Ncco.build_ncco_json(actions=action_list)
+    assert isinstance(ncco_json, bytes)
+    assert json.loads(ncco_json) == nbs.insane_ncco
+
+
+def test_build_ncco_json_from_args():
+    ncco_json = Ncco.build_ncco_json(nbs.talk_minimal, actions=[nbs.record])
+    assert (
+        ncco_json
+        == b'[{"action":"record","eventUrl":["http://example.com/events"]},{"action":"talk","text":"hello"}]'
+    )
+
+
+def test_build_ncco_json_without_orjson():
+    with patch('vonage.ncco_builder.ncco.orjson', None):
+        ncco_json = Ncco.build_ncco_json(nbs.connect_advancedMachineDetection, nbs.talk_minimal)
+    assert json.loads(ncco_json) == Ncco.build_ncco(nbs.connect_advancedMachineDetection, nbs.talk_minimal)
@@ -0,0 +1,63 @@
+import json
+
+from vonage import Ncco, NccoCache
+
+
+def test_get_or_build():
+    cache = NccoCache()
+    calls = []
+
+    def build_menu():
+        calls.append(1)
+        return [Ncco.Talk(text='Press 1 for sales.'), Ncco.Input(type='dtmf')]
+
+    first = cache.get_or_build('main_menu', build_menu)
+    second = cache.get_or_build('main_menu', build_menu)
+
+    assert first is second
+    assert len(calls) == 1
+    assert json.loads(first) == [
+        {'action': 'talk', 'text': 'Press 1 for sales.'},
+        {'action': 'input', 'type': ['dtmf']},
+    ]
+
+
+def test_cache_evicts_least_recently_used():
+    cache = NccoCache(maxsize=2)
+
+    cache.get_or_build('a', lambda: [Ncco.Talk(text='a')])
+    cache.get_or_build('b', lambda: [Ncco.Talk(text='b')])
+    cache.get_or_build('a', lambda: [Ncco.Talk(text='a')])
+    cache.get_or_build('c', lambda: [Ncco.Talk(text='c')])
+
+    assert cache.stats['evictions'] == 1
+    assert cache.stats['size'] == 2
+    cache.get_or_build('a', lambda: [Ncco.Talk(text='a')])
+    assert cache.stats['hits'] == 2
+
+
+def test_large_nccos_are_not_cached():
+    cache = NccoCache(max_ncco_bytes=50)
+
+    cache.get_or_build('long', lambda: [Ncco.Talk(text='x' * 100)])
+    cache.get_or_build('short', lambda: [Ncco.Talk(text='x')])
+
+    assert cache.stats['size'] == 1
+
+
+def test_get_or_build_matches_ncco_build_ncco_json():
+    cache = NccoCache()
+    actions = [Ncco.Stream(streamUrl='https://example.com/music.mp3', loop=0), Ncco.Talk(text='hello')]
+
+    assert cache.get_or_build(('hold', 'en-GB'), lambda: actions) == Ncco.build_ncco_json(actions=actions)
+
+
+def test_invalidate():
+    cache = NccoCache()
+
+    cache.get_or_build('menu', lambda: [Ncco.Talk(text='old')])
+    cache.invalidate('menu')
+    ncco_json = cache.get_or_build('menu', lambda: [Ncco.Talk(text='new')])
+
+    assert json.loads(ncco_json) == [{'action': 'talk', 'text': 'new'}]
+    cache.invalidate('missing')
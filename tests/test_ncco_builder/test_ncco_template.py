@@ -0,0 +1,62 @@
+import json
+
+from vonage import Ncco
+import ncco_samples.ncco_builder_samples as nbs
+
+from pytest import raises
+
+
+def test_compile_template_without_placeholders():
+    template = Ncco.compile_template(nbs.record, nbs.talk_minimal)
+
+    assert template.placeholders == set()
+    assert json.loads(template.render()) == nbs.two_part_ncco
+
+
+def test_render_template():
+    template = Ncco.compile_template(
+        Ncco.Talk(text=f'Hello {Ncco.Placeholder("caller_name")}, please hold.', bargeIn=True),
+        Ncco.Conversation(name=Ncco.Placeholder('conversation_name'), startOnEnter=True),
+        actions=[Ncco.Notify(payload={'type': 'hold'}, eventUrl=Ncco.Placeholder('event_url'))],
+    )
+
+    assert template.placeholders == {'caller_name', 'conversation_name', 'event_url'}
+    rendered = template.render(
+        caller_name='Alice "Al" Smith', conversation_name='conf-1234', event_url='https://example.com/events'
+    )
+    assert json.loads(rendered) == [
+        {'action': 'notify', 'payload': {'type': 'hold'}, 'eventUrl': ['https://example.com/events']},
+        {'action': 'talk', 'text': 'Hello Alice "Al" Smith, please hold.', 'bargeIn': True},
+        {'action': 'conversation', 'name': 'conf-1234', 'startOnEnter': True},
+    ]
+
+
+def test_render_template_matches_build_ncco():
+    caller_name = Ncco.Placeholder('caller_name')
+    template = Ncco.compile_template(Ncco.Talk(text=f'Hi {caller_name}'), nbs.connect)
+
+    assert json.loads(template.render(caller_name='Bob')) == Ncco.build_ncco(
+        Ncco.Talk(text='Hi Bob'), nbs.connect
+    )
+
+
+def test_render_template_missing_value():
+    template = Ncco.compile_template(Ncco.Conversation(name=Ncco.Placeholder('conversation_name')))
+
+    with raises(ValueError) as err:
+        template.render()
+    assert str(err.value) == "No values passed for placeholders: ['conversation_name']"
+
+
+def test_invalid_placeholder_name():
+    with raises(ValueError) as err:
+        Ncco.Placeholder('caller name')
+    assert 'Invalid placeholder name "caller name"' in str(err.value)
+
+
+def test_placeholders_in_transformed_fields_are_rejected():
+    with raises(ValueError) as err:
+        Ncco.compile_template(
+            Ncco.Record(eventUrl='https://example.com/events', eventMethod=Ncco.Placeholder('method'))
+        )
+    assert 'Placeholder "method" was changed to "METHOD"' in str(err.value)
@@ -1,5 +1,9 @@
+import vonage
 from util import *
-from vonage.errors import CallbackRequiredError
+from vonage.errors import CallbackRequiredError, NumberInsightError, ServerError
+
+import json
+from pytest import raises
 
 
 @responses.activate
@@ -48,3 +52,55 @@ def test_callback_required_error_async_advanced_number_insight(number_insight, d
 
     with pytest.raises(CallbackRequiredError):
         number_insight.get_async_advanced_number_insight(params)
+
+
+@responses.activate
+def test_get_number_insights_deduplicates_numbers(number_insight):
+    def get_insight(request):
+        number = parse_qs(urlparse(request.url).query)["number"][0]
+        if number == "447700900002":
+            return 500, {}, ""
+        return 200, {}, json.dumps({"status": 0, "international_format_number": number})
+
+    responses.add_callback(
+        responses.GET,
+        "https://api.nexmo.com/ni/standard/json",
+        callback=get_insight,
+        content_type="application/json",
+    )
+    numbers = ["447700900000", "447700900001", "447700900000", "447700900002", "447700900001"]
+
+    insights = dict(
+        number_insight.get_number_insights(numbers, level="standard", max_workers=3, cnam="true")
+    )
+
+    assert insights["447700900000"]["international_format_number"] == "447700900000"
+    assert insights["447700900001"]["status"] == 0
+    assert isinstance(insights["447700900002"], ServerError)
+    assert len(responses.calls) == 3
+    assert request_params()["cnam"] == ["true"]
+
+
+def test_get_number_insights_invalid_level(number_insight):
+    with raises(NumberInsightError) as err:
+        number_insight.get_number_insights(["447700900000"], level="premium")
+    assert str(err.value) == "Invalid insight level \"premium\". Must be one of ['basic', 'standard', 'advanced']."
+
+
+@responses.activate
+def test_number_insight_cache(client, dummy_data):
+    responses.add(
+        responses.GET,
+        "https://api.nexmo.com/ni/basic/json",
+        json={"status": 0, "country_code": "GB"},
+    )
+    client.number_insight_cache = vonage.InsightCache()
+    number_insight = vonage.NumberInsight(client)
+
+    first = number_insight.get_basic_number_insight(number="447700900000")
+    second = number_insight.get_basic_number_insight(number="447700900000")
+    number_insight.get_basic_number_insight(number="447700900001")
+
+    assert first == second
+    assert len(responses.calls) == 2
+    assert client.number_insight_cache.stats == {"hits": 1, "misses": 2}
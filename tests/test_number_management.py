@@ -1,4 +1,5 @@
 from util import *
+import json
 
 
 @responses.activate
@@ -55,3 +56,24 @@ def test_update_number(numbers, dummy_data):
     assert "country=US" in request_body()
     assert "msisdn=number" in request_body()
     assert "moHttpUrl=callback" in request_body()
+
+
+@responses.activate
+def test_iter_account_numbers(numbers):
+    def get_account_numbers(request):
+        index = int(parse_qs(urlparse(request.url).query)['index'][0])
+        page = [{'msisdn': str(i)} for i in range((index - 1) * 2, min(index * 2, 5))]
+        return 200, {}, json.dumps({'count': 5, 'numbers': page})
+
+    responses.add_callback(
+        responses.GET,
+        "https://rest.nexmo.com/account/numbers",
+        callback=get_account_numbers,
+        content_type="application/json",
+    )
+
+    msisdns = [number["msisdn"] for number in numbers.iter_account_numbers(size=2, pattern="44")]
+
+    assert msisdns == ["0", "1", "2", "3", "4"]
+    assert len(responses.calls) == 3
+    assert request_params()["pattern"] == ["44"]
@@ -0,0 +1,141 @@
+from util import *
+from vonage import PricingIndex, Price
+from vonage.errors import PricingTypeError
+
+from decimal import Decimal
+from threading import Event, Thread
+from unittest.mock import patch
+import time
+from pytest import raises
+
+sms_pricing = {
+    "count": 3,
+    "countries": [
+        {
+            "countryCode": "GB",
+            "countryName": "United Kingdom",
+            "currency": "EUR",
+            "defaultPrice": "0.03330000",
+            "dialingPrefix": "44",
+            "networks": [
+                {
+                    "type": "mobile",
+                    "price": "0.04000000",
+                    "currency": "EUR",
+                    "networkCode": "23410",
+                    "networkName": "Telefonica UK Limited",
+                    "prefixes": ["447700", "44770"],
+                }
+            ],
+        },
+        {
+            "countryCode": "US",
+            "countryName": "United States of America",
+            "currency": "EUR",
+            "defaultPrice": "0.00810000",
+            "dialingPrefix": "1",
+            "networks": [],
+        },
+        {
+            "countryCode": "JM",
+            "countryName": "Jamaica",
+            "currency": "EUR",
+            "dialingPrefix": "1",
+            "networks": [{"type": "mobile", "price": "0.09000000", "currency": "EUR"}],
+        },
+    ],
+}
+
+
+@responses.activate
+def test_pricing_index_matches_longest_prefix(account):
+    responses.add(
+        responses.GET, "https://rest.nexmo.com/account/get-full-pricing/outbound/sms", json=sms_pricing
+    )
+    index = PricingIndex(account)
+
+    assert index.get_price("+44 7700 900000") == Price(
+        price=Decimal("0.04000000"),
+        currency="EUR",
+        prefix="447700",
+        country_code="GB",
+        country_name="United Kingdom",
+        network_code="23410",
+        network_name="Telefonica UK Limited",
+    )
+    assert index.get_price("447525856424").price == Decimal("0.03330000")
+    assert index.get_price("447525856424").network_code is None
+    # Countries that share a dialing prefix are priced at the most expensive country's price
+    assert index.get_price("18765550100").country_code == "JM"
+    assert index.get_price("999") is None
+    assert len(responses.calls) == 1
+    assert "sms" in index.refreshed_at
+
+
+@responses.activate
+def test_pricing_index_refresh_replaces_table(account):
+    responses.add(
+        responses.GET, "https://rest.nexmo.com/account/get-full-pricing/outbound/voice", json=sms_pricing
+    )
+    responses.add(
+        responses.GET,
+        "https://rest.nexmo.com/account/get-full-pricing/outbound/voice",
+        json={"count": 0, "countries": []},
+    )
+    index = PricingIndex(account, types=["voice"])
+
+    assert index.get_price("447525856424", type="voice") is not None
+    index.refresh()
+    assert index.get_price("447525856424", type="voice") is None
+    assert len(responses.calls) == 2
+
+
+def test_pricing_index_is_not_locked_while_downloading(account):
+    voice_requested, voice_downloaded = Event(), Event()
+
+    def get_all_countries_pricing(type):
+        if type == "voice":
+            voice_requested.set()
+            voice_downloaded.wait(5)
+        return sms_pricing
+
+    index = PricingIndex(account, types=["sms", "voice"])
+    with patch.object(account, "get_all_countries_pricing", side_effect=get_all_countries_pricing):
+        refresh = Thread(target=index.refresh, args=(["voice"],))
+        refresh.start()
+        voice_requested.wait(5)
+
+        # sms pricing is loaded while the voice table is still downloading
+        assert index.get_price("447525856424").country_code == "GB"
+        assert refresh.is_alive()
+        voice_downloaded.set()
+        refresh.join()
+
+    assert index.get_price("447525856424", type="voice").country_code == "GB"
+
+
+def test_pricing_index_invalid_types(account):
+    with raises(PricingTypeError):
+        PricingIndex(account, types=["mms"])
+
+    index = PricingIndex(account, types=["sms"])
+    with raises(PricingTypeError) as err:
+        index.get_price("447525856424", type="voice")
+    assert str(err.value) == 'Pricing type "voice" is not in this index.'
+
+
+@responses.activate
+def test_pricing_index_refreshes_in_background(account):
+    responses.add(
+        responses.GET, "https://rest.nexmo.com/account/get-full-pricing/outbound/sms", json=sms_pricing
+    )
+    index = PricingIndex(account, types=["sms"], refresh_interval=0.01)
+
+    index.start_refreshing()
+    deadline = time.monotonic() + 5
+    while len(responses.calls) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    index.stop_refreshing()
+
+    assert len(responses.calls) >= 2
+    assert index.get_price("447525856424").country_code == "GB"
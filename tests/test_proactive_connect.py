@@ -4,6 +4,8 @@ from util import *
 import responses
 from pytest import raises
 import csv
+import io
+import json
 
 
 @responses.activate
@@ -450,6 +452,46 @@ def test_download_list_items(proc):
     assert items[1]['least_favourite_number'] == '0'
 
 
+@responses.activate
+def test_download_list_items_to_file_object_with_progress(proc):
+    list_id = '246d17c4-79e6-4a25-8b4e-b777a83f6c30'
+    body = b'"favourite_number","least_favourite_number"\n0,1\n1,0\n'
+    responses.add(
+        responses.GET,
+        f'https://api-eu.vonage.com/v0.1/bulk/lists/{list_id}/items/download',
+        body=body,
+        headers={'Content-Length': str(len(body))},
+    )
+    progress = []
+    file = io.BytesIO()
+
+    proc.download_list_items(
+        list_id, file, chunk_size=16, on_progress=lambda done, total: progress.append((done, total))
+    )
+
+    assert file.getvalue() == body
+    assert progress == [(16, 52), (32, 52), (48, 52), (52, 52)]
+
+
+@responses.activate
+def test_iter_list_items_parses_records_split_across_chunks(proc):
+    list_id = '246d17c4-79e6-4a25-8b4e-b777a83f6c30'
+    body = '\ufeffname,notes\r\nJohn,"multi\nline, with ""quotes"""\r\n\r\nJosé,last\r\n'.encode()
+    stub_bytes(
+        responses.GET,
+        f'https://api-eu.vonage.com/v0.1/bulk/lists/{list_id}/items/download',
+        body,
+    )
+
+    items = list(proc.iter_list_items(list_id, chunk_size=3))
+
+    assert items == [
+        {'name': 'John', 'notes': 'multi\nline, with "quotes"'},
+        {'name': 'José', 'notes': 'last'},
+    ]
+    assert responses.calls[0].request.headers['Authorization'].startswith(b'Bearer ')
+
+
 @responses.activate
 def test_download_list_items_error_not_found(proc):
     list_id = '346d17c4-79e6-4a25-8b4e-b777a83f6c30'
@@ -608,6 +650,68 @@ def test_upload_list_items_from_csv(proc):
     assert response['inserted'] == 3
 
 
+@responses.activate
+def test_upload_list_items_from_rows_in_batches(proc):
+    list_id = '246d17c4-79e6-4a25-8b4e-b777a83f6c30'
+    uploads = []
+
+    def import_items(request):
+        boundary = request.headers['Content-Type'].split('boundary=')[1]
+        body = b''.join(request.body).decode()
+        csv_text = body.split('\r\n\r\n', 1)[1].rsplit(f'\r\n--{boundary}--', 1)[0]
+        uploads.append(list(csv.DictReader(io.StringIO(csv_text))))
+        return 200, {}, json.dumps({'inserted': len(uploads[-1]), 'updated': 0, 'deleted': 0})
+
+    responses.add_callback(
+        responses.POST,
+        f'https://api-eu.vonage.com/v0.1/bulk/lists/{list_id}/items/import',
+        callback=import_items,
+        content_type='application/json',
+    )
+    rows = ({'firstName': f'Name {i}', 'phone': f'44700700000{i}'} for i in range(5))
+
+    results = proc.upload_list_items_from_rows(list_id, rows, batch_size=2)
+
+    assert [result['inserted'] for result in results] == [2, 2, 1]
+    assert uploads[0] == [
+        {'firstName': 'Name 0', 'phone': '447007000000'},
+        {'firstName': 'Name 1', 'phone': '447007000001'},
+    ]
+    assert uploads[2] == [{'firstName': 'Name 4', 'phone': '447007000004'}]
+
+
+@responses.activate
+def test_upload_list_items_from_rows_ignores_keys_not_in_fieldnames(proc):
+    list_id = '246d17c4-79e6-4a25-8b4e-b777a83f6c30'
+    bodies = []
+
+    def import_items(request):
+        bodies.append(b''.join(request.body))
+        return 200, {}, json.dumps({'inserted': 2, 'updated': 0, 'deleted': 0})
+
+    responses.add_callback(
+        responses.POST,
+        f'https://api-eu.vonage.com/v0.1/bulk/lists/{list_id}/items/import',
+        callback=import_items,
+        content_type='application/json',
+    )
+    rows = [{'firstName': 'Name 0', 'phone': '447007000000'}, {'firstName': 'Name 1', 'id': 1}]
+
+    proc.upload_list_items_from_rows(list_id, rows, fieldnames=['firstName', 'phone'])
+
+    assert b'firstName,phone\r\nName 0,447007000000\r\nName 1,\r\n' in bodies[0]
+
+
+def test_upload_list_items_from_no_rows(proc):
+    assert proc.upload_list_items_from_rows('246d17c4-79e6-4a25-8b4e-b777a83f6c30', []) == []
+
+
+def test_upload_list_items_from_rows_invalid_batch_size(proc):
+    with raises(ProactiveConnectError) as err:
+        proc.upload_list_items_from_rows('246d17c4-79e6-4a25-8b4e-b777a83f6c30', [], batch_size=0)
+    assert str(err.value) == '"batch_size" must be at least 1.'
+
+
 @responses.activate
 def test_upload_list_items_from_csv_404(proc):
     list_id = '346d17c4-79e6-4a25-8b4e-b777a83f6c30'
@@ -647,3 +751,30 @@ def _read_csv_file(path):
         reader = csv.DictReader(csv_file)
         dict_list = [row for row in reader]
         return dict_list
+
+
+@responses.activate
+def test_iter_all_items(proc):
+    list_id = '246d17c4-79e6-4a25-8b4e-b777a83f6c30'
+
+    def list_items(request):
+        page = int(parse_qs(urlparse(request.url).query)['page'][0])
+        body = {
+            'page': page,
+            'total_pages': 2,
+            '_embedded': {'items': [{'id': f'{page}-{i}'} for i in range(2)]},
+        }
+        return 200, {}, json.dumps(body)
+
+    responses.add_callback(
+        responses.GET,
+        f'https://api-eu.vonage.com/v0.1/bulk/lists/{list_id}/items',
+        callback=list_items,
+        content_type='application/json',
+    )
+
+    items = [item['id'] for item in proc.iter_all_items(list_id, page_size=2, prefetch=True)]
+
+    assert items == ['1-0', '1-1', '2-0', '2-1']
+    assert len(responses.calls) == 2
+    assert request_params()['page_size'] == ['2']
@@ -0,0 +1,118 @@
+from util import *
+from vonage import Client
+from vonage.rate_limiter import TokenBucket, TokenBucketGroup, RateLimiter, FileBackend
+
+import asyncio
+import threading
+from unittest.mock import patch
+from pytest import raises
+
+
+def test_token_bucket_allows_a_burst_up_to_capacity():
+    with patch('vonage.rate_limiter.monotonic', return_value=100):
+        bucket = TokenBucket(rate=2, capacity=3)
+        assert [bucket.reserve() for _ in range(3)] == [0, 0, 0]
+        assert bucket.reserve() == 0.5
+        assert bucket.reserve() == 1.0
+
+
+def test_token_bucket_refills_over_time():
+    with patch('vonage.rate_limiter.monotonic', return_value=100):
+        bucket = TokenBucket(rate=10)
+        for _ in range(10):
+            bucket.reserve()
+    with patch('vonage.rate_limiter.monotonic', return_value=100.5):
+        assert [bucket.reserve() for _ in range(5)] == [0, 0, 0, 0, 0]
+        assert bucket.reserve() == 0.1
+
+
+def test_token_bucket_acquire_sleeps_for_reservation():
+    with patch('vonage.rate_limiter.monotonic', return_value=100):
+        bucket = TokenBucket(rate=1)
+        with patch('vonage.rate_limiter.sleep') as mock_sleep:
+            bucket.acquire()
+            bucket.acquire()
+    mock_sleep.assert_called_once_with(1.0)
+
+
+def test_token_bucket_invalid_rate():
+    with raises(ValueError):
+        TokenBucket(rate=0)
+
+
+def test_token_bucket_group_has_a_bucket_per_key():
+    with patch('vonage.rate_limiter.monotonic', return_value=100):
+        group = TokenBucketGroup(rate=1)
+        assert group.reserve('a') == 0
+        assert group.reserve('b') == 0
+        assert group.reserve('a') == 1.0
+    assert group['a'] is group['a']
+    assert group['a'] is not group['b']
+
+
+def test_rate_limiter_limits_matching_routes():
+    limiter = RateLimiter({'/sms': 1, 'api.nexmo.com/ni/': (2, 4)})
+    with patch('vonage.rate_limiter.monotonic', return_value=100):
+        assert limiter.reserve('https://rest.nexmo.com/sms/json') == 0
+        assert limiter.reserve('https://rest.nexmo.com/sms/json') == 1.0
+        assert [limiter.reserve('https://api.nexmo.com/ni/basic/json') for _ in range(5)] == [
+            0,
+            0,
+            0,
+            0,
+            0.5,
+        ]
+        assert limiter.reserve('https://api.nexmo.com/v1/calls') == 0
+    assert limiter.stats == {'waits': 2, 'wait_time': 1.5}
+
+
+def test_rate_limiter_invalid_limit():
+    with raises(ValueError):
+        RateLimiter({'/sms': 0})
+
+
+def test_file_backend_is_shared_between_instances(tmp_path):
+    path = str(tmp_path / 'buckets.json')
+    worker_1 = RateLimiter({'/sms': 1}, backend=FileBackend(path))
+    worker_2 = RateLimiter({'/sms': 1}, backend=FileBackend(path))
+
+    with patch('vonage.rate_limiter.time', return_value=100):
+        assert worker_1.reserve('https://rest.nexmo.com/sms/json') == 0
+        assert worker_2.reserve('https://rest.nexmo.com/sms/json') == 1.0
+        assert worker_1.reserve('https://rest.nexmo.com/sms/json') == 2.0
+    with patch('vonage.rate_limiter.time', return_value=104):
+        assert worker_2.reserve('https://rest.nexmo.com/sms/json') == 0
+
+
+def test_acquire_async_reserves_from_file_backend_off_the_event_loop(tmp_path):
+    limiter = RateLimiter({'/sms': 1}, backend=FileBackend(str(tmp_path / 'buckets.json')))
+    threads = []
+    reserve = limiter.backend.reserve
+
+    def record_thread(*args):
+        threads.append(threading.get_ident())
+        return reserve(*args)
+
+    limiter.backend.reserve = record_thread
+    asyncio.run(limiter.acquire_async('https://rest.nexmo.com/sms/json'))
+
+    assert threads and threads[0] != threading.get_ident()
+
+
+@responses.activate
+def test_client_waits_for_rate_limiter(dummy_data):
+    stub(responses.POST, 'https://rest.nexmo.com/sms/json')
+    stub(responses.GET, 'https://rest.nexmo.com/account/get-balance')
+    client = Client(
+        key=dummy_data.api_key,
+        secret=dummy_data.api_secret,
+        rate_limiter=RateLimiter({'/sms': 1}),
+    )
+
+    with patch('vonage.rate_limiter.sleep') as mock_sleep:
+        for _ in range(3):
+            client.sms.send_message({'from': 'Python', 'to': '447525856424', 'text': 'Hi'})
+        client.account.get_balance()
+
+    assert len(responses.calls) == 4
+    assert mock_sleep.call_count == 2
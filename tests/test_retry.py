@@ -0,0 +1,137 @@
+from util import *
+from vonage import Client, RetryPolicy, ClientError, ServerError
+from vonage._internal import match_route
+
+from email.utils import formatdate
+from time import time
+from unittest.mock import patch, Mock
+from pytest import raises
+
+
+def response_with(status_code, headers=None):
+    return Mock(status_code=status_code, headers=headers or {})
+
+
+def test_get_delay_backs_off_exponentially():
+    policy = RetryPolicy(max_retries=5, backoff_factor=1, max_backoff=10)
+    with patch('vonage.retry.random.uniform', side_effect=lambda low, high: high):
+        delays = [policy.get_delay('GET', response_with(503), retry) for retry in range(5)]
+    assert delays == [1, 2, 4, 8, 10]
+
+
+def test_get_delay_stops_after_max_retries():
+    policy = RetryPolicy(max_retries=2)
+    assert policy.get_delay('GET', response_with(500), 1) is not None
+    assert policy.get_delay('GET', response_with(500), 2) is None
+
+
+def test_get_delay_only_retries_configured_status_codes():
+    policy = RetryPolicy()
+    assert policy.get_delay('GET', response_with(400), 0) is None
+    assert policy.get_delay('GET', response_with(501), 0) is None
+    assert policy.get_delay('GET', response_with(502), 0) is not None
+
+
+def test_get_delay_does_not_retry_non_idempotent_requests_after_server_errors():
+    policy = RetryPolicy()
+    assert policy.get_delay('POST', response_with(500), 0) is None
+    assert policy.get_delay('PATCH', response_with(503), 0) is None
+    assert policy.get_delay('POST', response_with(429), 0) is not None
+
+
+def test_get_delay_honours_retry_after():
+    policy = RetryPolicy(backoff_factor=0.1)
+    assert policy.get_delay('POST', response_with(429, {'Retry-After': '7'}), 0) == 7
+
+    http_date = formatdate(time() + 20, usegmt=True)
+    delay = policy.get_delay('GET', response_with(503, {'Retry-After': http_date}), 0)
+    assert 18 < delay <= 20
+
+
+def test_get_delay_caps_server_delay_at_max_backoff():
+    policy = RetryPolicy(max_backoff=10)
+    assert policy.get_delay('POST', response_with(429, {'Retry-After': '86400'}), 0) == 10
+    assert policy.get_delay('GET', response_with(429, {'X-RateLimit-Reset': str(time() + 3600)}), 0) == 10
+
+
+def test_get_delay_honours_rate_limit_reset():
+    policy = RetryPolicy(backoff_factor=0.1)
+    assert policy.get_delay('GET', response_with(429, {'X-RateLimit-Reset': '3'}), 0) == 3
+
+    delay = policy.get_delay('GET', response_with(429, {'X-RateLimit-Reset': str(time() + 10)}), 0)
+    assert 8 < delay <= 10
+
+
+@responses.activate
+def test_client_retries_throttled_requests(dummy_data):
+    responses.add(responses.POST, 'https://rest.nexmo.com/sms/json', status=429)
+    stub(responses.POST, 'https://rest.nexmo.com/sms/json')
+    retries = []
+    policy = RetryPolicy(on_retry=lambda *args: retries.append(args))
+    client = Client(key=dummy_data.api_key, secret=dummy_data.api_secret, retry_policy=policy)
+
+    with patch('time.sleep') as mock_sleep:
+        response = client.sms.send_message({'from': 'Python', 'to': '447525856424', 'text': 'Hi'})
+
+    assert response == {'key': 'value'}
+    assert len(responses.calls) == 2
+    assert mock_sleep.call_count == 1
+    assert policy.stats == {'retries': 1, 'retries_by_status_code': {429: 1}}
+    method, uri, retried_response, retry_number, delay = retries[0]
+    assert (method, uri, retried_response.status_code, retry_number) == (
+        'POST',
+        'https://rest.nexmo.com/sms/json',
+        429,
+        1,
+    )
+
+
+@responses.activate
+def test_client_raises_error_when_retries_run_out(dummy_data):
+    responses.add(responses.GET, 'https://rest.nexmo.com/account/get-balance', status=503)
+    client = Client(
+        key=dummy_data.api_key,
+        secret=dummy_data.api_secret,
+        retry_policy=RetryPolicy(max_retries=2),
+    )
+
+    with patch('time.sleep'), raises(ServerError):
+        client.account.get_balance()
+    assert len(responses.calls) == 3
+
+
+@responses.activate
+def test_client_does_not_retry_by_default(client):
+    responses.add(responses.GET, 'https://rest.nexmo.com/account/get-balance', status=429)
+
+    with raises(ClientError):
+        client.account.get_balance()
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_client_uses_retry_policy_for_route(dummy_data):
+    responses.add(responses.GET, 'https://rest.nexmo.com/account/get-balance', status=503)
+    responses.add(responses.POST, 'https://rest.nexmo.com/sms/json', status=429)
+    client = Client(
+        key=dummy_data.api_key, secret=dummy_data.api_secret, retry_policy=RetryPolicy()
+    )
+    client.retry_policies['/sms'] = RetryPolicy(max_retries=1)
+    client.retry_policies['rest.nexmo.com/account'] = None
+
+    with patch('time.sleep'):
+        with raises(ClientError):
+            client.sms.send_message({'from': 'Python', 'to': '447525856424', 'text': 'Hi'})
+        with raises(ServerError):
+            client.account.get_balance()
+
+    assert len(responses.calls) == 3
+
+
+def test_match_route_uses_longest_matching_prefix():
+    routes = {'/v1': 'v1', '/v1/calls': 'calls', 'rest.nexmo.com': 'rest'}
+
+    assert match_route(routes, 'https://api.nexmo.com/v1/calls/abc') == 'calls'
+    assert match_route(routes, 'https://api.nexmo.com/v1/users') == 'v1'
+    assert match_route(routes, 'https://rest.nexmo.com/sms/json') == 'rest'
+    assert match_route(routes, 'https://api.nexmo.com/v2/verify', default='none') == 'none'
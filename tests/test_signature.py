@@ -84,3 +84,43 @@ def test_signature_sha512(dummy_data):
         client.signature(params)
         == "812a18f76680fa0fe1b8bd9ee1625466ceb1bd96242e4d050d2cfd9a7b40166c63ed26ec9702168781b6edcf1633db8ff95af9341701004eec3fcf9550572ee8"
     )
+
+
+def test_check_signatures(dummy_data):
+    client = vonage.Client(
+        key=dummy_data.api_key,
+        secret=dummy_data.api_secret,
+        signature_secret=dummy_data.signature_secret,
+        signature_method="sha1",
+    )
+    params = {"a": "1", "b": "2", "timestamp": "1461605396"}
+    valid = dict(params, sig="3E19A4E6880FDC2C1426BFD0587C98B9532F0210")
+    invalid = dict(params, sig="0" * 40)
+    unsigned = dict(params)
+
+    assert client.check_signatures([valid, invalid, unsigned, valid]) == [True, False, False, True]
+    assert "sig" in valid
+
+
+def test_signature_escapes_values(dummy_data):
+    client = vonage.Client(
+        key=dummy_data.api_key,
+        secret=dummy_data.api_secret,
+        signature_secret=dummy_data.signature_secret,
+        signature_method="sha256",
+    )
+    params = {"text": "a&b=c", "count": 2, "timestamp": "1461605396"}
+    escaped = {"text": "a_b_c", "count": "2", "timestamp": "1461605396"}
+
+    assert client.signature(params) == client.signature(escaped)
+
+
+def test_signature_uses_updated_secret(dummy_data):
+    params = {"a": "1", "b": "2", "timestamp": "1461605396"}
+    client = vonage.Client(
+        key=dummy_data.api_key, secret=dummy_data.api_secret, signature_secret="other secret"
+    )
+    client.signature(params)
+
+    client.signature_secret = "secret"
+    assert client.signature(params) == "6af838ef94998832dbfc29020b564830"
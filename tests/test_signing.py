@@ -0,0 +1,74 @@
+from vonage import Client, KeySigner, ProcessPoolSigner
+
+import asyncio
+import jwt
+import os
+from time import time
+
+
+def decode(token, dummy_data):
+    return jwt.decode(token, dummy_data.public_key, algorithms='RS256')
+
+
+def test_key_signer_signs_with_default_claims(dummy_data):
+    signer = KeySigner(dummy_data.application_id, dummy_data.private_key)
+    claims = {'sub': 'alice'}
+
+    token = signer.sign(claims)
+
+    decoded = decode(token, dummy_data)
+    assert decoded['application_id'] == dummy_data.application_id
+    assert decoded['sub'] == 'alice'
+    assert decoded['exp'] == decoded['iat'] + 15 * 60
+    assert claims['jti'] == decoded['jti']
+    assert jwt.get_unverified_header(token) == {'alg': 'RS256', 'typ': 'JWT'}
+
+
+def test_key_signer_reads_private_key_from_path(dummy_data):
+    path = os.path.join(os.path.dirname(__file__), 'data/private_key.txt')
+
+    for private_key in (path, path.encode(), dummy_data.private_key.encode()):
+        token = KeySigner(dummy_data.application_id, private_key).sign({})
+        assert decode(token, dummy_data)['application_id'] == dummy_data.application_id
+
+
+def test_key_signer_keeps_claims_that_are_set(dummy_data):
+    signer = KeySigner(dummy_data.application_id, dummy_data.private_key)
+    now = int(time())
+
+    decoded = decode(signer.sign({'jti': 'my-jti', 'iat': now, 'exp': now + 60}), dummy_data)
+
+    assert decoded['jti'] == 'my-jti'
+    assert decoded['exp'] == now + 60
+
+
+def test_process_pool_signer(dummy_data):
+    with ProcessPoolSigner(dummy_data.application_id, dummy_data.private_key, max_workers=2) as signer:
+        claims = {'sub': 'alice'}
+        future = signer.submit(claims)
+        tokens = signer.sign_many([{'sub': str(i)} for i in range(10)])
+        async_token = asyncio.run(signer.sign_async({'sub': 'bob'}))
+
+        assert signer.max_workers == 2
+        assert 'exp' in claims
+        assert decode(future.result(), dummy_data)['jti'] == claims['jti']
+        assert [decode(token, dummy_data)['sub'] for token in tokens] == [str(i) for i in range(10)]
+        assert decode(async_token, dummy_data)['sub'] == 'bob'
+
+
+def test_process_pool_signer_defaults_to_a_worker_per_cpu(dummy_data):
+    with ProcessPoolSigner(dummy_data.application_id, dummy_data.private_key) as signer:
+        assert signer.max_workers == (os.cpu_count() or 1)
+
+
+def test_client_signs_jwts_with_jwt_signer(dummy_data):
+    signer = KeySigner(dummy_data.application_id, dummy_data.private_key)
+    client = Client(jwt_signer=signer)
+
+    first_jwt = client._generate_application_jwt()
+    second_jwt = client._generate_application_jwt()
+
+    assert first_jwt == second_jwt
+    assert decode(first_jwt, dummy_data)['application_id'] == dummy_data.application_id
+    assert client.jwt_cache.stats['tokens_signed'] == 1
+    assert client._jwt_claims == {}
@@ -1,6 +1,8 @@
 import vonage
 from util import *
 
+from unittest.mock import patch
+
 
 @responses.activate
 def test_send_message(sms, dummy_data):
@@ -48,3 +50,67 @@ def test_submit_sms_conversion(sms):
     sms.submit_sms_conversion("a-message-id")
     assert "message-id=a-message-id" in request_body()
     assert "timestamp" in request_body()
+
+
+@responses.activate
+def test_send_messages(sms):
+    stub(responses.POST, "https://rest.nexmo.com/sms/json")
+    messages = [{"from": "Python", "to": f"4475258564{i:02}", "text": "Hey!"} for i in range(20)]
+
+    results = dict(sms.send_messages(iter(messages), max_workers=4))
+
+    assert sorted(results) == list(range(20))
+    assert all(result == {"key": "value"} for result in results.values())
+    assert len(responses.calls) == 20
+    assert "api_key" not in messages[0]
+
+
+@responses.activate
+def test_send_messages_yields_errors(sms):
+    def callback(request):
+        if "to=bad" in request.body:
+            return (400, {}, "")
+        return (200, {}, '{"key":"value"}')
+
+    responses.add_callback(
+        responses.POST,
+        "https://rest.nexmo.com/sms/json",
+        callback=callback,
+        content_type="application/json",
+    )
+
+    results = dict(sms.send_messages([{"to": "447525856424"}, {"to": "bad"}]))
+
+    assert results[0] == {"key": "value"}
+    assert isinstance(results[1], vonage.ClientError)
+
+
+@responses.activate
+def test_send_messages_throttles_each_sender(sms):
+    stub(responses.POST, "https://rest.nexmo.com/sms/json")
+    messages = [{"from": sender, "to": "447525856424"} for sender in ("A", "A", "A", "B")]
+
+    with patch("vonage.sms.sleep") as mock_sleep:
+        results = list(sms.send_messages(messages, max_workers=1, messages_per_second=1))
+
+    assert len(results) == 4
+    # The first message from each sender is sent straight away, then "A" is paced at 1 per second
+    assert mock_sleep.call_count == 2
+    assert mock_sleep.call_args_list[1][0][0] > mock_sleep.call_args_list[0][0][0]
+
+
+@responses.activate
+def test_send_messages_is_lazy(sms):
+    stub(responses.POST, "https://rest.nexmo.com/sms/json")
+    consumed = []
+
+    def messages():
+        for i in range(1000):
+            consumed.append(i)
+            yield {"from": "Python", "to": "447525856424", "text": str(i)}
+
+    results = sms.send_messages(messages(), max_workers=2)
+    next(results)
+    results.close()
+
+    assert len(consumed) < 10
@@ -0,0 +1,135 @@
+from vonage import AsyncClient, Client, ClientError, Http2Transport, RequestsTransport
+from util import *
+
+import httpx
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+
+def http2_client(dummy_data, handler):
+    transport = Http2Transport()
+    transport.session = httpx.Client(transport=httpx.MockTransport(handler))
+    client = Client(key=dummy_data.api_key, secret=dummy_data.api_secret, transport=transport)
+    return client, transport
+
+
+def test_client_uses_requests_transport_by_default(client):
+    assert isinstance(client.transport, RequestsTransport)
+    assert client.transport.session is client.session
+
+
+@responses.activate
+def test_requests_transport_sends_request(client, dummy_data):
+    stub(responses.GET, 'https://rest.nexmo.com/account/get-balance')
+
+    assert isinstance(client.account.get_balance(), dict)
+    assert request_user_agent().startswith('vonage-python/')
+
+
+def test_client_sends_requests_with_custom_transport(dummy_data):
+    class RecordingTransport:
+        def __init__(self):
+            self.requests = []
+
+        def request(self, method, url, timeout=None, **kwargs):
+            self.requests.append((method, url, timeout))
+            return httpx.Response(200, json={'value': 10.0})
+
+    transport = RecordingTransport()
+    client = Client(key=dummy_data.api_key, secret=dummy_data.api_secret, timeout=5, transport=transport)
+
+    assert client.account.get_balance() == {'value': 10.0}
+    assert transport.requests == [('GET', 'https://rest.nexmo.com/account/get-balance', 5)]
+
+
+def test_http2_transport_get(dummy_data):
+    requests = []
+    client, _ = http2_client(dummy_data, recording_handler(requests, body={'value': 10.0}))
+
+    assert client.account.get_balance() == {'value': 10.0}
+    assert requests[0].method == 'GET'
+    assert requests[0].url.host == 'rest.nexmo.com'
+    assert requests[0].url.params['api_key'] == dummy_data.api_key
+    assert requests[0].headers['user-agent'].startswith('vonage-python/')
+
+
+def test_http2_transport_sends_form_and_json_bodies(dummy_data):
+    requests = []
+    client, _ = http2_client(dummy_data, recording_handler(requests, body={'messages': []}))
+
+    client.sms.send_message({'from': 'Python', 'to': '447525856424', 'text': 'Hey!', 'type': None})
+    client.post(client.api_host(), '/v1/test', {'key': 'value'}, auth_type='header')
+
+    form = parse_qs(requests[0].content.decode())
+    assert form['text'] == ['Hey!']
+    assert 'type' not in form
+    assert json.loads(requests[1].content) == {'key': 'value'}
+    assert requests[1].headers['authorization'].startswith('Basic ')
+
+
+def test_http2_transport_errors_are_parsed(dummy_data):
+    body = {'type': 'https://developer.vonage.com', 'title': 'Bad Request', 'detail': 'Invalid number'}
+    client, _ = http2_client(dummy_data, recording_handler([], status_code=400, body=body))
+
+    with pytest.raises(ClientError) as err:
+        client.account.get_balance()
+    assert str(err.value) == 'Bad Request: Invalid number (https://developer.vonage.com)'
+
+
+def test_http2_transport_converts_timeouts(dummy_data):
+    timeouts = []
+
+    def handler(request: httpx.Request):
+        timeouts.append(request.extensions['timeout'])
+        return httpx.Response(200, json={})
+
+    client, _ = http2_client(dummy_data, handler)
+    client.timeout = (2, 10)
+    client.account.get_balance()
+
+    assert timeouts[0]['connect'] == 2
+    assert timeouts[0]['read'] == 10
+
+
+def test_http2_transport_is_shared_by_threads(dummy_data):
+    requests = []
+    client, transport = http2_client(dummy_data, recording_handler(requests, body={'value': 10.0}))
+
+    with transport, ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: client.account.get_balance(), range(32)))
+
+    assert results == [{'value': 10.0}] * 32
+    assert len(requests) == 32
+    assert transport.session.is_closed
+
+
+def test_http2_transport_negotiates_http2():
+    with Http2Transport(max_connections=4) as transport:
+        assert transport.adapter._pool._http2 is True
+        assert transport.adapter._pool._max_connections == 4
+
+
+def test_async_client_http2(dummy_data):
+    client = AsyncClient(key=dummy_data.api_key, secret=dummy_data.api_secret, http2=True)
+
+    assert client.adapter._pool._http2 is True
+
+
+def test_async_client_rejects_transport(dummy_data):
+    with pytest.raises(TypeError):
+        AsyncClient(key=dummy_data.api_key, secret=dummy_data.api_secret, transport=Http2Transport())
+
+
+@responses.activate
+def test_transports_encode_params_the_same_way(dummy_data):
+    params = {'flag': True, 'other_flag': False, 'count': 2, 'missing': None}
+    stub(responses.GET, 'https://api.nexmo.com/v1/test')
+    requests_client = Client(key=dummy_data.api_key, secret=dummy_data.api_secret)
+    requests_client.get(requests_client.api_host(), '/v1/test', dict(params), auth_type='header')
+
+    requests = []
+    http2, _ = http2_client(dummy_data, recording_handler(requests))
+    http2.get(http2.api_host(), '/v1/test', dict(params), auth_type='header')
+
+    assert responses.calls[0].request.url.split('?')[1] == 'flag=True&other_flag=False&count=2'
+    assert requests[0].url.query.decode() == 'flag=True&other_flag=False&count=2'
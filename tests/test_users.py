@@ -3,6 +3,7 @@ from util import *
 from vonage.errors import UsersError, ClientError, ServerError
 
 from pytest import raises
+import json
 import responses
 
 client = Client()
@@ -367,3 +368,32 @@ def test_delete_user_429():
     with raises(ClientError) as err:
         users.delete_user(user_id)
     assert 'You have exceeded your request limit. You can try again shortly.' in str(err.value)
+
+
+@responses.activate
+def test_iter_users_follows_next_links():
+    def list_users(request):
+        cursor = parse_qs(urlparse(request.url).query).get('cursor', ['page1'])[0]
+        body = {'page_size': 2, '_embedded': {'users': [{'name': f'{cursor}-{i}'} for i in range(2)]}}
+        if cursor == 'page1':
+            body['_links'] = {'next': {'href': f'https://{host}/v1/users?page_size=2&cursor=page2'}}
+        return 200, {}, json.dumps(body)
+
+    responses.add_callback(
+        responses.GET, f'https://{host}/v1/users', callback=list_users, content_type='application/json'
+    )
+
+    names = [user['name'] for user in users.iter_users(page_size=2)]
+
+    assert names == ['page1-0', 'page1-1', 'page2-0', 'page2-1']
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_iter_users_fetches_pages_lazily():
+    stub(responses.GET, f'https://{host}/v1/users', fixture_path='users/list_users_basic.json')
+
+    first_user = next(users.iter_users())
+
+    assert first_user['name'] == 'NAM-6dd4ea1f-3841-47cb-a3d3-e271f5c1e33c'
+    assert len(responses.calls) == 1
@@ -117,6 +117,58 @@ def test_new_request_sms_custom_code_character_error():
     assert 'string does not match regex' in str(err.value)
 
 
+def test_new_request_invalid_recipient_type_error():
+    params = {'brand': 'ACME, Inc', 'workflow': [{'channel': 'sms', 'to': 447700900000}]}
+
+    with raises(ValidationError) as err:
+        verify2.new_request(params)
+    assert 'workflow' in str(err.value)
+
+
+@responses.activate
+def test_new_request_does_not_change_params():
+    stub(
+        responses.POST,
+        'https://api.nexmo.com/v2/verify',
+        fixture_path='verify2/create_request.json',
+        status_code=202,
+    )
+    workflow = [{'channel': 'whatsapp', 'to': '447700900000', 'from': '447700900001'}]
+    params = {'brand': 'ACME, Inc', 'code_length': 6, 'workflow': workflow}
+
+    verify2.new_request(params)
+
+    assert params == {'brand': 'ACME, Inc', 'code_length': 6, 'workflow': workflow}
+    assert workflow == [{'channel': 'whatsapp', 'to': '447700900000', 'from': '447700900001'}]
+
+
+@responses.activate
+def test_new_requests():
+    def callback(request):
+        if b'447700900009' in request.body:
+            return (429, {}, '{"title": "Rate Limit Hit"}')
+        return (202, {}, '{"request_id": "c11236f4-00bf-4b89-84ba-88b25df97315"}')
+
+    responses.add_callback(
+        responses.POST,
+        'https://api.nexmo.com/v2/verify',
+        callback=callback,
+        content_type='application/json',
+    )
+    requests = [
+        {'brand': 'ACME, Inc', 'workflow': [{'channel': 'sms', 'to': f'44770090000{i}'}]} for i in range(10)
+    ]
+    requests.append({'brand': 'ACME, Inc', 'workflow': [{'channel': 'carrier_pigeon', 'to': '447700900000'}]})
+
+    results = dict(verify2.new_requests(iter(requests), max_workers=4))
+
+    assert sorted(results) == list(range(11))
+    assert all(results[i]['request_id'] == 'c11236f4-00bf-4b89-84ba-88b25df97315' for i in range(9))
+    assert isinstance(results[9], ClientError)
+    assert isinstance(results[10], Verify2Error)
+    assert len(responses.calls) == 10
+
+
 def test_new_request_invalid_channel_error():
     params = {
         'code_length': 4,
@@ -1,5 +1,5 @@
 from util import *
-from vonage import Client
+from vonage import Client, ClientTokenPool
 from vonage.errors import (
     ClientError,
     VideoError,
@@ -8,6 +8,7 @@ from vonage.errors import (
     SipError,
 )
 
+import json
 import jwt
 from time import time
 
@@ -148,6 +149,56 @@ def test_generate_client_token_invalid_expire_time(client: Client):
         client.video.generate_client_token(session_id, {'expireTime': now + 3600 * 24 * 30 + 1})
 
 
+def test_generate_client_token_leaves_client_claims_unchanged(client: Client):
+    client.video.generate_client_token(session_id, {'role': 'moderator'})
+    assert client._jwt_claims == {}
+
+
+def test_client_token_pool_prefill_and_get_token(client: Client, dummy_data):
+    public_key = dummy_data.public_key
+    with ClientTokenPool(client, max_workers=2) as pool:
+        futures = pool.prefill(session_id, 3, {'role': 'moderator'})
+        assert len(futures) == 3
+
+        assert pool.available(session_id, {'role': 'moderator'}) == 3
+        assert pool.available(session_id) == 0
+
+        token = pool.get_token(session_id, {'role': 'moderator'})
+        assert pool.available(session_id, {'role': 'moderator'}) == 2
+        decoded_token = jwt.decode(token, public_key, algorithms='RS256')
+        assert decoded_token['application_id'] == 'nexmo-application-id'
+        assert decoded_token['session_id'] == 'my_session_id'
+        assert decoded_token['role'] == 'moderator'
+
+        token = pool.get_token(session_id)
+        assert jwt.decode(token, public_key, algorithms='RS256')['role'] == 'publisher'
+
+
+def test_client_token_pool_skips_tokens_about_to_expire(client: Client):
+    with ClientTokenPool(client, max_workers=1, min_validity=3600) as pool:
+        pool.prefill(session_id, 2)
+
+        assert pool.available(session_id) == 2
+        pool.get_token(session_id)
+        assert pool.available(session_id) == 0
+
+
+def test_client_token_pool_generate_tokens(client: Client, dummy_data):
+    public_key = dummy_data.public_key
+    with ClientTokenPool(client, max_workers=2) as pool:
+        tokens = pool.generate_tokens(session_id, 5, {'data': 'some token data'})
+
+    decoded_tokens = [jwt.decode(token, public_key, algorithms='RS256') for token in tokens]
+    assert len({decoded_token['jti'] for decoded_token in decoded_tokens}) == 5
+    assert all(decoded_token['data'] == 'some token data' for decoded_token in decoded_tokens)
+
+
+def test_client_token_pool_invalid_options(client: Client):
+    with ClientTokenPool(client, max_workers=1) as pool:
+        with pytest.raises(InvalidRoleError):
+            pool.get_token(session_id, {'role': 'observer'})
+
+
 @responses.activate
 def test_get_stream(client: Client):
     stub(
@@ -676,3 +727,24 @@ def test_remove_stream_from_broadcast(client: Client, dummy_data):
         == None
     )
     assert request_user_agent() == dummy_data.user_agent
+
+
+@responses.activate
+def test_iter_broadcasts(client):
+    def list_broadcasts(request):
+        query = parse_qs(urlparse(request.url).query)
+        offset, count = int(query['offset'][0]), int(query['count'][0])
+        items = [{'id': str(i)} for i in range(offset, min(offset + count, 3))]
+        return 200, {}, json.dumps({'count': 3, 'items': items})
+
+    responses.add_callback(
+        responses.GET,
+        f'https://video.api.vonage.com/v2/project/{client.application_id}/broadcast',
+        callback=list_broadcasts,
+        content_type='application/json',
+    )
+
+    broadcasts = list(client.video.iter_broadcasts(count=2))
+
+    assert [broadcast['id'] for broadcast in broadcasts] == ['0', '1', '2']
+    assert len(responses.calls) == 2
@@ -1,11 +1,17 @@
 import os.path
+import io
+import json
 import time
 import jwt
+import requests
 from unittest.mock import patch
 
 from vonage import Client, Voice, Ncco
+from vonage.errors import ClientError
 from util import *
 
+from pytest import raises
+
 
 @responses.activate
 def test_create_call(voice, dummy_data):
@@ -213,6 +219,188 @@ def test_get_recording(voice, dummy_data):
     assert request_user_agent() == dummy_data.user_agent
 
 
+RECORDING_URL = "https://api.nexmo.com/v1/files/d6e47a2e-3414-11e8-8c2c-2f8b643ed957"
+
+
+def recording_callback(body, requests_seen=None):
+    def callback(request):
+        if requests_seen is not None:
+            requests_seen.append(request)
+        range_header = request.headers.get("Range")
+        if range_header is None:
+            return 200, {}, body
+        start = int(range_header[len("bytes=") : -1])
+        if start >= len(body):
+            return 416, {}, b""
+        return 206, {"Content-Range": f"bytes {start}-{len(body) - 1}/{len(body)}"}, body[start:]
+
+    return callback
+
+
+class InterruptedResponse:
+    """A streamed response whose connection drops after its first chunk."""
+
+    status_code = 200
+
+    def __init__(self, chunk):
+        self.chunk = chunk
+
+    def iter_content(self, chunk_size):
+        yield self.chunk
+        raise requests.exceptions.ChunkedEncodingError("Connection broken")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+@responses.activate
+def test_iter_recording(voice):
+    responses.add_callback(responses.GET, RECORDING_URL, callback=recording_callback(b"THISISANMP3"))
+
+    assert list(voice.iter_recording(RECORDING_URL, chunk_size=4)) == [b"THIS", b"ISAN", b"MP3"]
+    assert b"".join(voice.iter_recording(RECORDING_URL, start=6)) == b"ANMP3"
+    assert responses.calls[1].request.headers["Range"] == "bytes=6-"
+
+
+@responses.activate
+def test_download_recording_to_path(voice, tmp_path):
+    responses.add_callback(responses.GET, RECORDING_URL, callback=recording_callback(b"THISISANMP3"))
+    dest = tmp_path / "recording.mp3"
+
+    assert voice.download_recording(RECORDING_URL, str(dest), chunk_size=4) == 11
+    assert dest.read_bytes() == b"THISISANMP3"
+    assert responses.calls[0].request.headers["Authorization"].startswith(b"Bearer ")
+
+
+@responses.activate
+def test_download_recording_resumes_partial_file(voice, tmp_path):
+    requests_seen = []
+    responses.add_callback(
+        responses.GET, RECORDING_URL, callback=recording_callback(b"THISISANMP3", requests_seen)
+    )
+    dest = tmp_path / "recording.mp3"
+    dest.write_bytes(b"THISIS")
+
+    assert voice.download_recording(RECORDING_URL, str(dest), resume=True) == 11
+    assert dest.read_bytes() == b"THISISANMP3"
+    assert requests_seen[0].headers["Range"] == "bytes=6-"
+
+    # Nothing is left to download, so the server responds with a 416
+    assert voice.download_recording(RECORDING_URL, str(dest), resume=True) == 11
+    assert dest.read_bytes() == b"THISISANMP3"
+
+
+@responses.activate
+def test_download_recording_restarts_if_range_is_ignored(voice, tmp_path):
+    stub_bytes(responses.GET, RECORDING_URL, b"THISISANMP3")
+    dest = tmp_path / "recording.mp3"
+    dest.write_bytes(b"THIS")
+
+    assert voice.download_recording(RECORDING_URL, str(dest), resume=True) == 11
+    assert dest.read_bytes() == b"THISISANMP3"
+
+
+@responses.activate
+def test_download_recording_overwrites_existing_file_by_default(voice, tmp_path):
+    requests_seen = []
+    responses.add_callback(
+        responses.GET, RECORDING_URL, callback=recording_callback(b"THISISANMP3", requests_seen)
+    )
+    dest = tmp_path / "recording.mp3"
+    dest.write_bytes(b"AN UNRELATED FILE")
+
+    assert voice.download_recording(RECORDING_URL, str(dest)) == 11
+    assert dest.read_bytes() == b"THISISANMP3"
+    assert "Range" not in requests_seen[0].headers
+
+
+@responses.activate
+def test_failed_download_recording_leaves_existing_file_untouched(voice, tmp_path):
+    stub(responses.GET, RECORDING_URL, status_code=404)
+    dest = tmp_path / "recording.mp3"
+    dest.write_bytes(b"AN UNRELATED FILE")
+
+    with raises(ClientError):
+        voice.download_recording(RECORDING_URL, str(dest))
+
+    assert dest.read_bytes() == b"AN UNRELATED FILE"
+    assert os.listdir(tmp_path) == ["recording.mp3"]
+
+
+@responses.activate
+def test_download_recording_resumes_after_connection_drops(voice):
+    get = voice._client.session.get
+    responses.add_callback(responses.GET, RECORDING_URL, callback=recording_callback(b"THISISANMP3"))
+    dest = io.BytesIO()
+
+    interrupted = [InterruptedResponse(b"THIS")]
+
+    def get_recording(*args, **kwargs):
+        return interrupted.pop() if interrupted else get(*args, **kwargs)
+
+    with patch.object(voice._client.session, "get", side_effect=get_recording):
+        assert voice.download_recording(RECORDING_URL, dest) == 11
+
+    assert dest.getvalue() == b"THISISANMP3"
+    assert responses.calls[0].request.headers["Range"] == "bytes=4-"
+
+
+class UploadStream(io.RawIOBase):
+    """A writable stream that can't seek, like an object store's upload stream."""
+
+    def __init__(self):
+        self.data = b""
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.data += data
+        return len(data)
+
+
+@responses.activate
+def test_download_recording_to_unseekable_stream_fails_if_range_is_ignored(voice):
+    get = voice._client.session.get
+    stub_bytes(responses.GET, RECORDING_URL, b"THISISANMP3")
+    interrupted = [InterruptedResponse(b"THIS")]
+
+    def get_recording(*args, **kwargs):
+        return interrupted.pop() if interrupted else get(*args, **kwargs)
+
+    with patch.object(voice._client.session, "get", side_effect=get_recording):
+        with raises(ClientError) as err:
+            voice.download_recording(RECORDING_URL, UploadStream())
+    assert "not seekable" in str(err.value)
+
+
+@responses.activate
+def test_download_recording_gives_up_after_max_resumes(voice):
+    with patch.object(voice._client.session, "get", return_value=InterruptedResponse(b"THIS")):
+        with raises(requests.exceptions.ChunkedEncodingError):
+            voice.download_recording(RECORDING_URL, io.BytesIO(), max_resumes=2)
+
+
+@responses.activate
+def test_download_recordings(voice, tmp_path):
+    responses.add_callback(responses.GET, RECORDING_URL, callback=recording_callback(b"THISISANMP3"))
+    stub(responses.GET, "https://api.nexmo.com/v1/files/missing", status_code=404)
+    downloads = [
+        (RECORDING_URL, str(tmp_path / "1.mp3")),
+        ("https://api.nexmo.com/v1/files/missing", str(tmp_path / "2.mp3")),
+        (RECORDING_URL, str(tmp_path / "3.mp3")),
+    ]
+
+    results = dict(voice.download_recordings(downloads, max_workers=2))
+
+    assert results[0] == 11 and results[2] == 11
+    assert isinstance(results[1], ClientError)
+    assert (tmp_path / "3.mp3").read_bytes() == b"THISISANMP3"
+
+
 def test_verify_jwt_signature(voice: Voice):
     with patch('vonage.Voice.verify_signature') as mocked_verify_signature:
         mocked_verify_signature.return_value = True
@@ -223,3 +411,34 @@ def test_verify_jwt_invalid_signature(voice: Voice):
     with patch('vonage.Voice.verify_signature') as mocked_verify_signature:
         mocked_verify_signature.return_value = False
         assert voice.verify_signature('token', 'invalid_signature') is False
+
+
+@responses.activate
+def test_iter_calls(voice):
+    def list_calls(request):
+        record_index = int(parse_qs(urlparse(request.url).query)['record_index'][0])
+        calls = [{'uuid': str(i)} for i in range(record_index, min(record_index + 2, 5))]
+        body = {'count': 5, 'record_index': record_index, '_embedded': {'calls': calls}}
+        return 200, {}, json.dumps(body)
+
+    responses.add_callback(
+        responses.GET,
+        'https://api.nexmo.com/v1/calls',
+        callback=list_calls,
+        content_type='application/json',
+    )
+
+    calls = list(voice.iter_calls(page_size=2, prefetch=True))
+
+    assert [call['uuid'] for call in calls] == ['0', '1', '2', '3', '4']
+    assert len(responses.calls) == 3
+    assert request_params()['page_size'] == ['2']
+
+
+def test_verify_signatures(voice: Voice):
+    secret = "qwertyuiopasdfghjklzxcvbnm123456"
+    token = jwt.encode({"iat": int(time.time())}, secret, algorithm="HS256")
+
+    assert voice.verify_signatures([token, token], secret) == [True, True]
+    assert voice.verify_signatures([token], "a different secret of 32 bytes!!") == [False]
+    assert voice._get_jwt_verifier(secret).stats["hits"] == 1
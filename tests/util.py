@@ -1,3 +1,4 @@
+import json
 import os.path
 import re
 
@@ -5,6 +6,7 @@ import pytest
 
 from urllib.parse import urlparse, parse_qs
 
+import httpx
 import responses
 
 
@@ -46,6 +48,17 @@ def stub_bytes(method, url, body):
     responses.add(method, url, body, status=200)
 
 
+def recording_handler(requests, status_code=200, body=None, content_type="application/json"):
+    """Returns an httpx.MockTransport handler that appends each request to `requests` and responds with `body`."""
+
+    def handler(request: httpx.Request):
+        requests.append(request)
+        content = json.dumps(body if body is not None else {"key": "value"}).encode()
+        return httpx.Response(status_code, content=content, headers={"content-type": content_type})
+
+    return handler
+
+
 def assert_re(pattern, string):
     __tracebackhide__ = True
     if not re.search(pattern, string):